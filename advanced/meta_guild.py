@@ -515,7 +515,7 @@ class MetaGuild:
 
             try:
                 # Submit task to the guild's task director
-                guild_task_id = await guild.guild_core.task_director.create_task(
+                guild_task_id = await guild.guild_core.tasks.create_task(
                     title=guild_task_title,
                     description=guild_task_description,
                     capabilities_required=guild.specialization,
@@ -493,6 +493,16 @@ class ParallelInferenceAgent:
                 if task_id and "inference" in data.get("title", "").lower():
                     # This might be a task that could benefit from parallel inference
                     await self._suggest_parallel_inference(task_id, data)
+            elif event_type == "task.batch_claimed":
+                # One event for a bulk claim; look at each claimed task
+                titles = data.get("titles") or {}
+                for task_id in data.get("task_ids") or []:
+                    title = titles.get(task_id, "")
+                    if "inference" in title.lower():
+                        await self._suggest_parallel_inference(
+                            task_id,
+                            {"task_id": task_id, "agent_id": data.get("agent_id"), "title": title},
+                        )
 
         except Exception as e:
             logger.error(f"Failed to handle task event: {e}")
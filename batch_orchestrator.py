@@ -284,6 +284,19 @@ class BatchOrchestrator:
             MessagePriority.LOW,
         )
 
+    async def add_tasks_to_pending(self, task_ids: List[str]) -> None:
+        """Add many tasks to the pending batch queue with one event"""
+        if not task_ids:
+            return
+        self._pending_tasks.update(task_ids)
+
+        await self.guild_core.communication_hub.emit_event(
+            "batch.tasks_pending",
+            {"task_ids": task_ids, "pending_count": len(self._pending_tasks)},
+            CommunicationChannel.BATCH_PROCESSING,
+            MessagePriority.LOW,
+        )
+
     async def check_auto_batch(self) -> None:
         """Check if auto-batching should be triggered"""
         try:
@@ -356,11 +369,11 @@ class BatchOrchestrator:
     async def _get_task_info(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Get task information from task director"""
         try:
-            # This would integrate with the task director
-            if hasattr(self.guild_core, "task_director"):
-                task = self.guild_core.task_director._tasks.get(task_id)
+            # Goes through the router in sharded mode
+            if hasattr(self.guild_core, "tasks"):
+                task = await self.guild_core.tasks.get_task(task_id)
                 if task:
-                    return task.to_dict()
+                    return task.to_dict(include_history=False)
             return None
         except Exception as e:
             logger.error(f"Failed to get task info for {task_id}: {e}")
@@ -731,6 +744,8 @@ class BatchOrchestrator:
                 task_id = data.get("task_id")
                 if task_id:
                     await self.add_task_to_pending(task_id)
+            elif event_type == "task.batch_created":
+                await self.add_tasks_to_pending(data.get("task_ids") or [])
             elif event_type == "batch.priority_changed":
                 await self._handle_priority_change(data)
             # Add more event handlers as needed
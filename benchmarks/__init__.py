@@ -0,0 +1,6 @@
+"""
+Guild benchmarks - standalone performance harnesses.
+
+Each module is runnable with ``python -m guild.benchmarks.<name>`` and prints
+its results as JSON so runs can be compared between releases.
+"""
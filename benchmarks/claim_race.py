@@ -0,0 +1,140 @@
+"""
+Claim race benchmark - concurrent claimers against a small task pool.
+
+Starts N coroutines that all call ``claim_task`` at once against M queued
+tasks. Capability lookups and approval requests are stubbed to suspend for
+a random moment, so claimers interleave at every await in the claim path;
+a share of the tasks carry an execute gate, which adds an approval request
+between selection and commit. Verifies that every task is handed out
+exactly once and reports claim throughput and lost races.
+
+    python -m guild.benchmarks.claim_race --claimers 1000 --tasks 100
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict
+
+from ..core import GuildConfig
+from ..task_director import TaskDirector
+
+
+class _StubHub:
+    async def emit_event(self, *args, **kwargs):
+        return None
+
+    def subscribe(self, *args, **kwargs):
+        return None
+
+
+class _StubCoordinator:
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+
+    async def get_agent_capabilities(self, agent_id: str):
+        await asyncio.sleep(self.rng.random() * 0.001)
+        return ["python"]
+
+
+class _StubApprovals:
+    """Approval store whose requests suspend like a network round trip"""
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+        self.requests = 0
+
+    def get_for_task(self, task_id: str, gate: str):
+        return None
+
+    async def request(self, task_id, gate, requested_by, targets, metadata):
+        self.requests += 1
+        await asyncio.sleep(self.rng.random() * 0.002)
+        return SimpleNamespace(
+            status="pending", approval_id=f"{task_id}-{gate}", targets=targets
+        )
+
+
+async def _run(claimers: int, tasks: int, gated_share: float, seed: int) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    workdir = Path(tempfile.mkdtemp(prefix="guild-claim-race-"))
+    config = GuildConfig(
+        task_board_path=str(workdir / "ACTIVE_TASKS.md"),
+        artifact_dir=str(workdir / "artifacts"),
+    )
+    core = SimpleNamespace(
+        config=config,
+        hub=SimpleNamespace(approvals=_StubApprovals(rng)),
+        communication_hub=_StubHub(),
+        agent_coordinator=_StubCoordinator(rng),
+    )
+    director = TaskDirector(config, core)
+
+    specs = []
+    for i in range(tasks):
+        metadata = {"execution_gate": True} if rng.random() < gated_share else {}
+        specs.append(
+            {
+                "title": f"Race task {i}",
+                "description": "",
+                "capabilities_required": ["python"],
+                "metadata": metadata,
+            }
+        )
+    task_ids = await director.create_tasks(specs)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(director.claim_task(f"agent-{i}") for i in range(claimers))
+    )
+    elapsed = time.perf_counter() - start
+
+    handed_out = Counter(result["id"] for result in results if result)
+    duplicates = {task_id: n for task_id, n in handed_out.items() if n > 1}
+    unclaimed = [task_id for task_id in task_ids if task_id not in handed_out]
+    # Each task's stored assignee must be the one claimer that got it
+    winners = {result["id"]: result["assignee"] for result in results if result}
+    mismatched = [
+        task_id
+        for task_id, agent_id in winners.items()
+        if director._tasks[task_id].assignee != agent_id
+    ]
+    health = await director.get_health()
+
+    return {
+        "claimers": claimers,
+        "tasks": tasks,
+        "execute_gated": sum(1 for spec in specs if spec["metadata"]),
+        "claims": sum(handed_out.values()),
+        "duplicates": len(duplicates),
+        "unclaimed": len(unclaimed),
+        "assignee_mismatches": len(mismatched),
+        "claim_conflicts": health["claim_conflicts"],
+        "approval_requests": core.hub.approvals.requests,
+        "elapsed_s": round(elapsed, 4),
+        "claims_per_s": round(claimers / elapsed, 1),
+        "exactly_once": not duplicates and not unclaimed and not mismatched,
+    }
+
+
+def main(claimers: int, tasks: int, gated_share: float, seed: int) -> Dict[str, Any]:
+    return asyncio.run(_run(claimers, tasks, gated_share, seed))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--claimers", type=int, default=1000)
+    parser.add_argument("--tasks", type=int, default=100)
+    parser.add_argument("--gated-share", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+    result = main(args.claimers, args.tasks, args.gated_share, args.seed)
+    print(json.dumps(result, indent=2))
+    sys.exit(0 if result["exactly_once"] else 1)
@@ -0,0 +1,169 @@
+"""
+Database sync benchmark - per-task vs bulk upsert against local SQLite.
+
+Populates a TaskDirector, runs an initial full sync, then touches a fraction
+of the tasks and runs an incremental sync. Reports wall time and the number
+of SQL statements each mode issues.
+
+    python -m guild.benchmarks.db_sync --tasks 1000 10000 --changed 0.01
+"""
+
+import argparse
+import asyncio
+import enum
+import json
+import sys
+import tempfile
+import time
+import types
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, Any, List
+
+from sqlalchemy import JSON, Column, DateTime, Enum, String, Text, create_engine, event
+from sqlalchemy.orm import Session, declarative_base
+
+from ..core import GuildConfig
+from ..schema import TaskPriority, TaskStatus
+from ..task_director import Task, TaskDirector
+
+
+def _db_models():
+    """Use the hub's db_models when available, else a local mirror of it"""
+    try:
+        from core import db_models
+
+        return db_models
+    except ImportError:
+        pass
+
+    Base = declarative_base()
+
+    class DbStatus(enum.Enum):
+        QUEUED = "queued"
+        IN_PROGRESS = "in_progress"
+        BLOCKED = "blocked"
+        DONE = "done"
+        FAILED = "failed"
+        PENDING_APPROVAL = "pending_approval"
+
+    class DbPriority(enum.Enum):
+        LOW = "low"
+        MEDIUM = "medium"
+        HIGH = "high"
+        URGENT = "urgent"
+
+    class DbTask(Base):
+        __tablename__ = "tasks"
+
+        id = Column(String, primary_key=True)
+        title = Column(String)
+        description = Column(Text)
+        priority = Column(Enum(DbPriority))
+        status = Column(Enum(DbStatus))
+        assignee = Column(String, nullable=True)
+        dependencies = Column(JSON)
+        tags = Column(JSON)
+        created_at = Column(DateTime(timezone=True))
+        updated_at = Column(DateTime(timezone=True))
+        started_at = Column(DateTime(timezone=True), nullable=True)
+        completed_at = Column(DateTime(timezone=True), nullable=True)
+
+    module = types.ModuleType("core.db_models")
+    module.Base = Base
+    module.Task = DbTask
+    module.TaskStatus = DbStatus
+    module.TaskPriority = DbPriority
+    sys.modules.setdefault("core", types.ModuleType("core"))
+    sys.modules["core.db_models"] = module
+    return module
+
+
+class _SqliteDb:
+    def __init__(self, path: Path):
+        self.engine = create_engine(f"sqlite:///{path}")
+        self.statements = 0
+
+        @event.listens_for(self.engine, "before_cursor_execute")
+        def _count(*_args):
+            self.statements += 1
+
+    @contextmanager
+    def get_session(self):
+        session = Session(self.engine)
+        try:
+            yield session
+            session.commit()
+        finally:
+            session.close()
+
+
+async def _run(task_count: int, changed_ratio: float, bulk: bool) -> Dict[str, Any]:
+    db_models = _db_models()
+    with tempfile.TemporaryDirectory() as tmp:
+        db = _SqliteDb(Path(tmp) / "guild.db")
+        db_models.Base.metadata.create_all(db.engine)
+
+        config = GuildConfig(
+            task_board_path=str(Path(tmp) / "ACTIVE_TASKS.md"),
+            artifact_dir=tmp,
+            task_db_bulk_sync=bulk,
+        )
+        guild_core = SimpleNamespace(hub=SimpleNamespace(db=db), config=config)
+        director = TaskDirector(config, guild_core)
+
+        priorities = list(TaskPriority)
+        for i in range(task_count):
+            await director._add_task_internal(
+                Task(
+                    id=f"AAS-{i + 1:06d}",
+                    title=f"Benchmark task {i}",
+                    description="db sync benchmark",
+                    status=TaskStatus.QUEUED,
+                    priority=priorities[i % len(priorities)],
+                    metadata={"execution_mode": "automatic"},
+                )
+            )
+
+        db.statements = 0
+        start = time.perf_counter()
+        await director._sync_with_database()
+        initial_seconds = time.perf_counter() - start
+        initial_statements = db.statements
+
+        changed = max(1, int(task_count * changed_ratio))
+        for task_id in list(director._tasks)[:changed]:
+            director._tasks[task_id].status = TaskStatus.IN_PROGRESS
+            director._mark_dirty(task_id)
+
+        db.statements = 0
+        start = time.perf_counter()
+        await director._sync_with_database()
+        incremental_seconds = time.perf_counter() - start
+
+        return {
+            "mode": "bulk" if bulk else "per_task",
+            "tasks": task_count,
+            "changed": changed,
+            "initial_sync_s": round(initial_seconds, 4),
+            "initial_statements": initial_statements,
+            "incremental_sync_s": round(incremental_seconds, 4),
+            "incremental_statements": db.statements,
+        }
+
+
+async def main(sizes: List[int], changed_ratio: float) -> List[Dict[str, Any]]:
+    results = []
+    for size in sizes:
+        for bulk in (False, True):
+            results.append(await _run(size, changed_ratio, bulk))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--changed", type=float, default=0.01)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(main(args.tasks, args.changed)), indent=2))
@@ -0,0 +1,81 @@
+"""
+Dependency graph benchmark - incremental ordering and analytics at scale.
+
+Builds a DAG where each task depends on a few recently created tasks (the
+usual shape of a task board), with an optional share of random edges that
+force reordering or are rejected as cycles. Reports time per edge insert
+and for the levels / critical path passes.
+
+    python -m guild.benchmarks.dependency_graph --nodes 100000 --edges 200000
+"""
+
+import argparse
+import json
+import random
+import time
+from typing import Any, Dict
+
+from ..task_graph import DependencyAnalytics, DependencyCycleError
+
+
+def main(nodes: int, edges: int, window: int, random_share: float, seed: int) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    graph = DependencyAnalytics()
+    ids = [f"AAS-{i + 1:06d}" for i in range(nodes)]
+
+    start = time.perf_counter()
+    for task_id in ids:
+        graph.add_node(task_id)
+    node_seconds = time.perf_counter() - start
+
+    added = rejected = 0
+    start = time.perf_counter()
+    for _ in range(edges):
+        if rng.random() < random_share:
+            dependency, dependent = rng.randrange(nodes), rng.randrange(nodes)
+        else:
+            dependent = rng.randrange(1, nodes)
+            dependency = rng.randrange(max(0, dependent - window), dependent)
+        try:
+            graph.add_edge(ids[dependency], ids[dependent])
+            added += 1
+        except DependencyCycleError:
+            rejected += 1
+    edge_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    levels = graph.levels()
+    levels_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    length, path = graph.critical_path(lambda _task_id: 1.0)
+    critical_seconds = time.perf_counter() - start
+
+    return {
+        "nodes": nodes,
+        "edges_added": added,
+        "edges_rejected_as_cycles": rejected,
+        "random_share": random_share,
+        "add_node_us": round(node_seconds / nodes * 1e6, 3),
+        "add_edge_us": round(edge_seconds / max(edges, 1) * 1e6, 3),
+        "levels_s": round(levels_seconds, 4),
+        "depth": max(levels.values(), default=-1) + 1,
+        "critical_path_s": round(critical_seconds, 4),
+        "critical_path_length": len(path),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nodes", type=int, default=100000)
+    parser.add_argument("--edges", type=int, default=200000)
+    parser.add_argument("--window", type=int, default=1000)
+    parser.add_argument("--random-share", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    print(
+        json.dumps(
+            main(args.nodes, args.edges, args.window, args.random_share, args.seed),
+            indent=2,
+        )
+    )
@@ -0,0 +1,183 @@
+"""
+Hub channel benchmark - head-of-line blocking and per-channel throughput.
+
+Three scenarios against a bare CommunicationHub:
+
+    isolation   a slow WORKSPACE_EVENTS subscriber runs next to a fast
+                TASK_UPDATES one; reports TASK_UPDATES delivery latency
+    scaling     I/O-bound subscribers on 1..6 channels; reports dispatch
+                throughput per channel count and workers per channel
+    priority    a backlog of LOW agent.status_changed messages with unrelated
+                URGENT alerts interleaved on the same channel; reports URGENT
+                and LOW queue wait from the hub's per-priority health
+
+    python -m guild.benchmarks.hub_channels --messages 2000 --workers 1 4
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+from loguru import logger
+
+from ..communication_hub import CommunicationChannel, CommunicationHub, MessagePriority
+from ..core import GuildConfig
+
+
+def _percentile_ms(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * pct))] * 1000, 3)
+
+
+async def _hub(workers: int) -> CommunicationHub:
+    hub = CommunicationHub(
+        GuildConfig(hub_workers_per_channel=workers), SimpleNamespace(hub=None)
+    )
+    await hub.start()
+    return hub
+
+
+async def _isolation(messages: int, slow_ms: float, workers: int) -> Dict[str, Any]:
+    hub = await _hub(workers)
+    latencies: List[float] = []
+    done = asyncio.Event()
+
+    async def slow(message) -> None:
+        await asyncio.sleep(slow_ms / 1000)
+
+    async def fast(message) -> None:
+        latencies.append(time.perf_counter() - message.payload["sent"])
+        if len(latencies) == messages:
+            done.set()
+
+    hub.subscribe(CommunicationChannel.WORKSPACE_EVENTS, slow)
+    hub.subscribe(CommunicationChannel.TASK_UPDATES, fast)
+
+    start = time.perf_counter()
+    for i in range(messages):
+        # One slow workspace event for every five task updates
+        if i % 5 == 0:
+            await hub.emit_event(
+                "workspace.scan", {"n": i}, CommunicationChannel.WORKSPACE_EVENTS
+            )
+        await hub.emit_event(
+            "task.updated",
+            {"task_id": f"AAS-{i % 50}", "sent": time.perf_counter()},
+            CommunicationChannel.TASK_UPDATES,
+        )
+    await done.wait()
+    elapsed = time.perf_counter() - start
+    await hub.stop()
+    return {
+        "workers_per_channel": workers,
+        "task_updates": messages,
+        "slow_subscriber_ms": slow_ms,
+        "task_latency_p50_ms": _percentile_ms(latencies, 0.50),
+        "task_latency_p99_ms": _percentile_ms(latencies, 0.99),
+        "elapsed_s": round(elapsed, 3),
+    }
+
+
+async def _scaling(messages: int, channels: int, io_ms: float, workers: int) -> Dict[str, Any]:
+    hub = await _hub(workers)
+    selected = list(CommunicationChannel)[:channels]
+    delivered = 0
+    done = asyncio.Event()
+
+    async def subscriber(message) -> None:
+        nonlocal delivered
+        await asyncio.sleep(io_ms / 1000)
+        delivered += 1
+        if delivered == messages:
+            done.set()
+
+    for channel in selected:
+        hub.subscribe(channel, subscriber)
+
+    start = time.perf_counter()
+    for i in range(messages):
+        await hub.emit_event(
+            "bench.event", {"task_id": f"AAS-{i}"}, selected[i % channels]
+        )
+    await done.wait()
+    elapsed = time.perf_counter() - start
+    await hub.stop()
+    return {
+        "channels": channels,
+        "workers_per_channel": workers,
+        "messages": messages,
+        "messages_per_s": round(messages / elapsed, 1),
+    }
+
+
+async def _priority(messages: int, io_ms: float, urgent_every: int) -> Dict[str, Any]:
+    hub = await _hub(1)
+    delivered = 0
+    done = asyncio.Event()
+
+    async def subscriber(message) -> None:
+        nonlocal delivered
+        await asyncio.sleep(io_ms / 1000)
+        delivered += 1
+        if delivered == messages:
+            done.set()
+
+    hub.subscribe(CommunicationChannel.AGENT_COORDINATION, subscriber)
+
+    for i in range(messages):
+        urgent = i % urgent_every == 0
+        # Alerts are unrelated to the agents' status stream; messages that
+        # share an agent_id would keep their send order instead
+        await hub.emit_event(
+            "agent.alert" if urgent else "agent.status_changed",
+            {"alert": i} if urgent else {"agent_id": f"agent-{i % 20}"},
+            CommunicationChannel.AGENT_COORDINATION,
+            MessagePriority.URGENT if urgent else MessagePriority.LOW,
+        )
+        # Let the backlog build while producing
+        if i % 100 == 0:
+            await asyncio.sleep(0)
+    await done.wait()
+    health = await hub.get_health()
+    await hub.stop()
+    return {
+        "messages": messages,
+        "urgent_every": urgent_every,
+        "subscriber_ms": io_ms,
+        "urgent_wait_p99_ms": health["priorities"]["URGENT"]["wait_p99_ms"],
+        "urgent_wait_max_ms": health["priorities"]["URGENT"]["wait_max_ms"],
+        "low_wait_p99_ms": health["priorities"]["LOW"]["wait_p99_ms"],
+    }
+
+
+async def _main(messages: int, workers: List[int], slow_ms: float, io_ms: float):
+    isolation = [await _isolation(messages, slow_ms, w) for w in workers]
+    scaling = [
+        await _scaling(messages, channels, io_ms, w)
+        for w in workers
+        for channels in range(1, len(CommunicationChannel) + 1)
+    ]
+    priority = [await _priority(messages, io_ms, 50)]
+    return {"isolation": isolation, "scaling": scaling, "priority": priority}
+
+
+def main(messages: int, workers: List[int], slow_ms: float, io_ms: float) -> Dict[str, Any]:
+    return asyncio.run(_main(messages, workers, slow_ms, io_ms))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--slow-ms", type=float, default=10.0)
+    parser.add_argument("--io-ms", type=float, default=1.0)
+    args = parser.parse_args()
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+    print(json.dumps(main(args.messages, args.workers, args.slow_ms, args.io_ms), indent=2))
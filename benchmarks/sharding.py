@@ -0,0 +1,196 @@
+"""
+Sharding benchmark - claim/complete throughput across TaskDirector shards.
+
+Creates a task set in which a share of the tasks depend on an earlier task
+(so most dependency edges cross shards), then lets concurrent agents claim
+and complete until every task is done. Runs the same workload through the
+in-process director and through the shard router at each shard count, and
+checks that every task was completed exactly once.
+
+Throughput only scales with shards up to the number of free cores; the
+router itself is one process.
+
+    python -m guild.benchmarks.sharding --shards 1 2 4 8 --tasks 20000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+from ..core import GuildConfig
+from ..task_director import TaskDirector
+from ..task_sharding import ShardedTaskRouter
+
+
+class _StubHub:
+    def __init__(self):
+        self.events = 0
+
+    async def emit_event(self, *args, **kwargs):
+        self.events += 1
+
+    def subscribe(self, *args, **kwargs):
+        return None
+
+
+class _StubCoordinator:
+    async def get_agent_capabilities(self, agent_id: str):
+        return []
+
+
+def _specs(tasks: int, dependent_share: float, batch: int, seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    specs = []
+    for i in range(tasks):
+        # Dependencies point at a task from an earlier creation batch; the
+        # index is swapped for its real ID once that batch exists
+        earlier = i - i % batch
+        depends_on = None
+        if earlier and rng.random() < dependent_share:
+            depends_on = rng.randrange(earlier)
+        specs.append(
+            {"title": f"Shard task {i}", "description": "", "depends_on": depends_on}
+        )
+    return specs
+
+
+async def _create(target, specs: List[Dict[str, Any]], batch: int) -> List[str]:
+    task_ids: List[str] = []
+    for start in range(0, len(specs), batch):
+        chunk = []
+        for spec in specs[start:start + batch]:
+            dep = spec["depends_on"]
+            chunk.append(
+                {
+                    "title": spec["title"],
+                    "description": spec["description"],
+                    "dependencies": [task_ids[dep]] if dep is not None else [],
+                }
+            )
+        task_ids.extend(await target.create_tasks(chunk))
+    return task_ids
+
+
+async def _drain(target, tasks: int, agents: int, timeout: float) -> Dict[str, Any]:
+    completed: Dict[str, str] = {}
+    duplicates = 0
+    deadline = time.perf_counter() + timeout
+
+    async def agent(agent_id: str) -> None:
+        nonlocal duplicates
+        while len(completed) < tasks and time.perf_counter() < deadline:
+            task = await target.claim_task(agent_id)
+            if not task:
+                # Remaining tasks are waiting on a cross-shard notification
+                await asyncio.sleep(0.001)
+                continue
+            if task["id"] in completed:
+                duplicates += 1
+            if await target.complete_task(task["id"], agent_id, {"ok": True}):
+                completed[task["id"]] = agent_id
+
+    start = time.perf_counter()
+    await asyncio.gather(*(agent(f"agent-{i}") for i in range(agents)))
+    elapsed = time.perf_counter() - start
+    return {
+        "completed": len(completed),
+        "duplicates": duplicates,
+        "elapsed_s": round(elapsed, 3),
+        "claim_complete_per_s": round(len(completed) / elapsed, 1),
+    }
+
+
+async def _run(shards: Optional[int], specs, agents: int, batch: int, timeout: float):
+    workdir = Path(tempfile.mkdtemp(prefix="guild-shard-bench-"))
+    config = GuildConfig(
+        task_board_path=str(workdir / "ACTIVE_TASKS.md"),
+        artifact_dir=str(workdir / "artifacts"),
+        task_shards=shards or 1,
+    )
+    core = SimpleNamespace(
+        config=config,
+        hub=None,
+        communication_hub=_StubHub(),
+        agent_coordinator=_StubCoordinator(),
+    )
+    try:
+        if shards is None:
+            target = TaskDirector(config, core)
+        else:
+            target = ShardedTaskRouter(config, core)
+            await target.start()
+
+        start = time.perf_counter()
+        await _create(target, specs, batch)
+        create_s = time.perf_counter() - start
+
+        result = await _drain(target, len(specs), agents, timeout)
+        if shards is not None:
+            await target.stop()
+        result.update(
+            {
+                "mode": "in_process" if shards is None else "sharded",
+                "shards": shards or 1,
+                "create_per_s": round(len(specs) / create_s, 1),
+                "exactly_once": result["completed"] == len(specs) and not result["duplicates"],
+            }
+        )
+        return result
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main(
+    shard_counts: List[int],
+    tasks: int,
+    agents: int,
+    dependent_share: float,
+    batch: int,
+    timeout: float,
+    seed: int,
+) -> Dict[str, Any]:
+    specs = _specs(tasks, dependent_share, batch, seed)
+    results = [asyncio.run(_run(None, specs, agents, batch, timeout))]
+    for shards in shard_counts:
+        results.append(asyncio.run(_run(shards, specs, agents, batch, timeout)))
+    return {
+        "tasks": tasks,
+        "agents": agents,
+        "dependent_share": dependent_share,
+        "cpu_count": os.cpu_count(),
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--tasks", type=int, default=20000)
+    parser.add_argument("--agents", type=int, default=64)
+    parser.add_argument("--dependent-share", type=float, default=0.3)
+    parser.add_argument("--batch", type=int, default=1000)
+    parser.add_argument("--timeout", type=float, default=300.0)
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+    print(
+        json.dumps(
+            main(
+                args.shards,
+                args.tasks,
+                args.agents,
+                args.dependent_share,
+                args.batch,
+                args.timeout,
+                args.seed,
+            ),
+            indent=2,
+        )
+    )
@@ -0,0 +1,296 @@
+"""
+Guild benchmark suite - TaskDirector throughput through a running GuildCore.
+
+Starts a GuildCore against a stub AAS hub (auto-approving approval store, no
+database) and drives synthetic workloads through its public task API:
+
+    flat      independent MEDIUM tasks
+    deep_dag  long dependency chains (--depth tasks each)
+    fanout    roots with --fanout dependents each
+    mixed     random priorities and execution modes, a share of them
+              behind claim/execute approval gates
+
+For each workload and size it reports create throughput, traced memory per
+task, snapshot and board write time, claim throughput and latency, and the
+latency from a completion to its dependents becoming ready and being
+claimed. Results are JSON so runs can be diffed between releases.
+
+    python -m guild.benchmarks.suite --sizes 1000 10000 100000 --workloads flat mixed
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+
+from loguru import logger
+
+from .. import __version__
+from ..core import GuildConfig, GuildCore
+from ..schema import TaskPriority
+
+
+class _AutoApprovals:
+    """Approval store that has already approved every gate"""
+
+    def get_for_task(self, task_id: str, gate: str):
+        return SimpleNamespace(
+            status="approved", approval_id=f"{task_id}-{gate}", targets=["benchmark"]
+        )
+
+    async def request(self, task_id, gate, requested_by, targets, metadata):
+        return self.get_for_task(task_id, gate)
+
+
+class _StubHub:
+    """The parts of the AAS hub the Guild touches; no ``db``, so no DB sync"""
+
+    def __init__(self):
+        self.approvals = _AutoApprovals()
+
+
+# Workloads: each returns task specs whose "depends_on" holds indexes of
+# earlier specs, resolved to real IDs at creation time
+
+
+def _flat(size: int, rng: random.Random, args) -> List[Dict[str, Any]]:
+    return [{"depends_on": []} for _ in range(size)]
+
+
+def _deep_dag(size: int, rng: random.Random, args) -> List[Dict[str, Any]]:
+    return [
+        {"depends_on": [i - 1] if i % args.depth else []} for i in range(size)
+    ]
+
+
+def _fanout(size: int, rng: random.Random, args) -> List[Dict[str, Any]]:
+    group = args.fanout + 1
+    return [
+        {"depends_on": [i - i % group] if i % group else []} for i in range(size)
+    ]
+
+
+def _mixed(size: int, rng: random.Random, args) -> List[Dict[str, Any]]:
+    priorities = list(TaskPriority)
+    specs = []
+    for i in range(size):
+        roll = rng.random()
+        if roll < 0.1:
+            metadata = {"execution_mode": "automatic", "execution_gate": True}
+        elif roll < 0.3:
+            metadata = {"execution_mode": "semi_automatic"}
+        else:
+            metadata = {"execution_mode": "automatic"}
+        specs.append(
+            {
+                "priority": rng.choice(priorities),
+                "metadata": metadata,
+                "depends_on": [rng.randrange(i)] if i and rng.random() < 0.2 else [],
+            }
+        )
+    return specs
+
+
+WORKLOADS: Dict[str, Callable] = {
+    "flat": _flat,
+    "deep_dag": _deep_dag,
+    "fanout": _fanout,
+    "mixed": _mixed,
+}
+
+
+def _percentile_ms(values: List[float], pct: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * pct))] * 1000, 3)
+
+
+async def _create(guild: GuildCore, specs: List[Dict[str, Any]], batch: int) -> List[str]:
+    # create_tasks assigns IDs, so a spec can only name dependencies that
+    # already exist: create level by level, in batches within each level
+    levels = [0] * len(specs)
+    by_level: Dict[int, List[int]] = {}
+    for i, spec in enumerate(specs):
+        levels[i] = max((levels[dep] + 1 for dep in spec["depends_on"]), default=0)
+        by_level.setdefault(levels[i], []).append(i)
+
+    task_ids: List[Optional[str]] = [None] * len(specs)
+    for level in sorted(by_level):
+        indexes = by_level[level]
+        for start in range(0, len(indexes), batch):
+            chunk = indexes[start:start + batch]
+            created = await guild.create_tasks(
+                [
+                    {
+                        "title": f"Benchmark task {i}",
+                        "description": "",
+                        "priority": specs[i].get("priority", TaskPriority.MEDIUM),
+                        "dependencies": [task_ids[dep] for dep in specs[i]["depends_on"]],
+                        "metadata": dict(specs[i].get("metadata", {})),
+                    }
+                    for i in chunk
+                ]
+            )
+            for i, task_id in zip(chunk, created):
+                task_ids[i] = task_id
+    return task_ids
+
+
+async def _drain(guild: GuildCore, task_ids: List[str], agents: int, timeout: float):
+    director = guild.task_director
+    total = len(task_ids)
+    completed_at: Dict[str, float] = {}
+    claim_latency: List[float] = []
+    complete_to_ready: List[float] = []
+    complete_to_claim: List[float] = []
+    deadline = time.perf_counter() + timeout
+    idle_claims = 0
+
+    async def agent(agent_id: str) -> None:
+        nonlocal idle_claims
+        while len(completed_at) < total and time.perf_counter() < deadline:
+            start = time.perf_counter()
+            task = await guild.claim_task(agent_id)
+            claimed = time.perf_counter()
+            if not task:
+                idle_claims += 1
+                await asyncio.sleep(0.0005)
+                continue
+            claim_latency.append(claimed - start)
+            if task["dependencies"]:
+                ready_since = max(completed_at.get(dep, claimed) for dep in task["dependencies"])
+                complete_to_claim.append(claimed - ready_since)
+
+            has_dependents = bool(director._dependency_graph.get(task["id"]))
+            start = time.perf_counter()
+            await guild.complete_task(task["id"], agent_id, {"ok": True})
+            finished = time.perf_counter()
+            # Dependents are unblocked and enqueued inside complete_task
+            if has_dependents:
+                complete_to_ready.append(finished - start)
+            completed_at[task["id"]] = finished
+
+    start = time.perf_counter()
+    await asyncio.gather(*(agent(f"bench-agent-{i}") for i in range(agents)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "completed": len(completed_at),
+        "drain_s": round(elapsed, 3),
+        "claims_per_s": round(len(claim_latency) / elapsed, 1),
+        "claim_p50_ms": _percentile_ms(claim_latency, 0.50),
+        "claim_p99_ms": _percentile_ms(claim_latency, 0.99),
+        "complete_to_ready_p50_ms": _percentile_ms(complete_to_ready, 0.50),
+        "complete_to_ready_p99_ms": _percentile_ms(complete_to_ready, 0.99),
+        "complete_to_claim_p50_ms": _percentile_ms(complete_to_claim, 0.50),
+        "complete_to_claim_p99_ms": _percentile_ms(complete_to_claim, 0.99),
+        "empty_claims": idle_claims,
+    }
+
+
+async def _run(workload: str, size: int, args) -> Dict[str, Any]:
+    workdir = Path(tempfile.mkdtemp(prefix="guild-bench-"))
+    cwd = os.getcwd()
+    # The workspace director manages (and cleans) paths relative to the
+    # working directory; give it an empty one away from the task state
+    (workdir / "workspace").mkdir()
+    os.chdir(workdir / "workspace")
+    try:
+        config = GuildConfig(
+            task_board_path=str(workdir / "state" / "ACTIVE_TASKS.md"),
+            artifact_dir=str(workdir / "state"),
+            enable_auto_batching=False,
+            enable_workspace_monitoring=False,
+            enable_model_management=False,
+            task_scheduling_policy=args.policy,
+            task_archive_after_seconds=0,
+        )
+        guild = GuildCore(config, hub=_StubHub())
+        await guild.start()
+        director = guild.task_director
+
+        specs = WORKLOADS[workload](size, random.Random(args.seed), args)
+
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        task_ids = await _create(guild, specs, args.batch)
+        create_s = time.perf_counter() - start
+        traced, _peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        await director._journal.compact()
+        snapshot_s = time.perf_counter() - start
+
+        # Full board render and write, bypassing the cached rows
+        director._board_rows.clear()
+        director._board_order = None
+        director._board_synced_version = -1
+        start = time.perf_counter()
+        await director._sync_with_markdown()
+        board_s = time.perf_counter() - start
+
+        result = {
+            "workload": workload,
+            "tasks": size,
+            "create_per_s_traced": round(size / create_s, 1),
+            "bytes_per_task": round(traced / size),
+            "snapshot_s": round(snapshot_s, 4),
+            "board_write_s": round(board_s, 4),
+        }
+        result.update(await _drain(guild, task_ids, args.agents, args.timeout))
+
+        await guild.stop()
+        return result
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main(args) -> Dict[str, Any]:
+    results = []
+    for size in args.sizes:
+        for workload in args.workloads:
+            results.append(asyncio.run(_run(workload, size, args)))
+    return {
+        "guild_version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "policy": args.policy,
+        "agents": args.agents,
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument(
+        "--workloads", nargs="+", choices=sorted(WORKLOADS), default=list(WORKLOADS)
+    )
+    parser.add_argument("--agents", type=int, default=32)
+    parser.add_argument("--batch", type=int, default=1000)
+    parser.add_argument("--depth", type=int, default=100)
+    parser.add_argument("--fanout", type=int, default=1000)
+    parser.add_argument("--policy", default="strict")
+    parser.add_argument("--timeout", type=float, default=600.0)
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level=args.log_level)
+    print(json.dumps(main(args), indent=2))
@@ -0,0 +1,106 @@
+"""
+Task memory benchmark - legacy dataclass layout vs slotted Task.
+
+Builds N tasks the way the board/journal loaders do (fresh strings per row,
+ISO timestamps, role/domain metadata) and reports traced bytes per task
+for each layout.
+
+    python -m guild.benchmarks.task_memory --tasks 10000 100000 1000000
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from ..schema import TaskPriority, TaskStatus
+from ..task_director import Task
+
+
+@dataclass
+class LegacyTask:
+    """The pre-slots Task layout, kept here for comparison"""
+
+    id: str
+    title: str
+    description: str
+    status: TaskStatus
+    priority: TaskPriority
+    assignee: Optional[str] = None
+    dependencies: List[str] = field(default_factory=list)
+    capabilities_required: List[str] = field(default_factory=list)
+    created_at: str = ""
+    updated_at: str = ""
+    claimed_at: Optional[str] = None
+    completed_at: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    execution_history: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def _rows(count: int):
+    """Yield loader-style kwargs; strings are rebuilt per row as a parser would"""
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    priorities = list(TaskPriority)
+    for i in range(count):
+        stamp = (base + timedelta(seconds=i)).isoformat()
+        yield {
+            "id": f"AAS-{i + 1:03d}",
+            "title": f"Task {i}",
+            "description": "",
+            "status": TaskStatus.QUEUED if i % 3 else TaskStatus.IN_PROGRESS,
+            "priority": priorities[i % len(priorities)],
+            "assignee": f"agent-{i % 50}" if i % 3 == 0 else None,
+            "created_at": stamp,
+            "updated_at": "".join(stamp),
+            "metadata": {
+                "execution_mode": "".join("automatic"),
+                "approvals": {},
+                "preferred_role": f"role-{i % 8}",
+                "domain": f"domain-{i % 12}",
+            },
+        }
+
+
+def _measure(factory, count: int) -> Dict[str, Any]:
+    gc.collect()
+    tracemalloc.start()
+    tasks = [factory(**row) for row in _rows(count)]
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tasks
+    gc.collect()
+    return {
+        "total_mb": round(current / 1024 / 1024, 2),
+        "peak_mb": round(peak / 1024 / 1024, 2),
+        "bytes_per_task": round(current / count),
+    }
+
+
+def main(sizes: List[int]) -> List[Dict[str, Any]]:
+    results = []
+    for size in sizes:
+        legacy = _measure(LegacyTask, size)
+        slotted = _measure(Task, size)
+        results.append(
+            {
+                "tasks": size,
+                "legacy": legacy,
+                "slotted": slotted,
+                "reduction": round(
+                    1 - slotted["bytes_per_task"] / legacy["bytes_per_task"], 3
+                ),
+            }
+        )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--tasks", type=int, nargs="+", default=[10000, 100000, 1000000]
+    )
+    args = parser.parse_args()
+    print(json.dumps(main(args.tasks), indent=2))
@@ -3,12 +3,24 @@ Guild Communication Hub - Unified inter-module communication system
 """
 
 import asyncio
-from typing import Dict, Any, List, Callable, Optional, Set
+from collections import deque
+from contextvars import ContextVar
+from itertools import islice
+from typing import Deque, Dict, Any, List, Callable, Optional, Set
 from dataclasses import dataclass, field
 from enum import Enum
 from loguru import logger
 import json
 from datetime import datetime, timezone
+from pathlib import Path
+
+from .hub_outbox import HubOutbox
+from .message_queue import EnqueueResult, HubBackpressureError, MessageQueue
+
+# Lane whose dispatch the current task is running in (handlers inherit it)
+_dispatching_lane: ContextVar[Optional[MessageQueue]] = ContextVar(
+    "hub_dispatching_lane", default=None
+)
 
 
 class MessagePriority(Enum):
@@ -44,6 +56,7 @@ class Message:
     correlation_id: Optional[str] = None
     reply_to: Optional[str] = None
     ttl_seconds: Optional[int] = None
+    sequence: Optional[int] = None  # durable outbox sequence, when the outbox is enabled
 
 
 class CommunicationHub:
@@ -53,12 +66,15 @@ class CommunicationHub:
     Features:
     - Multi-channel message routing
     - Priority-based message handling
+    - Bounded per-channel queues with backpressure and load shedding
     - Event subscription and broadcasting
     - Cross-module coordination
-    - Message persistence and replay
+    - Durable outbox with ACK cursors and replay on restart (opt-in)
     - Dead letter queue for failed messages
     """
 
+    OUTBOX_CONSUMER = "hub"  # ACK cursor of the hub's own dispatch
+
     def __init__(self, config, guild_core):
         self.config = config
         self.guild_core = guild_core
@@ -68,9 +84,72 @@ class CommunicationHub:
         self._subscribers: Dict[CommunicationChannel, List[Callable]] = {
             channel: [] for channel in CommunicationChannel
         }
-        self._message_queue: asyncio.Queue = asyncio.Queue()
+        # Per-channel dispatch lanes, each a priority queue drained by one
+        # worker, so a slow subscriber only holds up its own channel.
+        # Messages sharing an ordering key always land in the same lane and
+        # are dispatched in the order sent, whatever their priority; among
+        # unrelated messages higher priorities (with aging) go first.
+        self._channel_workers: Dict[CommunicationChannel, int] = {
+            channel: max(
+                1,
+                int(
+                    config.hub_channel_workers.get(
+                        channel.value, config.hub_workers_per_channel
+                    )
+                ),
+            )
+            for channel in CommunicationChannel
+        }
+        # Durable outbox: every accepted message is logged and acknowledged
+        # once dispatched, so unacknowledged messages replay after a restart
+        self._outbox: Optional[HubOutbox] = None
+        if config.hub_outbox_enabled:
+            self._outbox = HubOutbox(
+                Path(config.hub_outbox_dir),
+                flush_interval=config.hub_outbox_flush_interval,
+                segment_bytes=config.hub_outbox_segment_bytes,
+                retention_bytes=config.hub_outbox_retention_bytes,
+            )
+
+        # Each channel is bounded; its capacity is split across its lanes
+        # and a full lane applies the channel's overflow policy
+        self._lanes: Dict[CommunicationChannel, List[MessageQueue]] = {}
+        for channel, workers in self._channel_workers.items():
+            capacity = int(
+                config.hub_channel_capacities.get(channel.value, config.hub_channel_capacity)
+            )
+            overflow = config.hub_channel_overflow.get(channel.value, config.hub_overflow_policy)
+            self._lanes[channel] = [
+                MessageQueue(
+                    aging_seconds=config.hub_priority_aging_seconds,
+                    capacity=max(1, capacity // workers) if capacity > 0 else 0,
+                    overflow=overflow,
+                    block_timeout=config.hub_block_timeout_seconds,
+                    on_discard=self._ack_outbox,
+                )
+                for _ in range(workers)
+            ]
         self._dead_letter_queue: List[Message] = []
-        self._message_history: List[Message] = []
+
+        # Dispatched-message history: fixed-size rings, one across all
+        # channels and one per channel, so appends never copy and filtered
+        # reads touch only the requested entries
+        self._message_history: Deque[Message] = deque(
+            maxlen=max(1, config.hub_history_size)
+        )
+        self._channel_history: Dict[CommunicationChannel, Deque[Message]] = {
+            channel: deque(
+                maxlen=max(
+                    1,
+                    int(
+                        config.hub_channel_history.get(
+                            channel.value, config.hub_channel_history_size
+                        )
+                    ),
+                )
+            )
+            for channel in CommunicationChannel
+        }
 
         # Cross-module bridges
         self._ipc_bridge = None
@@ -78,7 +157,7 @@ class CommunicationHub:
         self._websocket_manager = None
 
         # Processing tasks
-        self._message_processor_task: Optional[asyncio.Task] = None
+        self._worker_tasks: List[asyncio.Task] = []
 
         logger.info("Communication Hub initialized")
 
@@ -92,8 +171,19 @@ class CommunicationHub:
         # Initialize bridges to existing systems
         await self._initialize_bridges()
 
-        # Start message processing
-        self._message_processor_task = asyncio.create_task(self._process_messages())
+        if self._outbox:
+            await self._outbox.start()
+            self._outbox.register_consumer(self.OUTBOX_CONSUMER)
+
+        # Start one dispatch worker per lane
+        for channel, lanes in self._lanes.items():
+            for index, lane in enumerate(lanes):
+                self._worker_tasks.append(
+                    asyncio.create_task(
+                        self._process_lane(lane),
+                        name=f"guild-hub-{channel.value}-{index}",
+                    )
+                )
 
         logger.info("Communication Hub started")
 
@@ -104,12 +194,14 @@ class CommunicationHub:
 
         self._running = False
 
-        if self._message_processor_task:
-            self._message_processor_task.cancel()
-            try:
-                await self._message_processor_task
-            except asyncio.CancelledError:
-                pass
+        for worker in self._worker_tasks:
+            worker.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+
+        # Messages still queued stay unacknowledged and replay on next start
+        if self._outbox:
+            await self._outbox.stop()
 
         logger.info("Communication Hub stopped")
 
@@ -149,10 +241,43 @@ class CommunicationHub:
             self._subscribers[channel].remove(handler)
             logger.debug(f"Subscriber removed from {channel.value}")
 
-    async def send_message(self, message: Message) -> None:
-        """Send a message through the communication hub"""
-        await self._message_queue.put(message)
-        logger.debug(f"Message queued: {message.event_type} on {message.channel.value}")
+    async def send_message(
+        self, message: Message, raise_on_overflow: bool = False
+    ) -> EnqueueResult:
+        """
+        Send a message through the communication hub.
+
+        Returns how the message was queued; anything but ``QUEUED`` means the
+        channel is at capacity and the producer should slow down. With
+        ``raise_on_overflow`` a dropped message raises HubBackpressureError.
+        """
+        if self._outbox and message.sequence is None:
+            message.sequence = self._outbox.append(self._outbox_record(message))
+
+        lane = self._lane_for(message)
+        ordering_key = self._ordering_key(message)
+        if ordering_key == message.id:
+            ordering_key = None  # unrelated to any other message
+        coalesce_key = None
+        if lane.overflow == "coalesce" and ordering_key is not None:
+            coalesce_key = f"{message.event_type}|{message.target}|{ordering_key}"
+
+        if lane is _dispatching_lane.get():
+            # A handler publishing to its own lane must not wait for space:
+            # only this dispatch loop frees it. Shed or drop instead.
+            result = lane.put_nowait(message, coalesce_key, ordering_key)
+        else:
+            result = await lane.put(message, coalesce_key, ordering_key)
+        if result is EnqueueResult.DROPPED:
+            self._ack_outbox(message)
+            logger.warning(
+                f"Hub channel {message.channel.value} full; dropped {message.event_type}"
+            )
+            if raise_on_overflow:
+                raise HubBackpressureError(message.channel.value, result)
+        else:
+            logger.debug(f"Message queued: {message.event_type} on {message.channel.value}")
+        return result
 
     async def emit_event(
         self,
@@ -161,8 +286,9 @@ class CommunicationHub:
         channel: CommunicationChannel = CommunicationChannel.SYSTEM_ALERTS,
         priority: MessagePriority = MessagePriority.NORMAL,
         target: Optional[str] = None,
-    ) -> None:
-        """Emit an event through the communication hub"""
+        raise_on_overflow: bool = False,
+    ) -> EnqueueResult:
+        """Emit an event through the communication hub (see ``send_message``)"""
         import uuid
 
         message = Message(
@@ -175,31 +301,121 @@ class CommunicationHub:
             payload=data,
         )
 
-        await self.send_message(message)
-
-    async def _process_messages(self) -> None:
-        """Process messages from the queue"""
+        return await self.send_message(message, raise_on_overflow)
+
+    def _lane_for(self, message: Message) -> MessageQueue:
+        lanes = self._lanes[message.channel]
+        if len(lanes) == 1:
+            return lanes[0]
+        return lanes[hash(self._ordering_key(message)) % len(lanes)]
+
+    @staticmethod
+    def _ordering_key(message: Message) -> str:
+        """
+        Messages with the same key are dispatched in order.
+
+        The correlation ID wins, then the task or agent the payload is
+        about; anything else may be dispatched in parallel.
+        """
+        if message.correlation_id:
+            return message.correlation_id
+        payload = message.payload if isinstance(message.payload, dict) else {}
+        for field_name in ("task_id", "agent_id", "batch_id"):
+            value = payload.get(field_name)
+            if value:
+                return f"{field_name}:{value}"
+        return message.id
+
+    async def _process_lane(self, lane: MessageQueue) -> None:
+        """Dispatch messages from one lane, one at a time"""
         while self._running:
             try:
-                # Get message with timeout to allow periodic checks
-                message = await asyncio.wait_for(self._message_queue.get(), timeout=1.0)
-                await self._handle_message(message)
-            except asyncio.TimeoutError:
-                continue  # Normal timeout, continue processing
+                message = await lane.get()
+                token = _dispatching_lane.set(lane)
+                try:
+                    await self._handle_message(message)
+                finally:
+                    _dispatching_lane.reset(token)
+                # Not reached if cancelled mid-dispatch: the message replays
+                self._ack_outbox(message)
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Error processing message: {e}")
 
+    def _ack_outbox(self, message: Message) -> None:
+        """Mark a message as done with: dispatched, shed or dropped"""
+        if self._outbox and message.sequence is not None:
+            self._outbox.ack(self.OUTBOX_CONSUMER, message.sequence)
+
+    @staticmethod
+    def _outbox_record(message: Message) -> Dict[str, Any]:
+        """Outbox envelope for a message (see protocols/HUB_IO_NETWORK.md)"""
+        return {
+            "message_id": message.id,
+            "module_id": "guild",
+            "topic": f"guild.outbox.{message.channel.value}",
+            "channel": message.channel.value,
+            "event_type": message.event_type,
+            "source": message.source,
+            "target": message.target,
+            "priority": message.priority.name,
+            "payload": message.payload,
+            "timestamp": message.timestamp,
+            "correlation_id": message.correlation_id,
+            "reply_to": message.reply_to,
+            "ttl_seconds": message.ttl_seconds,
+        }
+
+    async def replay_outbox(self) -> int:
+        """
+        Re-queue messages logged but not dispatched before the last stop.
+
+        Not part of ``start()``: replayed messages are acknowledged once
+        dispatched, so call this after every subscriber is registered
+        (GuildCore does so once all components have started). Returns the
+        number of messages replayed.
+        """
+        if not self._outbox or not self._running:
+            return 0
+        try:
+            records = await self._outbox.replay(self.OUTBOX_CONSUMER)
+        except Exception as e:
+            logger.error(f"Failed to read hub outbox for replay: {e}")
+            return 0
+
+        for sequence, record in records:
+            try:
+                message = Message(
+                    id=record["message_id"],
+                    channel=CommunicationChannel(record["channel"]),
+                    event_type=record["event_type"],
+                    source=record["source"],
+                    target=record.get("target"),
+                    priority=MessagePriority[record["priority"]],
+                    payload=record.get("payload") or {},
+                    timestamp=record["timestamp"],
+                    correlation_id=record.get("correlation_id"),
+                    reply_to=record.get("reply_to"),
+                    ttl_seconds=record.get("ttl_seconds"),
+                    sequence=sequence,
+                )
+            except (KeyError, ValueError) as e:
+                logger.error(f"Skipping unreadable hub outbox record {sequence}: {e}")
+                self._outbox.ack(self.OUTBOX_CONSUMER, sequence)
+                continue
+            await self.send_message(message)
+
+        if records:
+            logger.info(f"Replayed {len(records)} unacknowledged hub messages from outbox")
+        return len(records)
+
     async def _handle_message(self, message: Message) -> None:
         """Handle a single message"""
         try:
-            # Add to history
+            # Add to history; the rings drop their oldest entries
             self._message_history.append(message)
-
-            # Keep history size manageable
-            if len(self._message_history) > 1000:
-                self._message_history = self._message_history[-500:]
+            self._channel_history[message.channel].append(message)
 
             # Route to subscribers
             subscribers = self._subscribers.get(message.channel, [])
@@ -283,7 +499,20 @@ class CommunicationHub:
         """Get health status of communication hub"""
         return {
             "status": "healthy" if self._running else "stopped",
-            "queue_size": self._message_queue.qsize(),
+            "queue_size": sum(
+                lane.qsize() for lanes in self._lanes.values() for lane in lanes
+            ),
+            "channels": {
+                channel.value: self._channel_stats(lanes)
+                for channel, lanes in self._lanes.items()
+            },
+            "shed_count": sum(
+                lane.counters["shed"] + lane.counters["dropped"]
+                for lanes in self._lanes.values()
+                for lane in lanes
+            ),
+            "priorities": self._priority_stats(),
+            "outbox": self._outbox.get_stats() if self._outbox else None,
             "dead_letter_count": len(self._dead_letter_queue),
             "message_history_count": len(self._message_history),
             "active_subscribers": {
@@ -297,14 +526,53 @@ class CommunicationHub:
             },
         }
 
+    @staticmethod
+    def _channel_stats(lanes: List[MessageQueue]) -> Dict[str, Any]:
+        stats = {
+            "workers": len(lanes),
+            "depth": sum(lane.qsize() for lane in lanes),
+            "capacity": sum(lane.capacity for lane in lanes),
+            "overflow_policy": lanes[0].overflow,
+        }
+        for counter in lanes[0].counters:
+            stats[counter] = sum(lane.counters[counter] for lane in lanes)
+        return stats
+
+    def _priority_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Queue depth and recent queue wait per message priority"""
+        depth: Dict[int, int] = {}
+        waits: Dict[int, List[float]] = {}
+        for lanes in self._lanes.values():
+            for lane in lanes:
+                for level, count in lane.depth_by_priority().items():
+                    depth[level] = depth.get(level, 0) + count
+                for level, values in lane.recent_waits().items():
+                    waits.setdefault(level, []).extend(values)
+
+        stats = {}
+        for priority in MessagePriority:
+            values = sorted(waits.get(priority.value, []))
+            stats[priority.name] = {
+                "depth": depth.get(priority.value, 0),
+                "wait_avg_ms": round(sum(values) / len(values) * 1000, 3) if values else 0.0,
+                "wait_p99_ms": (
+                    round(values[min(len(values) - 1, int(len(values) * 0.99))] * 1000, 3)
+                    if values
+                    else 0.0
+                ),
+                "wait_max_ms": round(values[-1] * 1000, 3) if values else 0.0,
+            }
+        return stats
+
     def get_message_history(
         self, channel: Optional[CommunicationChannel] = None, limit: int = 100
     ) -> List[Dict[str, Any]]:
         """Get message history for debugging and monitoring"""
-        messages = self._message_history
+        ring = self._channel_history[channel] if channel else self._message_history
 
-        if channel:
-            messages = [m for m in messages if m.channel == channel]
+        # Walk back from the newest entry so only ``limit`` items are read
+        messages = list(islice(reversed(ring), max(0, limit)))
+        messages.reverse()
 
         return [
             {
@@ -317,5 +585,5 @@ class CommunicationHub:
                 "timestamp": m.timestamp,
                 "payload_keys": list(m.payload.keys()),
             }
-            for m in messages[-limit:]
+            for m in messages
         ]
@@ -4,13 +4,14 @@ Guild Core - Central orchestration and coordination hub
 
 import asyncio
 from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from loguru import logger
 
 from .task_director import TaskDirector
+from .task_sharding import ShardedTaskRouter
 from .agent_coordinator import AgentCoordinator
 from .batch_orchestrator import BatchOrchestrator
-from .communication_hub import CommunicationHub
+from .communication_hub import CommunicationHub, EnqueueResult
 from .workspace_director import WorkspaceDirector
 from .model_manager import ModelManager
 from .advanced.resource_aware_model_manager import ResourceAwareModelManager
@@ -32,6 +33,38 @@ class GuildConfig:
     lm_studio_base_port: int = 1234
     max_parallel_models: int = 5
 
+    # Task Director persistence (snapshot + write-ahead log)
+    task_journal_flush_interval: float = 0.05  # seconds between group commits
+    task_journal_compact_threshold: int = 10000  # WAL records per snapshot
+    task_db_bulk_sync: bool = True  # upsert only changed tasks in bulk
+    task_archive_after_seconds: int = 86400  # terminal task age before cold storage (0 disables)
+    task_history_limit: int = 20  # execution_history entries kept in memory per task (0 = unbounded)
+    task_scheduling_policy: str = "strict"  # strict | weighted_fair | deadline
+    task_scheduling_aging_seconds: float = 300.0  # weighted_fair: wait that offsets one priority level
+    task_scheduling_default_slack_seconds: float = 3600.0  # deadline: implicit slack per priority level
+    task_critical_path_boost: int = 1  # priority levels added to ready tasks on the critical path
+    task_failure_cascade: str = "orphan"  # dependents of FAILED/CANCELLED tasks: orphan | cancel | none
+    task_shards: int = 1  # TaskDirector worker processes (1 = single in-process director)
+    task_shard_key: str = "id"  # partition tasks by: id | domain
+
+    # Communication hub dispatch
+    hub_workers_per_channel: int = 1  # dispatch workers per channel (messages with the same ordering key stay in order either way)
+    hub_channel_workers: Dict[str, int] = field(default_factory=dict)  # per-channel override, e.g. {"task_updates": 4}
+    hub_priority_aging_seconds: float = 2.0  # queue wait that offsets one message priority level
+    hub_channel_capacity: int = 10000  # queued messages per channel before overflow (0 = unbounded)
+    hub_channel_capacities: Dict[str, int] = field(default_factory=dict)  # per-channel override
+    hub_overflow_policy: str = "shed"  # full channel: block | shed | coalesce
+    hub_channel_overflow: Dict[str, str] = field(default_factory=dict)  # per-channel override, e.g. {"agent_coordination": "coalesce"}
+    hub_block_timeout_seconds: float = 5.0  # block policy: producer wait before the message is dropped
+    hub_history_size: int = 1000  # dispatched messages kept across all channels
+    hub_channel_history_size: int = 500  # dispatched messages kept per channel
+    hub_channel_history: Dict[str, int] = field(default_factory=dict)  # per-channel retention override
+    hub_outbox_enabled: bool = False  # log hub messages durably and replay unacknowledged ones on start
+    hub_outbox_dir: str = "artifacts/hives/guild/outbox"  # see protocols/HUB_IO_NETWORK.md
+    hub_outbox_flush_interval: float = 0.01  # seconds between outbox group commits
+    hub_outbox_segment_bytes: int = 16 * 1024 * 1024  # rotate outbox segments at this size
+    hub_outbox_retention_bytes: int = 1024 * 1024 * 1024  # beyond this, oldest segments are dropped even if unacked
+
     # Resource-aware model management
     enable_resource_awareness: bool = True
     resource_check_interval: int = 10  # seconds
@@ -67,6 +100,10 @@ class GuildCore:
 
         # Initialize sub-components
         self.task_director = TaskDirector(self.config, self)
+        # Sharded mode: task operations go to directors in worker processes
+        self.task_router = (
+            ShardedTaskRouter(self.config, self) if self.config.task_shards > 1 else None
+        )
         self.agent_coordinator = AgentCoordinator(self.config, self)
         self.batch_orchestrator = BatchOrchestrator(self.config, self)
         self.communication_hub = CommunicationHub(self.config, self)
@@ -90,12 +127,18 @@ class GuildCore:
         # Start sub-components in dependency order
         await self.communication_hub.start()
         await self.workspace_director.start()
-        await self.task_director.start()
+        if self.task_router:
+            await self.task_router.start()
+        else:
+            await self.task_director.start()
         await self.agent_coordinator.start()
         await self.batch_orchestrator.start()
         if self.model_manager:
             await self.model_manager.start()
 
+        # Every component has subscribed; deliver what the last run left queued
+        await self.communication_hub.replay_outbox()
+
         # Start heartbeat monitoring
         self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
 
@@ -122,7 +165,10 @@ class GuildCore:
             await self.model_manager.stop()
         await self.batch_orchestrator.stop()
         await self.agent_coordinator.stop()
-        await self.task_director.stop()
+        if self.task_router:
+            await self.task_router.stop()
+        else:
+            await self.task_director.stop()
         await self.workspace_director.stop()
         await self.communication_hub.stop()
 
@@ -162,7 +208,7 @@ class GuildCore:
             {
                 "timestamp": asyncio.get_event_loop().time(),
                 "health": health_status,
-                "active_tasks": await self.task_director.get_active_count(),
+                "active_tasks": await self.tasks.get_active_count(),
                 "active_agents": await self.agent_coordinator.get_active_count(),
             },
         )
@@ -171,7 +217,7 @@ class GuildCore:
         """Get comprehensive health status of all Guild components"""
         health = {
             "core": {"status": "healthy" if self._running else "stopped"},
-            "task_director": await self.task_director.get_health(),
+            "task_director": await self.tasks.get_health(),
             "agent_coordinator": await self.agent_coordinator.get_health(),
             "batch_orchestrator": await self.batch_orchestrator.get_health(),
             "communication_hub": await self.communication_hub.get_health(),
@@ -185,17 +231,30 @@ class GuildCore:
 
     # Unified API methods that delegate to appropriate sub-components
 
+    @property
+    def tasks(self):
+        """The task router in sharded mode, otherwise the task director"""
+        return self.task_router or self.task_director
+
     async def claim_task(
         self, agent_id: str, task_id: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
         """Claim a task through unified Guild interface"""
-        return await self.task_director.claim_task(agent_id, task_id)
+        return await self.tasks.claim_task(agent_id, task_id)
+
+    async def claim_tasks(self, agent_id: str, count: int) -> List[Dict[str, Any]]:
+        """Claim up to ``count`` tasks through unified Guild interface"""
+        return await self.tasks.claim_tasks(agent_id, count)
 
     async def complete_task(
         self, task_id: str, agent_id: str, result: Dict[str, Any]
     ) -> bool:
         """Complete a task through unified Guild interface"""
-        return await self.task_director.complete_task(task_id, agent_id, result)
+        return await self.tasks.complete_task(task_id, agent_id, result)
+
+    async def create_tasks(self, tasks: List[Dict[str, Any]]) -> List[str]:
+        """Create tasks in bulk through unified Guild interface"""
+        return await self.tasks.create_tasks(tasks)
 
     async def register_agent(self, agent_id: str, capabilities: List[str]) -> bool:
         """Register an agent through unified Guild interface"""
@@ -207,9 +266,9 @@ class GuildCore:
         """Submit batch through unified Guild interface"""
         return await self.batch_orchestrator.submit_batch(task_ids, description)
 
-    async def broadcast_event(self, event_type: str, data: Dict[str, Any]) -> None:
+    async def broadcast_event(self, event_type: str, data: Dict[str, Any]) -> EnqueueResult:
         """Broadcast event through unified Guild interface"""
-        await self.communication_hub.emit_event(event_type, data)
+        return await self.communication_hub.emit_event(event_type, data)
 
     # Model management methods (if model manager is enabled)
 
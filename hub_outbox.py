@@ -0,0 +1,388 @@
+"""
+Guild Hub Outbox - Durable segmented log of Communication Hub messages
+"""
+
+import asyncio
+import bisect
+import json
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from loguru import logger
+
+# length of the body, crc32 of the body, then the body: sequence + JSON payload
+_HEADER = struct.Struct(">II")
+_SEQUENCE = struct.Struct(">Q")
+_SEGMENT_SUFFIX = ".seg"
+
+
+class HubOutbox:
+    """
+    Append-only outbox for hub messages, stored as numbered segment files.
+
+    Layout under ``directory`` (``artifacts/hives/guild/outbox`` by default,
+    see ``protocols/HUB_IO_NETWORK.md``):
+
+        00000000000000000001.seg   records starting at sequence 1
+        00000000000000004097.seg   next segment, named by its first sequence
+        cursors.json               ACK cursor per consumer
+
+    Each record is ``<u32 length><u32 crc32><u64 sequence><json>``; the CRC
+    covers sequence and JSON, so a torn record at the end of the last segment
+    is detected and truncated on open. ``append`` only buffers the record;
+    buffered records are written as one group commit (write + fsync) every
+    ``flush_interval`` seconds. The active segment rotates once it reaches
+    ``segment_bytes``.
+
+    Consumers acknowledge sequences in any order; a consumer's cursor is the
+    highest sequence below which everything is acknowledged, and it is
+    persisted after the records it covers are durable. Closed segments are
+    deleted once every consumer's cursor has passed them, and the oldest
+    segments are dropped regardless once the log exceeds ``retention_bytes``.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        flush_interval: float = 0.01,
+        segment_bytes: int = 16 * 1024 * 1024,
+        retention_bytes: int = 1024 * 1024 * 1024,
+    ):
+        self.directory = Path(directory)
+        self.cursor_path = self.directory / "cursors.json"
+        self.flush_interval = flush_interval
+        self.segment_bytes = max(1024, int(segment_bytes))
+        self.retention_bytes = max(0, int(retention_bytes))
+
+        self.sequence = 0  # last sequence handed out
+        self.durable_sequence = 0  # last sequence written and fsynced
+        self._pending: List[Tuple[int, bytes]] = []
+        self._segments: List[int] = []  # first sequence of each segment, ascending
+        self._segment_sizes: Dict[int, int] = {}
+        self._handle = None
+
+        self._cursors: Dict[str, int] = {}
+        self._acked_ahead: Dict[str, Set[int]] = {}
+        self._cursors_dirty = False
+
+        self._lock = asyncio.Lock()
+        self._opened = False
+        self._running = False
+        self._flush_task: Optional[asyncio.Task] = None
+        self._stats = {"appended": 0, "flushes": 0, "segments_deleted": 0}
+
+    async def start(self) -> None:
+        """Recover the log from disk and start the group commit loop"""
+        if self._running:
+            return
+        await self.open()
+        self._running = True
+        self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Stop the commit loop after a final flush"""
+        if not self._running:
+            return
+        self._running = False
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+        self._close()
+
+    async def open(self) -> None:
+        """Scan segments, truncate a torn tail and load ACK cursors"""
+        if self._opened:
+            return
+        async with self._lock:
+            await asyncio.to_thread(self._recover)
+        self._opened = True
+
+    def register_consumer(self, consumer: str) -> int:
+        """Track a consumer's ACK cursor; new consumers start at the oldest record"""
+        if consumer not in self._cursors:
+            oldest = self._segments[0] - 1 if self._segments else self.sequence
+            self._cursors[consumer] = oldest
+            self._acked_ahead[consumer] = set()
+            self._cursors_dirty = True
+        return self._cursors[consumer]
+
+    def append(self, record: Dict[str, Any]) -> int:
+        """Buffer a record for the next group commit; returns its sequence"""
+        self.sequence += 1
+        body = _SEQUENCE.pack(self.sequence) + json.dumps(
+            record, separators=(",", ":"), default=str
+        ).encode("utf-8")
+        self._pending.append(
+            (self.sequence, _HEADER.pack(len(body), zlib.crc32(body)) + body)
+        )
+        self._stats["appended"] += 1
+        return self.sequence
+
+    def ack(self, consumer: str, sequence: int) -> None:
+        """Acknowledge one sequence for a consumer"""
+        cursor = self._cursors.get(consumer)
+        if cursor is None or sequence <= cursor:
+            return
+        ahead = self._acked_ahead[consumer]
+        if sequence != cursor + 1:
+            ahead.add(sequence)
+            return
+        cursor = sequence
+        while cursor + 1 in ahead:
+            cursor += 1
+            ahead.discard(cursor)
+        self._cursors[consumer] = cursor
+        self._cursors_dirty = True
+
+    def cursor(self, consumer: str) -> Optional[int]:
+        return self._cursors.get(consumer)
+
+    async def replay(self, consumer: str, limit: Optional[int] = None) -> List[Tuple[int, Dict[str, Any]]]:
+        """Durable records after the consumer's cursor, as (sequence, record)"""
+        cursor = self.register_consumer(consumer)
+        async with self._lock:
+            records = await asyncio.to_thread(self._read_after, cursor, limit)
+        # Skip anything acknowledged out of order since the cursor
+        ahead = self._acked_ahead[consumer]
+        return [(seq, record) for seq, record in records if seq not in ahead]
+
+    async def flush(self) -> int:
+        """Group-commit buffered records, then persist ACK cursors"""
+        if not self._pending and not self._cursors_dirty:
+            return 0
+
+        async with self._lock:
+            # Acks only name appended sequences, so cursors taken together
+            # with the pending records never run ahead of this commit
+            cursors = None
+            if self._cursors_dirty:
+                self._cursors_dirty = False
+                cursors = dict(self._cursors)
+            pending, self._pending = self._pending, []
+
+            try:
+                if pending:
+                    await asyncio.to_thread(self._write, pending)
+                    self._stats["flushes"] += 1
+                if cursors is not None:
+                    await asyncio.to_thread(self._write_cursors, cursors)
+            except BaseException:
+                # Whatever did not reach disk goes out with the next flush
+                unwritten = [record for record in pending if record[0] > self.durable_sequence]
+                self._pending = unwritten + self._pending
+                if cursors is not None:
+                    self._cursors_dirty = True
+                raise
+
+            expired = self._expire_segments()
+            if expired:
+                await asyncio.to_thread(self._delete_segments, expired)
+        return len(pending)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "sequence": self.sequence,
+            "durable_sequence": self.durable_sequence,
+            "pending": len(self._pending),
+            "segments": len(self._segments),
+            "bytes": sum(self._segment_sizes.values()),
+            "cursors": dict(self._cursors),
+            **self._stats,
+        }
+
+    async def _flush_loop(self) -> None:
+        while self._running:
+            try:
+                await asyncio.sleep(self.flush_interval)
+                await self.flush()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Hub outbox flush error: {e}")
+
+    def _expire_segments(self) -> List[int]:
+        """Drop closed segments past every cursor or over the retention budget"""
+        acked = min(self._cursors.values()) if self._cursors else 0
+        total = sum(self._segment_sizes.values())
+        expired: List[int] = []
+
+        # The active segment is never expired; a segment ends where the next begins
+        while len(self._segments) > 1:
+            first, last = self._segments[0], self._segments[1] - 1
+            over_budget = self.retention_bytes and total > self.retention_bytes
+            if last > acked and not over_budget:
+                break
+            if last > acked:
+                logger.warning(
+                    f"Hub outbox over retention; dropping unacknowledged records {first}-{last}"
+                )
+                # Nobody can ack the dropped records any more
+                for consumer, cursor in self._cursors.items():
+                    if cursor >= last:
+                        continue
+                    ahead = self._acked_ahead[consumer]
+                    ahead.difference_update([seq for seq in ahead if seq <= last])
+                    cursor = last
+                    while cursor + 1 in ahead:
+                        cursor += 1
+                        ahead.discard(cursor)
+                    self._cursors[consumer] = cursor
+                    self._cursors_dirty = True
+            total -= self._segment_sizes.pop(first)
+            self._segments.pop(0)
+            expired.append(first)
+            self._stats["segments_deleted"] += 1
+        return expired
+
+    # File operations; these run in a worker thread under ``_lock``
+
+    def _segment_path(self, first_sequence: int) -> Path:
+        return self.directory / f"{first_sequence:020d}{_SEGMENT_SUFFIX}"
+
+    def _recover(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._segments = sorted(
+            int(path.stem)
+            for path in self.directory.glob(f"*{_SEGMENT_SUFFIX}")
+            if path.stem.isdigit()
+        )
+        for first in self._segments:
+            self._segment_sizes[first] = self._segment_path(first).stat().st_size
+
+        if self._segments:
+            last = self._segments[-1]
+            path = self._segment_path(last)
+            valid_bytes, last_sequence = self._scan(path)
+            if valid_bytes < self._segment_sizes[last]:
+                logger.warning(
+                    f"Truncating torn outbox record in {path.name} at byte {valid_bytes}"
+                )
+                with open(path, "r+b") as f:
+                    f.truncate(valid_bytes)
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._segment_sizes[last] = valid_bytes
+            self.sequence = last_sequence if last_sequence else last - 1
+        self.durable_sequence = self.sequence
+
+        if self.cursor_path.exists():
+            try:
+                with open(self.cursor_path, "r", encoding="utf-8") as f:
+                    stored = json.load(f)
+                for consumer, cursor in stored.get("cursors", {}).items():
+                    self._cursors[consumer] = min(int(cursor), self.sequence)
+                    self._acked_ahead[consumer] = set()
+            except Exception as e:
+                logger.error(f"Failed to read outbox cursors: {e}")
+
+        logger.debug(
+            f"Hub outbox recovered {len(self._segments)} segments up to sequence {self.sequence}"
+        )
+
+    @staticmethod
+    def _iter_records(f):
+        """Yield (offset_after, sequence, json_bytes) until the first bad record"""
+        offset = 0
+        while True:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return
+            length, crc = _HEADER.unpack(header)
+            body = f.read(length)
+            if len(body) < length or length < _SEQUENCE.size or zlib.crc32(body) != crc:
+                return
+            offset += _HEADER.size + length
+            yield offset, _SEQUENCE.unpack_from(body)[0], body[_SEQUENCE.size:]
+
+    def _scan(self, path: Path) -> Tuple[int, int]:
+        valid_bytes, last_sequence = 0, 0
+        with open(path, "rb") as f:
+            for valid_bytes, last_sequence, _body in self._iter_records(f):
+                pass
+        return valid_bytes, last_sequence
+
+    def _read_after(self, cursor: int, limit: Optional[int]) -> List[Tuple[int, Dict[str, Any]]]:
+        records: List[Tuple[int, Dict[str, Any]]] = []
+        # Start from the segment holding cursor + 1
+        start = max(0, bisect.bisect_right(self._segments, cursor + 1) - 1)
+        for first in self._segments[start:]:
+            with open(self._segment_path(first), "rb") as f:
+                for _offset, sequence, body in self._iter_records(f):
+                    if sequence <= cursor or sequence > self.durable_sequence:
+                        continue
+                    records.append((sequence, json.loads(body)))
+                    if limit is not None and len(records) >= limit:
+                        return records
+        return records
+
+    def _write(self, pending: List[Tuple[int, bytes]]) -> None:
+        chunk: List[bytes] = []
+        chunk_bytes = 0
+        last_sequence = 0
+        for sequence, data in pending:
+            if (
+                not self._segments
+                or self._segment_sizes[self._segments[-1]] + chunk_bytes >= self.segment_bytes
+            ):
+                self._write_chunk(chunk, chunk_bytes, last_sequence)
+                chunk, chunk_bytes = [], 0
+                self._rotate(sequence)
+            chunk.append(data)
+            chunk_bytes += len(data)
+            last_sequence = sequence
+        self._write_chunk(chunk, chunk_bytes, last_sequence)
+
+    def _write_chunk(self, chunk: List[bytes], chunk_bytes: int, last_sequence: int) -> None:
+        if not chunk:
+            return
+        if self._handle is None:
+            self._handle = open(self._segment_path(self._segments[-1]), "ab")
+        offset = self._handle.tell()
+        try:
+            self._handle.write(b"".join(chunk))
+            self._handle.flush()
+            os.fsync(self._handle.fileno())
+        except Exception:
+            # Cut the partial chunk so the retried records are not torn
+            try:
+                self._handle.truncate(offset)
+            except Exception as e:
+                logger.error(f"Failed to truncate hub outbox segment: {e}")
+            self._close()
+            raise
+        self._segment_sizes[self._segments[-1]] += chunk_bytes
+        self.durable_sequence = last_sequence
+
+    def _rotate(self, first_sequence: int) -> None:
+        self._close()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._segments.append(first_sequence)
+        self._segment_sizes[first_sequence] = 0
+        self._handle = open(self._segment_path(first_sequence), "ab")
+
+    def _write_cursors(self, cursors: Dict[str, int]) -> None:
+        tmp_path = self.cursor_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"cursors": cursors}, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.cursor_path)
+
+    def _delete_segments(self, firsts: List[int]) -> None:
+        for first in firsts:
+            try:
+                self._segment_path(first).unlink()
+            except FileNotFoundError:
+                pass
+
+    def _close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
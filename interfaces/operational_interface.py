@@ -17,6 +17,7 @@ from datetime import datetime, timezone
 
 # Import core systems
 from ..core import GuildCore
+from ..task_director import Task
 from ..advanced.resource_aware_model_manager import ResourceAwareModelManager
 from ..schema import (
     TaskPriority,
@@ -185,7 +186,7 @@ class GuildOperationalInterface:
         capabilities = [cap.value for cap in (required_capabilities or [])]
         mode = normalize_execution_mode(execution_mode)
 
-        task_id = await self.guild_core.task_director.create_task(
+        task_id = await self.guild_core.tasks.create_task(
             title=title,
             description=description,
             priority=normalized_priority,
@@ -204,6 +205,42 @@ class GuildOperationalInterface:
         logger.info(f"📝 Task created: {title} (ID: {task_id})")
         return task_id
 
+    async def create_tasks(self, tasks: List[Dict[str, Any]]) -> List[str]:
+        """Create many tasks at once (same fields as create_task)"""
+        specs = []
+        for spec in tasks:
+            mode = normalize_execution_mode(
+                spec.get("execution_mode", ExecutionMode.AUTOMATIC)
+            )
+            specs.append(
+                {
+                    "title": spec["title"],
+                    "description": spec.get("description", ""),
+                    "priority": normalize_task_priority(
+                        spec.get("priority", TaskPriority.MEDIUM)
+                    ),
+                    "capabilities_required": [
+                        cap.value for cap in (spec.get("required_capabilities") or [])
+                    ],
+                    "metadata": {
+                        "estimated_duration": spec.get("estimated_duration", 60),
+                        "execution_mode": mode.value,
+                        "execution_gate": spec.get("execute_gate", False),
+                    },
+                }
+            )
+
+        task_ids = await self.guild_core.tasks.create_tasks(specs)
+
+        if self.mystical_guild:
+            for task_id, spec in zip(task_ids, tasks):
+                await self._enhance_task_mystically(
+                    task_id, spec.get("required_capabilities") or []
+                )
+
+        logger.info(f"📝 {len(task_ids)} tasks created in bulk")
+        return task_ids
+
     async def _enhance_task_mystically(
         self, task_id: str, required_capabilities: List[AgentCapability]
     ):
@@ -250,7 +287,7 @@ class GuildOperationalInterface:
 
     async def get_task(self, task_id: str) -> Optional[SimpleTask]:
         """Get task by ID"""
-        task = await self.guild_core.task_director.get_task(task_id)
+        task = await self.guild_core.tasks.get_task(task_id)
         if not task:
             return None
         return self._to_simple_task(task)
@@ -262,7 +299,7 @@ class GuildOperationalInterface:
         resolved_status = normalize_task_status(status)
         metadata = {"completion_notes": completion_notes} if completion_notes else {}
 
-        updated = await self.guild_core.task_director.set_task_status(
+        updated = await self.guild_core.tasks.set_task_status(
             task_id, resolved_status, metadata=metadata
         )
         if updated and resolved_status == TaskStatus.DONE:
@@ -272,7 +309,7 @@ class GuildOperationalInterface:
 
     async def _record_task_completion(self, task_id: str):
         """Record task completion for performance tracking"""
-        task = await self.guild_core.task_director.get_task(task_id)
+        task = await self.guild_core.tasks.get_task(task_id)
         if not task:
             return
 
@@ -409,16 +446,16 @@ class GuildOperationalInterface:
     async def list_tasks(self, status: Optional[str] = None) -> List[SimpleTask]:
         """List tasks with optional status filter."""
         task_status = normalize_task_status(status) if status else None
-        tasks = await self.guild_core.task_director.list_tasks(status=task_status)
+        tasks = await self.guild_core.tasks.list_tasks(status=task_status)
         return [self._to_simple_task(task) for task in tasks]
 
     async def assign_task_to_agent(self, task_id: str, agent_id: str) -> bool:
         """Assign a task to a specific agent"""
-        task = await self.guild_core.task_director.get_task(task_id)
+        task = await self.guild_core.tasks.get_task(task_id)
         if not task:
             return False
 
-        claimed = await self.guild_core.task_director.claim_task(agent_id, task_id)
+        claimed = await self.guild_core.tasks.claim_task(agent_id, task_id)
         if not claimed:
             return False
 
@@ -426,15 +463,26 @@ class GuildOperationalInterface:
         logger.info(f"🎯 Task {task_id} assigned to {agent_id}")
         return True
 
+    async def claim_tasks(self, agent_id: str, count: int) -> List[SimpleTask]:
+        """Claim up to ``count`` queued tasks for an agent in one pass"""
+        claimed = await self.guild_core.tasks.claim_tasks(agent_id, count)
+        tasks = []
+        for data in claimed:
+            await self.guild_core.agent_coordinator.assign_task(agent_id, data["id"])
+            # The claim already returned each task's state; no second lookup
+            tasks.append(self._to_simple_task(Task.from_dict(data)))
+        logger.info(f"🎯 {len(tasks)} tasks assigned to {agent_id}")
+        return tasks
+
     async def start_execution(self, task_id: str, agent_id: str) -> bool:
         """Start execution after execute gate approval."""
-        return await self.guild_core.task_director.start_execution(task_id, agent_id)
+        return await self.guild_core.tasks.start_execution(task_id, agent_id)
 
     # === INTELLIGENT ROUTING ===
 
     async def auto_assign_task(self, task_id: str) -> bool:
         """Automatically assign task to best available agent"""
-        task = await self.guild_core.task_director.get_task(task_id)
+        task = await self.guild_core.tasks.get_task(task_id)
         if not task:
             return False
 
@@ -445,7 +493,9 @@ class GuildOperationalInterface:
         if mode == ExecutionMode.AGENT_ASSISTED and not task.metadata.get(
             "preferred_role"
         ):
-            task.metadata["preferred_role"] = "merlin"
+            await self.guild_core.tasks.set_task_status(
+                task_id, task.status, metadata={"preferred_role": "merlin"}
+            )
 
         if not task.capabilities_required:
             logger.warning(f"Task {task_id} has no required capabilities")
@@ -467,19 +517,20 @@ class GuildOperationalInterface:
         """Process the task queue continuously"""
         while self._running:
             try:
-                queued_tasks = await self.guild_core.task_director.list_tasks(
-                    status=TaskStatus.QUEUED
-                )
-                if queued_tasks:
-                    priority_order = {
-                        TaskPriority.CRITICAL: 0,
-                        TaskPriority.URGENT: 1,
-                        TaskPriority.HIGH: 2,
-                        TaskPriority.MEDIUM: 3,
-                        TaskPriority.LOW: 4,
-                    }
-                    queued_tasks.sort(key=lambda t: priority_order.get(t.priority, 3))
-                    await self.auto_assign_task(queued_tasks[0].id)
+                # Highest priority first, straight from the director's indexes
+                for priority in (
+                    TaskPriority.CRITICAL,
+                    TaskPriority.URGENT,
+                    TaskPriority.HIGH,
+                    TaskPriority.MEDIUM,
+                    TaskPriority.LOW,
+                ):
+                    queued_tasks = await self.guild_core.tasks.query(
+                        status=TaskStatus.QUEUED, priority=priority
+                    )
+                    if queued_tasks:
+                        await self.auto_assign_task(queued_tasks[0].id)
+                        break
 
                 await asyncio.sleep(5)  # Check every 5 seconds
 
@@ -493,12 +544,9 @@ class GuildOperationalInterface:
 
     async def get_system_status(self) -> Dict[str, Any]:
         """Get comprehensive system status"""
-        tasks = await self.guild_core.task_director.list_tasks()
-        by_status = {status: 0 for status in TaskStatus}
-        for task in tasks:
-            by_status[task.status] += 1
+        by_status = await self.guild_core.tasks.count_by_status()
 
-        total_tasks = len(tasks)
+        total_tasks = sum(by_status.values())
         pending_tasks = by_status[TaskStatus.QUEUED] + by_status[TaskStatus.BLOCKED]
         active_tasks = by_status[TaskStatus.IN_PROGRESS]
         completed_tasks = by_status[TaskStatus.DONE]
@@ -565,7 +613,7 @@ class GuildOperationalInterface:
         if not agent:
             return []
 
-        queued_tasks = await self.guild_core.task_director.list_tasks(
+        queued_tasks = await self.guild_core.tasks.list_tasks(
             status=TaskStatus.QUEUED
         )
 
@@ -635,9 +683,8 @@ class GuildOperationalInterface:
             execute_gate=execute_gate,
         )
 
-        queued_count = len(
-            await self.guild_core.task_director.list_tasks(status=TaskStatus.QUEUED)
-        )
+        by_status = await self.guild_core.tasks.count_by_status()
+        queued_count = by_status[TaskStatus.QUEUED]
 
         return {
             "task_id": task_id,
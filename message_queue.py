@@ -0,0 +1,268 @@
+"""
+Guild Message Queue - Priority-ordered dispatch queue for the communication hub
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+OVERFLOW_POLICIES = ("block", "shed", "coalesce")
+
+
+class EnqueueResult(Enum):
+    """Outcome of handing a message to the hub"""
+
+    QUEUED = "queued"
+    QUEUED_AFTER_WAIT = "queued_after_wait"  # producer was blocked on a full queue
+    QUEUED_SHEDDING = "queued_shedding"  # an older lower-priority message was dropped for it
+    COALESCED = "coalesced"  # merged into a queued message with the same key
+    DROPPED = "dropped"  # queue full; the message itself was not queued
+
+    @property
+    def accepted(self) -> bool:
+        return self is not EnqueueResult.DROPPED
+
+    @property
+    def backpressure(self) -> bool:
+        """True when the producer should slow down"""
+        return self is not EnqueueResult.QUEUED
+
+
+class HubBackpressureError(RuntimeError):
+    """Raised when a message could not be queued and the sender asked to know"""
+
+    def __init__(self, channel: str, result: EnqueueResult):
+        super().__init__(f"Hub channel {channel} is full; message {result.value}")
+        self.channel = channel
+        self.result = result
+
+
+class MessageQueue:
+    """
+    Async queue of hub messages ordered by priority with linear aging.
+
+    A message's key is its enqueue time minus ``aging_seconds`` per priority
+    level above LOW, so URGENT starts ``3 * aging_seconds`` ahead of LOW and a
+    LOW message that has waited longer than that outranks a fresh URGENT one.
+    Keys are fixed at enqueue time, keeping put/get O(log n); messages of the
+    same priority stay FIFO.
+
+    Messages sharing an ``order_key`` are always dispatched in enqueue order:
+    a message never gets a lower key than the last queued message with the
+    same order key, so a HIGH ``task.completed`` cannot overtake its own
+    NORMAL ``task.created``. Priority only reorders unrelated messages.
+
+    With a ``capacity`` the queue applies an overflow policy once full:
+
+        block     the producer waits up to ``block_timeout`` for space, then
+                  the message is dropped (the hub sheds instead when the
+                  producer is a handler dispatched from this same queue)
+        shed      the oldest message of the lowest queued priority is
+                  dropped, provided it ranks no higher than the new message;
+                  otherwise the new message is dropped
+        coalesce  a message whose ``coalesce_key`` matches a queued message
+                  replaces that message's payload in place; without a match
+                  the queue sheds
+
+    Each queue is drained by a single consumer. Recent queue wait times and
+    overflow counters are kept for health reporting; ``on_discard`` is called
+    with every queued message that is shed or coalesced away.
+    """
+
+    WAIT_WINDOW = 1024  # recent waits kept per priority
+
+    def __init__(
+        self,
+        aging_seconds: float = 2.0,
+        capacity: int = 0,
+        overflow: str = "shed",
+        block_timeout: float = 5.0,
+        on_discard: Optional[Callable[[Any], None]] = None,
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unknown hub overflow policy '{overflow}'; expected one of {OVERFLOW_POLICIES}"
+            )
+        self.aging_seconds = max(0.0, float(aging_seconds))
+        self.capacity = max(0, int(capacity))
+        self.overflow = overflow
+        self.block_timeout = max(0.0, float(block_timeout))
+        self._on_discard = on_discard
+
+        # Entries are [key, seq, enqueued, message, level, coalesce_key,
+        # order_key, live]; shed entries are marked dead and skipped on pop
+        self._heap: List[list] = []
+        self._size = 0
+        self._counter = itertools.count()
+        self._fifo: Dict[int, Deque[list]] = {}
+        self._coalesce_index: Dict[str, list] = {}
+        # order_key -> [highest key queued, live entries]; the floor for the
+        # next message with that key, dropped once none are queued
+        self._order_tails: Dict[str, list] = {}
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+
+        self._depth: Dict[int, int] = {}
+        self._waits: Dict[int, Deque[float]] = {}
+        self.counters: Dict[str, int] = {
+            "blocked": 0,
+            "shed": 0,
+            "coalesced": 0,
+            "dropped": 0,
+        }
+
+    def qsize(self) -> int:
+        return self._size
+
+    def empty(self) -> bool:
+        return not self._size
+
+    def full(self) -> bool:
+        return bool(self.capacity) and self._size >= self.capacity
+
+    def put_nowait(
+        self,
+        message,
+        coalesce_key: Optional[str] = None,
+        order_key: Optional[str] = None,
+    ) -> EnqueueResult:
+        """Enqueue a message, applying the overflow policy if full (never blocks)"""
+        if coalesce_key and self.overflow == "coalesce" and self.full():
+            entry = self._coalesce_index.get(coalesce_key)
+            if entry is not None and entry[-1]:
+                # Keep the queued slot, deliver the latest state
+                replaced, entry[3] = entry[3], message
+                self.counters["coalesced"] += 1
+                if self._on_discard:
+                    self._on_discard(replaced)
+                return EnqueueResult.COALESCED
+
+        result = EnqueueResult.QUEUED
+        if self.full():
+            if not self._shed_for(message.priority.value):
+                self.counters["dropped"] += 1
+                return EnqueueResult.DROPPED
+            result = EnqueueResult.QUEUED_SHEDDING
+
+        self._push(message, coalesce_key, order_key)
+        return result
+
+    async def put(
+        self,
+        message,
+        coalesce_key: Optional[str] = None,
+        order_key: Optional[str] = None,
+    ) -> EnqueueResult:
+        """Enqueue a message; under the block policy, wait for space first"""
+        if self.overflow != "block" or not self.full():
+            return self.put_nowait(message, coalesce_key, order_key)
+
+        self.counters["blocked"] += 1
+        deadline = time.monotonic() + self.block_timeout
+        while self.full():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.counters["dropped"] += 1
+                return EnqueueResult.DROPPED
+            self._not_full.clear()
+            try:
+                await asyncio.wait_for(self._not_full.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+        self._push(message, coalesce_key, order_key)
+        return EnqueueResult.QUEUED_AFTER_WAIT
+
+    def get_nowait(self):
+        """Dequeue the highest-ranked message; raises ``asyncio.QueueEmpty``"""
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            if entry[-1]:
+                break
+        else:
+            raise asyncio.QueueEmpty
+
+        self._remove(entry)
+        fifo = self._fifo[entry[4]]
+        while fifo and not fifo[0][-1]:
+            fifo.popleft()
+
+        waits = self._waits.get(entry[4])
+        if waits is None:
+            waits = self._waits[entry[4]] = deque(maxlen=self.WAIT_WINDOW)
+        waits.append(time.monotonic() - entry[2])
+        return entry[3]
+
+    async def get(self):
+        while not self._size:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self.get_nowait()
+
+    def depth_by_priority(self) -> Dict[int, int]:
+        """Queued message count per priority level"""
+        return {level: count for level, count in self._depth.items() if count}
+
+    def recent_waits(self) -> Dict[int, List[float]]:
+        """Recent queue wait times in seconds per priority level"""
+        return {level: list(waits) for level, waits in self._waits.items()}
+
+    def _push(self, message, coalesce_key: Optional[str], order_key: Optional[str]) -> None:
+        level = message.priority.value
+        now = time.monotonic()
+        key = now - (level - 1) * self.aging_seconds
+        if order_key is not None:
+            tail = self._order_tails.get(order_key)
+            if tail is None:
+                self._order_tails[order_key] = [key, 1]
+            else:
+                key = max(key, tail[0])
+                tail[0] = key
+                tail[1] += 1
+        entry = [key, next(self._counter), now, message, level, coalesce_key, order_key, True]
+        heapq.heappush(self._heap, entry)
+        self._fifo.setdefault(level, deque()).append(entry)
+        if coalesce_key and self.overflow == "coalesce":
+            self._coalesce_index[coalesce_key] = entry
+        self._depth[level] = self._depth.get(level, 0) + 1
+        self._size += 1
+        self._not_empty.set()
+
+    def _remove(self, entry: list) -> None:
+        entry[-1] = False
+        self._depth[entry[4]] -= 1
+        self._size -= 1
+        if entry[5] and self._coalesce_index.get(entry[5]) is entry:
+            del self._coalesce_index[entry[5]]
+        if entry[6] is not None:
+            tail = self._order_tails[entry[6]]
+            tail[1] -= 1
+            if not tail[1]:
+                del self._order_tails[entry[6]]
+        if not self.full():
+            self._not_full.set()
+
+    def _shed_for(self, level: int) -> bool:
+        """Drop the oldest queued message ranked at or below ``level``"""
+        for victim_level in sorted(self._fifo):
+            if victim_level > level:
+                break
+            fifo = self._fifo[victim_level]
+            while fifo and not fifo[0][-1]:
+                fifo.popleft()
+            if fifo:
+                victim = fifo.popleft()
+                self._remove(victim)
+                self.counters["shed"] += 1
+                if self._on_discard:
+                    self._on_discard(victim[3])
+                # Shed entries stay in the heap until popped; rebuild if they pile up
+                if len(self._heap) > 64 and len(self._heap) > 2 * self._size:
+                    self._heap = [entry for entry in self._heap if entry[-1]]
+                    heapq.heapify(self._heap)
+                return True
+        return False
@@ -4,8 +4,9 @@ Shared Guild schema definitions.
 
 from __future__ import annotations
 
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional
+from typing import Any, Optional
 
 
 class TaskStatus(Enum):
@@ -155,3 +156,21 @@ def normalize_execution_mode(value: str | ExecutionMode | None) -> ExecutionMode
         "assisted": ExecutionMode.AGENT_ASSISTED,
     }
     return alias_map.get(normalized, ExecutionMode.AUTOMATIC)
+
+
+def normalize_timestamp(value: Any) -> Optional[float]:
+    """Convert an ISO-8601 string, datetime or number to epoch seconds"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    return None
@@ -0,0 +1,133 @@
+"""
+Guild Task Archive - Cold storage tier for terminal tasks
+"""
+
+import json
+import sqlite3
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from pathlib import Path
+from loguru import logger
+
+
+class TaskArchive:
+    """
+    SQLite-backed cold tier for DONE/CANCELLED tasks.
+
+    Full task records (history and results included) live on disk. Only a
+    stub index of task ID -> status stays in memory so dependency checks and
+    ID allocation still account for archived tasks. Execution history
+    entries evicted from a live task's in-memory ring are kept here too.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._index: Dict[str, str] = {}  # task_id -> status value
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._index
+
+    def open(self) -> None:
+        """Create the store if needed and load the stub index"""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS archived_tasks (
+                    id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    completed_at TEXT,
+                    data TEXT NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS task_history (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    task_id TEXT NOT NULL,
+                    entry TEXT NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_task_history_task ON task_history (task_id)"
+            )
+            self._index = dict(conn.execute("SELECT id, status FROM archived_tasks"))
+        logger.debug(f"Task archive opened with {len(self._index)} tasks")
+
+    def status(self, task_id: str) -> Optional[str]:
+        return self._index.get(task_id)
+
+    def ids(self) -> Iterable[str]:
+        return self._index.keys()
+
+    def archive(self, tasks: List[Dict[str, Any]]) -> None:
+        """Write task dicts to cold storage in one transaction"""
+        rows = [
+            (
+                task["id"],
+                task["status"],
+                task.get("completed_at"),
+                json.dumps(task, separators=(",", ":")),
+            )
+            for task in tasks
+        ]
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO archived_tasks (id, status, completed_at, data) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+        for task_id, status, _, _ in rows:
+            self._index[task_id] = status
+
+    def remove(self, task_ids: List[str]) -> None:
+        """Drop archived records, e.g. for tasks that changed while archiving"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                "DELETE FROM archived_tasks WHERE id = ?", [(task_id,) for task_id in task_ids]
+            )
+        for task_id in task_ids:
+            self._index.pop(task_id, None)
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        if task_id not in self._index:
+            return None
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT data FROM archived_tasks WHERE id = ?", (task_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def load_all(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        with sqlite3.connect(self.db_path) as conn:
+            if status is None:
+                rows = conn.execute("SELECT data FROM archived_tasks")
+            else:
+                rows = conn.execute(
+                    "SELECT data FROM archived_tasks WHERE status = ?", (status,)
+                )
+            return [json.loads(row[0]) for row in rows]
+
+    def spill_history(self, entries: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """Append evicted (task_id, history entry) pairs in one transaction"""
+        rows = [
+            (task_id, json.dumps(entry, separators=(",", ":")))
+            for task_id, entry in entries
+        ]
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                "INSERT INTO task_history (task_id, entry) VALUES (?, ?)", rows
+            )
+
+    def get_history(self, task_id: str) -> List[Dict[str, Any]]:
+        """Spilled history entries for a task, oldest first"""
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                "SELECT entry FROM task_history WHERE task_id = ? ORDER BY seq",
+                (task_id,),
+            )
+            return [json.loads(row[0]) for row in rows]
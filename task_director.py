@@ -3,15 +3,24 @@ Guild Task Director - Unified task lifecycle management
 """
 
 import asyncio
-from typing import Dict, Any, List, Optional, Set, Tuple
-from dataclasses import dataclass, field
+import inspect
+import json
+import os
+import re
+import sys
+import time
+from typing import Dict, Any, Iterator, List, Optional, Set, Tuple, Union
 from enum import Enum
 from pathlib import Path
 from loguru import logger
 from datetime import datetime, timezone
-import json
 
 from .communication_hub import CommunicationChannel, MessagePriority
+from .task_queue import PartitionedReadyQueue
+from .task_scheduling import SchedulingPolicy, create_scheduling_policy
+from .task_graph import DependencyAnalytics, DependencyCycleError
+from .task_journal import TaskJournal
+from .task_archive import TaskArchive
 from .schema import (
     TaskStatus,
     TaskPriority,
@@ -19,34 +28,219 @@ from .schema import (
     normalize_task_priority,
     normalize_task_status,
     normalize_execution_mode,
+    normalize_timestamp,
+)
+
+
+BOARD_HEADER = "| ID | Priority | Title | Depends On | Status | Assignee | Created | Updated | Mode | Approvals | Preferred Role | Domain |\n"
+BOARD_SEPARATOR = "| --- | --- | --- | --- | --- | --- | --- | --- | --- | --- | --- | --- |\n"
+# Board header labels whose row key differs from the lowercased label
+BOARD_COLUMNS = {
+    "depends on": "depends_on",
+    "mode": "execution_mode",
+    "preferred role": "preferred_role",
+}
+
+
+# Metadata values repeated across many tasks; interned so each is stored once
+INTERNED_METADATA_KEYS = ("execution_mode", "preferred_role", "domain")
+# Attributes with a value -> task IDs secondary index (see TaskDirector.query)
+TASK_INDEX_FIELDS = ("priority", "domain", "preferred_role", "execution_mode")
+# Terminal states that cascade to dependents, and the states they cascade into
+FAILED_STATUSES = (TaskStatus.FAILED, TaskStatus.CANCELLED)
+WAITING_STATUSES = (TaskStatus.QUEUED, TaskStatus.BLOCKED)
+# Critical-path estimate for tasks with no estimate and no completion history
+DEFAULT_TASK_DURATION_SECONDS = 3600.0
+
+
+def _to_iso(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+TASK_SPEC_KEYS = (
+    "title",
+    "description",
+    "priority",
+    "dependencies",
+    "capabilities_required",
+    "metadata",
 )
 
 
-@dataclass
+def validate_task_spec(spec: Dict[str, Any]) -> None:
+    """Raise ``ValueError`` unless ``spec`` is a usable ``create_tasks`` entry"""
+    if not isinstance(spec, dict):
+        raise ValueError(f"Task spec must be a dict, got {type(spec).__name__}")
+    if "task_id" in spec:
+        raise ValueError("create_tasks allocates task IDs; remove task_id from the spec")
+    unknown = set(spec) - set(TASK_SPEC_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown task spec keys: {sorted(unknown)}")
+    for key in ("title", "description"):
+        if not isinstance(spec.get(key), str):
+            raise ValueError(f"Task spec needs a string {key}")
+    if "priority" in spec and not isinstance(spec["priority"], (str, TaskPriority)):
+        raise ValueError(f"Invalid task priority {spec['priority']!r}")
+    metadata = spec.get("metadata")
+    if metadata is not None and not isinstance(metadata, dict):
+        raise ValueError("Task spec metadata must be a dict")
+
+
 class Task:
-    """Enhanced task representation with full lifecycle tracking"""
-
-    id: str
-    title: str
-    description: str
-    status: TaskStatus
-    priority: TaskPriority
-    assignee: Optional[str] = None
-    dependencies: List[str] = field(default_factory=list)
-    capabilities_required: List[str] = field(default_factory=list)
-    created_at: str = field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat()
-    )
-    updated_at: str = field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat()
+    """
+    Enhanced task representation with full lifecycle tracking.
+
+    Slotted to avoid a per-instance ``__dict__``. Timestamps are held as
+    epoch floats (``created_ts`` etc.) and exposed as ISO-8601 strings
+    through the ``*_at`` properties; assignee and the common metadata
+    strings are interned, and ``execution_history`` is only allocated once
+    something is recorded.
+    """
+
+    __slots__ = (
+        "id",
+        "title",
+        "description",
+        "status",
+        "priority",
+        "_assignee",
+        "dependencies",
+        "capabilities_required",
+        "created_ts",
+        "updated_ts",
+        "claimed_ts",
+        "completed_ts",
+        "metadata",
+        "_history",
     )
-    claimed_at: Optional[str] = None
-    completed_at: Optional[str] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
-    execution_history: List[Dict[str, Any]] = field(default_factory=list)
 
-    def to_dict(self) -> Dict[str, Any]:
-        return {
+    def __init__(
+        self,
+        id: str,
+        title: str,
+        description: str,
+        status: TaskStatus,
+        priority: TaskPriority,
+        assignee: Optional[str] = None,
+        dependencies: Optional[List[str]] = None,
+        capabilities_required: Optional[List[str]] = None,
+        created_at: Any = None,
+        updated_at: Any = None,
+        claimed_at: Any = None,
+        completed_at: Any = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        execution_history: Optional[List[Dict[str, Any]]] = None,
+    ):
+        now = time.time()
+        self.id = sys.intern(id)
+        self.title = title
+        self.description = description
+        self.status = status
+        self.priority = priority
+        self.assignee = assignee
+        self.dependencies = dependencies if dependencies is not None else []
+        self.capabilities_required = (
+            capabilities_required if capabilities_required is not None else []
+        )
+        self.created_ts = now if created_at is None else normalize_timestamp(created_at)
+        self.updated_ts = now if updated_at is None else normalize_timestamp(updated_at)
+        self.claimed_ts = normalize_timestamp(claimed_at)
+        self.completed_ts = normalize_timestamp(completed_at)
+        self.metadata = metadata if metadata is not None else {}
+        self.intern_metadata()
+        self._history = execution_history or None
+
+    def __repr__(self) -> str:
+        return (
+            f"Task(id={self.id!r}, title={self.title!r}, "
+            f"status={self.status.value}, priority={self.priority.value})"
+        )
+
+    @property
+    def assignee(self) -> Optional[str]:
+        return self._assignee
+
+    @assignee.setter
+    def assignee(self, value: Optional[str]) -> None:
+        self._assignee = _intern(value)
+
+    @property
+    def created_at(self) -> str:
+        return _to_iso(self.created_ts) or ""
+
+    @created_at.setter
+    def created_at(self, value: Any) -> None:
+        self.created_ts = normalize_timestamp(value)
+
+    @property
+    def updated_at(self) -> str:
+        return _to_iso(self.updated_ts) or ""
+
+    @updated_at.setter
+    def updated_at(self, value: Any) -> None:
+        self.updated_ts = normalize_timestamp(value)
+
+    @property
+    def claimed_at(self) -> Optional[str]:
+        return _to_iso(self.claimed_ts)
+
+    @claimed_at.setter
+    def claimed_at(self, value: Any) -> None:
+        self.claimed_ts = normalize_timestamp(value)
+
+    @property
+    def completed_at(self) -> Optional[str]:
+        return _to_iso(self.completed_ts)
+
+    @completed_at.setter
+    def completed_at(self, value: Any) -> None:
+        self.completed_ts = normalize_timestamp(value)
+
+    @property
+    def execution_history(self) -> List[Dict[str, Any]]:
+        if self._history is None:
+            self._history = []
+        return self._history
+
+    @execution_history.setter
+    def execution_history(self, value: Optional[List[Dict[str, Any]]]) -> None:
+        self._history = value or None
+
+    def record_event(self, entry: Dict[str, Any], limit: int = 0) -> List[Dict[str, Any]]:
+        """
+        Append a history entry, keeping at most ``limit`` (0 = unbounded).
+
+        Returns the oldest entries pushed out of the ring so the caller can
+        spill them to cold storage.
+        """
+        history = self.execution_history
+        history.append(entry)
+        if limit <= 0 or len(history) <= limit:
+            return []
+        evicted = history[: len(history) - limit]
+        del history[: len(history) - limit]
+        return evicted
+
+    def touch(self) -> float:
+        """Set ``updated_ts`` to now and return it"""
+        self.updated_ts = time.time()
+        return self.updated_ts
+
+    def intern_metadata(self) -> None:
+        for key in INTERNED_METADATA_KEYS:
+            value = self.metadata.get(key)
+            if isinstance(value, str):
+                self.metadata[key] = sys.intern(value)
+
+    def to_dict(self, include_history: bool = True) -> Dict[str, Any]:
+        """Serialize the task; hot paths can leave ``execution_history`` out"""
+        data = {
             "id": self.id,
             "title": self.title,
             "description": self.description,
@@ -60,8 +254,66 @@ class Task:
             "claimed_at": self.claimed_at,
             "completed_at": self.completed_at,
             "metadata": self.metadata,
-            "execution_history": self.execution_history,
         }
+        if include_history:
+            data["execution_history"] = self._history or []
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Task":
+        return cls(
+            id=data["id"],
+            title=data.get("title", ""),
+            description=data.get("description", ""),
+            status=normalize_task_status(data.get("status", "queued")),
+            priority=normalize_task_priority(data.get("priority", "medium")),
+            assignee=data.get("assignee"),
+            dependencies=list(data.get("dependencies") or []),
+            capabilities_required=list(data.get("capabilities_required") or []),
+            created_at=data.get("created_at") or "",
+            updated_at=data.get("updated_at") or "",
+            claimed_at=data.get("claimed_at"),
+            completed_at=data.get("completed_at"),
+            metadata=dict(data.get("metadata") or {}),
+            execution_history=list(data.get("execution_history") or []),
+        )
+
+
+class TaskIdAllocator:
+    """
+    Monotonic ``AAS-NNN`` task ID allocator.
+
+    Allocation is a counter increment with no awaits, so concurrent
+    ``create_task`` coroutines can never receive the same ID. The high-water
+    mark is handed to ``persist`` (the journal coalesces it into the next
+    group commit) so reserved blocks survive a restart, and ``observe`` keeps
+    the counter ahead of IDs loaded from the board or journal.
+    """
+
+    ID_PATTERN = re.compile(r"^AAS-(\d+)")
+
+    def __init__(self, persist):
+        self._persist = persist
+        self._next = 1
+
+    def restore(self, sequence: int) -> None:
+        """Resume from a persisted high-water mark"""
+        self._next = max(self._next, sequence)
+
+    def observe(self, task_id: str) -> None:
+        match = self.ID_PATTERN.match(task_id)
+        if match:
+            self._next = max(self._next, int(match.group(1)) + 1)
+
+    def allocate(self) -> str:
+        return self.reserve(1)[0]
+
+    def reserve(self, count: int) -> List[str]:
+        """Reserve a contiguous block of IDs (e.g. for bulk imports)"""
+        start = self._next
+        self._next += count
+        self._persist(self._next)
+        return [f"AAS-{seq:03d}" for seq in range(start, start + count)]
 
 
 class TaskDirector:
@@ -88,15 +340,83 @@ class TaskDirector:
             status: set() for status in TaskStatus
         }
         self._task_index_by_assignee: Dict[str, Set[str]] = {}
+        self._task_index_by_field: Dict[str, Dict[Any, Set[str]]] = {
+            field_name: {} for field_name in TASK_INDEX_FIELDS
+        }
         self._dependency_graph: Dict[str, Set[str]] = {}  # task_id -> dependents
+        self._unmet_dependencies: Dict[str, int] = {}  # task_id -> unmet count
+
+        # Topologically ordered view of the same edges for cycle checks and
+        # critical-path analysis (refreshed on the sync loop)
+        self._dag = DependencyAnalytics()
+        self._dependency_cycles: Dict[str, List[str]] = {}  # task_id -> cycle
+        self._critical_path: List[str] = []
+        self._critical_path_seconds = 0.0
+        self._critical_tasks: Set[str] = set()
+        self._critical_path_boost = config.task_critical_path_boost
+        self._duration_stats: Dict[Optional[str], List[float]] = {}  # domain -> [n, total]
+
+        # Queued tasks whose dependencies are met, partitioned by required
+        # capabilities and ordered for claiming
+        self._ready_queue = PartitionedReadyQueue()
+        # Policy that turns a ready task into its queue sort key
+        try:
+            self._scheduler = create_scheduling_policy(
+                config.task_scheduling_policy, config
+            )
+        except ValueError as e:
+            logger.error(f"{e}; falling back to strict priority")
+            self._scheduler = create_scheduling_policy("strict", config)
+        # Queued tasks waiting on claim-gate approval (task_id -> gate); kept
+        # out of the ready queue until an approval update arrives
+        self._parked_approvals: Dict[str, str] = {}
+        # Tasks selected by a claimer that is awaiting execute-gate approval,
+        # and claims that lost a race to a concurrent claimer
+        self._claims_in_flight: Set[str] = set()
+        self._claim_conflicts = 0
+        # Dependents of a FAILED/CANCELLED task under the "orphan" cascade
+        # policy (task_id -> failed root); kept out of the ready queue until
+        # the root is retried
+        self._failure_cascade = config.task_failure_cascade
+        self._orphaned: Dict[str, str] = {}
+        self._orphans_by_root: Dict[str, Set[str]] = {}
+        # Sharded mode: statuses of dependencies owned by other shards, as
+        # pushed by the router (None when this director owns every task)
+        self._remote_status: Optional[Dict[str, TaskStatus]] = None
 
         # Task board integration
         self.task_board_path = Path(config.task_board_path)
+        self._board_version = 0  # bumped on every task change
+        self._board_synced_version = -1  # version last written to disk
+        self._board_dirty: Set[str] = set()
+        self._board_rows: Dict[str, str] = {}  # task_id -> rendered row
+        self._board_order: Optional[List[str]] = None  # sorted IDs
+
+        # Database integration: tasks changed since the last successful sync
+        self._db_dirty: Set[str] = set()
 
         # Synchronization
         self._sync_task: Optional[asyncio.Task] = None
         self._sync_interval = 30  # seconds
 
+        # Durable state: snapshot + write-ahead log of task mutations
+        self._journal = TaskJournal(
+            Path(config.artifact_dir),
+            serialize_task=self._serialize_task,
+            serialize_state=self._serialize_state,
+            flush_interval=config.task_journal_flush_interval,
+            compact_threshold=config.task_journal_compact_threshold,
+        )
+        self._id_allocator = TaskIdAllocator(self._journal.record_sequence)
+
+        # Cold tier: terminal tasks older than the cutoff leave memory
+        self._archive = TaskArchive(Path(config.artifact_dir) / "task_archive.db")
+        self._archive_after = config.task_archive_after_seconds
+
+        # Per-task history ring; older entries are spilled to the archive
+        self._history_limit = config.task_history_limit
+        self._history_spill: List[Tuple[str, Dict[str, Any]]] = []
+
         logger.info("Task Director initialized")
 
     async def start(self) -> None:
@@ -108,6 +428,7 @@ class TaskDirector:
 
         # Load existing tasks
         await self._load_tasks()
+        await self._journal.start()
 
         # Start synchronization
         self._sync_task = asyncio.create_task(self._sync_loop())
@@ -141,65 +462,199 @@ class TaskDirector:
     async def _load_tasks(self) -> None:
         """Load tasks from task board and database"""
         try:
-            # Load from Markdown task board (existing format)
-            if self.task_board_path.exists():
-                await self._load_from_markdown()
+            # Archived IDs are never reloaded into the hot tier
+            try:
+                self._archive.open()
+                for task_id in self._archive.ids():
+                    self._id_allocator.observe(task_id)
+            except Exception as e:
+                logger.error(f"Failed to open task archive: {e}")
 
             # Load from database if available
             if self.guild_core.hub and hasattr(self.guild_core.hub, "db"):
                 await self._load_from_database()
 
+            # Snapshot + WAL hold everything this director wrote
+            await self._load_from_journal()
+
+            # The Markdown task board (existing format) is applied on top
+            # when it was edited since this director last wrote it
+            from_board = False
+            if self.task_board_path.exists():
+                from_board = await self._load_from_markdown()
+
+            # Fold board changes into the snapshot so the next start can
+            # skip a board this director rewrote
+            if from_board:
+                await self._journal.compact()
+                self._write_board_stamp()
+
             logger.info(f"Loaded {len(self._tasks)} tasks")
 
         except Exception as e:
             logger.error(f"Failed to load tasks: {e}")
 
-    async def _load_from_markdown(self) -> None:
-        """Load tasks from existing Markdown task board"""
+    async def _load_from_markdown(self) -> bool:
+        """
+        Load tasks from the Markdown task board.
+
+        Rows are parsed one line at a time and indexed as they stream in.
+        The board's mtime and size are stamped once its tasks are in the
+        journal snapshot (and after every board write), so a restart against
+        an unchanged board skips parsing it entirely.
+
+        An edited board is the source of truth for the columns it carries:
+        rows for unknown tasks are added and rows that differ from the
+        journal are applied on top of it, unless the journal updated the
+        task after the row was written (a board left stale by a crash).
+        Returns True when tasks were taken from the board.
+        """
         try:
-            # Use existing GuildManager parsing logic
-            from core.guild_manager import GuildManager
+            unchanged = self._board_stamp() == self._read_board_stamp()
+            if unchanged and self._journal.has_state():
+                logger.debug("Task board unchanged; using journal state")
+                return False
 
-            guild_manager = GuildManager(config=self.config)
-            lines, tasks, status_map = guild_manager.parse_board()
+            loaded = 0
+            for task_data in self._iter_board_rows():
+                task = self._task_from_board_row(task_data)
+                if not task.id or task.id in self._archive:
+                    continue
+                existing = self._tasks.get(task.id)
+                if existing is not None:
+                    task = self._merge_board_row(existing, task)
+                    if task is None:
+                        continue
+                self._index_task(task)
+                loaded += 1
+            if loaded:
+                logger.info(f"Applied {loaded} task rows from the edited task board")
+            return loaded > 0
 
-            for task_data in tasks:
-                metadata = {
-                    "execution_mode": task_data.get("execution_mode") or "automatic",
-                    "approvals": self._parse_approvals(task_data.get("approvals", "")),
-                }
-                preferred_role = task_data.get("preferred_role")
-                if preferred_role and preferred_role != "-":
-                    metadata["preferred_role"] = preferred_role
-                domain = task_data.get("domain")
-                if domain and domain != "-":
-                    metadata["domain"] = domain
-
-                task = Task(
-                    id=task_data.get("id", ""),
-                    title=task_data.get("title", ""),
-                    description=task_data.get("description", ""),
-                    status=normalize_task_status(task_data.get("status", "queued")),
-                    priority=normalize_task_priority(
-                        task_data.get("priority", "medium")
-                    ),
-                    assignee=(
-                        task_data.get("assignee")
-                        if task_data.get("assignee") != "-"
-                        else None
-                    ),
-                    dependencies=self._parse_dependencies(
-                        task_data.get("depends_on", "")
-                    ),
-                    created_at=task_data.get("created", ""),
-                    updated_at=task_data.get("updated", ""),
-                    metadata=metadata,
-                )
+        except Exception as e:
+            logger.error(f"Failed to load from Markdown: {e}")
+            return False
+
+    def _iter_board_rows(self) -> Iterator[Dict[str, str]]:
+        """Stream task rows from the board as dicts keyed by column"""
+        columns: Optional[List[str]] = None
+        with open(self.task_board_path, "r", encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line.startswith("|"):
+                    columns = None  # a table ends at the first non-row line
+                    continue
+                cells = [cell.strip() for cell in line.strip("|").split("|")]
+                if columns is None:
+                    if cells and cells[0].lower() == "id":
+                        columns = [
+                            BOARD_COLUMNS.get(cell.lower(), cell.lower())
+                            for cell in cells
+                        ]
+                    continue
+                if all(set(cell) <= set("-: ") for cell in cells):
+                    continue  # separator row
+                yield dict(zip(columns, cells))
+
+    def _board_stamp(self) -> List[int]:
+        stat = self.task_board_path.stat()
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def _read_board_stamp(self) -> Optional[List[int]]:
+        try:
+            with open(self._board_stamp_path(), "r", encoding="utf-8") as handle:
+                return json.load(handle).get("board")
+        except (OSError, ValueError):
+            return None
 
-                await self._add_task_internal(task)
+    def _write_board_stamp(self) -> None:
+        """Record that the board's current contents are in the journal"""
+        path = self._board_stamp_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump({"board": self._board_stamp()}, handle)
 
+    def _board_stamp_path(self) -> Path:
+        return Path(self.config.artifact_dir) / "task_board_stamp.json"
+
+    def _task_from_board_row(self, task_data: Dict[str, str]) -> Task:
+        metadata = {
+            "execution_mode": task_data.get("execution_mode") or "automatic",
+            "approvals": self._parse_approvals(task_data.get("approvals", "")),
+        }
+        preferred_role = task_data.get("preferred_role")
+        if preferred_role and preferred_role != "-":
+            metadata["preferred_role"] = preferred_role
+        domain = task_data.get("domain")
+        if domain and domain != "-":
+            metadata["domain"] = domain
+
+        return Task(
+            id=task_data.get("id", ""),
+            title=task_data.get("title", ""),
+            description=task_data.get("description", ""),
+            status=normalize_task_status(task_data.get("status", "queued")),
+            priority=normalize_task_priority(task_data.get("priority", "medium")),
+            assignee=(
+                task_data.get("assignee")
+                if task_data.get("assignee") not in (None, "", "-")
+                else None
+            ),
+            dependencies=self._parse_dependencies(task_data.get("depends_on", "")),
+            created_at=task_data.get("created", ""),
+            updated_at=task_data.get("updated", ""),
+            metadata=metadata,
+        )
+
+    def _merge_board_row(self, task: Task, row: Task) -> Optional[Task]:
+        """Return a copy of ``task`` with the board row's columns, or None if unchanged"""
+        if (
+            task.updated_ts is not None
+            and row.updated_ts is not None
+            and task.updated_ts > row.updated_ts + 0.001
+        ):
+            return None  # the journal is newer than this row
+
+        changes: Dict[str, Any] = {}
+        if row.title != task.title.replace("|", "/"):
+            changes["title"] = row.title
+        for field_name in ("status", "priority", "assignee", "dependencies"):
+            if getattr(row, field_name) != getattr(task, field_name):
+                changes[field_name] = getattr(row, field_name)
+
+        metadata: Dict[str, Any] = {}
+        for key in ("execution_mode", "preferred_role", "domain"):
+            if key in row.metadata and row.metadata[key] != task.metadata.get(key):
+                metadata[key] = row.metadata[key]
+        approvals = task.metadata.get("approvals")
+        approvals = dict(approvals) if isinstance(approvals, dict) else {}
+        approvals_changed = False
+        for gate, info in row.metadata.get("approvals", {}).items():
+            current = approvals.get(gate) if isinstance(approvals.get(gate), dict) else {}
+            if current.get("status") != info["status"]:
+                approvals[gate] = {**current, "status": info["status"]}
+                approvals_changed = True
+        if approvals_changed:
+            metadata["approvals"] = approvals
+
+        if not changes and not metadata:
+            return None
+
+        merged = Task.from_dict(task.to_dict())
+        for field_name, value in changes.items():
+            setattr(merged, field_name, value)
+        merged.metadata.update(metadata)
+        return merged
+
+    async def _load_from_journal(self) -> None:
+        """Replay persisted snapshot and write-ahead log"""
+        try:
+            for data in self._journal.load().values():
+                if data.get("id") not in self._archive:
+                    self._index_task(Task.from_dict(data))
+            self._id_allocator.restore(self._journal.sequence)
         except Exception as e:
-            logger.error(f"Failed to load from Markdown: {e}")
+            logger.error(f"Failed to load from task journal: {e}")
 
     async def _load_from_database(self) -> None:
         """Load tasks from database"""
@@ -230,11 +685,30 @@ class TaskDirector:
 
     async def _add_task_internal(self, task: Task) -> None:
         """Add task to internal storage and indexes"""
+        self._index_task(task)
+
+    def _index_task(self, task: Task) -> None:
         self._ensure_task_metadata(task)
+        self._trim_history(task)
+        previous = self._tasks.get(task.id)
+        if previous is not None and previous is not task:
+            # The replacement may carry new dependencies and a new sort key,
+            # so drop the old edges, queue entry and orphan mark; they are
+            # rebuilt below from the new object
+            self._unindex_task(previous)
+            self._unlink_dependencies(previous)
+            self._ready_queue.discard(task.id)
+            if task.id in self._orphaned:
+                self._orphans_by_root.get(self._orphaned.pop(task.id), set()).discard(task.id)
         self._tasks[task.id] = task
+        self._id_allocator.observe(task.id)
+        self._mark_dirty(task.id)
+        if previous is None:
+            self._board_order = None
 
         # Update indexes
         self._task_index_by_status[task.status].add(task.id)
+        self._index_attributes(task)
 
         if task.assignee:
             if task.assignee not in self._task_index_by_assignee:
@@ -242,10 +716,361 @@ class TaskDirector:
             self._task_index_by_assignee[task.assignee].add(task.id)
 
         # Update dependency graph
+        self._dag.add_node(task.id)
         for dep_id in task.dependencies:
             if dep_id not in self._dependency_graph:
                 self._dependency_graph[dep_id] = set()
             self._dependency_graph[dep_id].add(task.id)
+            try:
+                self._dag.add_edge(dep_id, task.id)
+            except DependencyCycleError as e:
+                self._dependency_cycles[task.id] = e.cycle
+                logger.warning(f"Task {task.id}: {e}")
+
+        if task.status == TaskStatus.DONE and (
+            previous is None or previous.status != TaskStatus.DONE
+        ):
+            self._observe_duration(task)
+
+        # Count unmet dependencies and notify anything already waiting on
+        # this ID (a missing dependency counts as met until it appears)
+        self._unmet_dependencies[task.id] = self._count_unmet_dependencies(task)
+        self._update_dependents(
+            task.id,
+            was_met=previous is None or previous.status == TaskStatus.DONE,
+            is_met=task.status == TaskStatus.DONE,
+        )
+        root_id = self._failed_dependency_root(task)
+        if root_id is not None:
+            self._apply_failure_cascade(task, root_id)
+        self._refresh_ready(task)
+
+    def _unlink_dependencies(self, task: Task) -> None:
+        """Remove the task's dependency edges from the graph and DAG"""
+        for dep_id in task.dependencies:
+            self._dag.remove_edge(dep_id, task.id)
+            dependents = self._dependency_graph.get(dep_id)
+            if dependents is not None:
+                dependents.discard(task.id)
+                if not dependents:
+                    del self._dependency_graph[dep_id]
+                    if self._remote_status is not None:
+                        self._remote_status.pop(dep_id, None)
+        self._dependency_cycles.pop(task.id, None)
+
+    def _unindex_task(self, task: Task) -> None:
+        """Remove a replaced task object from the status/assignee/field indexes"""
+        self._task_index_by_status[task.status].discard(task.id)
+        if task.assignee and task.assignee in self._task_index_by_assignee:
+            self._task_index_by_assignee[task.assignee].discard(task.id)
+            if not self._task_index_by_assignee[task.assignee]:
+                del self._task_index_by_assignee[task.assignee]
+        self._unindex_attributes(task)
+
+    def _indexed_value(self, task: Task, field_name: str) -> Any:
+        if field_name == "priority":
+            return task.priority
+        value = task.metadata.get(field_name)
+        if isinstance(value, str) and value and value != "-":
+            return value
+        return None
+
+    def _index_attributes(self, task: Task) -> None:
+        for field_name in TASK_INDEX_FIELDS:
+            value = self._indexed_value(task, field_name)
+            if value is not None:
+                index = self._task_index_by_field[field_name]
+                index.setdefault(value, set()).add(task.id)
+
+    def _unindex_attributes(self, task: Task) -> None:
+        """Drop the task from the field indexes (call before mutating them)"""
+        for field_name in TASK_INDEX_FIELDS:
+            index = self._task_index_by_field[field_name]
+            value = self._indexed_value(task, field_name)
+            task_ids = index.get(value)
+            if task_ids is not None:
+                task_ids.discard(task.id)
+                if not task_ids:
+                    del index[value]
+
+    def _update_metadata(self, task: Task, metadata: Dict[str, Any]) -> None:
+        self._unindex_attributes(task)
+        task.metadata.update(metadata)
+        task.intern_metadata()
+        self._index_attributes(task)
+        if "deadline" in metadata and task.id in self._ready_queue:
+            self._enqueue_ready(task)
+
+    def _mark_dirty(self, task_id: str) -> None:
+        """Flag a task for the next board and database sync"""
+        self._board_dirty.add(task_id)
+        self._board_version += 1
+        self._db_dirty.add(task_id)
+
+    def _record_mutation(self, op: str, task_id: str) -> None:
+        """Journal a task change and mark its board row dirty"""
+        self._journal.record(op, task_id)
+        self._mark_dirty(task_id)
+
+    def _record_history(self, task: Task, entry: Dict[str, Any]) -> None:
+        """Append to the task's history ring, queueing evicted entries for spill"""
+        for evicted in task.record_event(entry, self._history_limit):
+            self._history_spill.append((task.id, evicted))
+
+    def _trim_history(self, task: Task) -> None:
+        """Bound history loaded from older state files that grew without limit"""
+        history = task._history
+        if self._history_limit > 0 and history and len(history) > self._history_limit:
+            excess = len(history) - self._history_limit
+            self._history_spill.extend((task.id, entry) for entry in history[:excess])
+            del history[:excess]
+
+    async def _spill_history(self) -> None:
+        """Write evicted history entries to cold storage"""
+        if not self._history_spill:
+            return
+        spill, self._history_spill = self._history_spill, []
+        try:
+            await asyncio.to_thread(self._archive.spill_history, spill)
+        except Exception as e:
+            self._history_spill[:0] = spill
+            logger.error(f"Failed to spill task history: {e}")
+
+    async def get_task_history(self, task_id: str) -> List[Dict[str, Any]]:
+        """Full execution history: spilled entries followed by the live ring"""
+        try:
+            history = await asyncio.to_thread(self._archive.get_history, task_id)
+        except Exception as e:
+            logger.error(f"Failed to read spilled history for {task_id}: {e}")
+            history = []
+        history.extend(entry for tid, entry in self._history_spill if tid == task_id)
+        task = self._tasks.get(task_id)
+        if task is not None:
+            history.extend(task._history or [])
+        else:
+            archived = self._archive.get(task_id)
+            if archived:
+                history.extend(archived.get("execution_history") or [])
+        return history
+
+    def _observe_duration(self, task: Task) -> None:
+        """Feed a finished task's claim-to-completion time into the estimates"""
+        if task.claimed_ts is None or task.completed_ts is None:
+            return
+        elapsed = task.completed_ts - task.claimed_ts
+        if elapsed < 0:
+            return
+        for key in {task.metadata.get("domain"), None}:
+            stats = self._duration_stats.setdefault(key, [0, 0.0])
+            stats[0] += 1
+            stats[1] += elapsed
+
+    def _estimate_duration(self, task_id: str) -> float:
+        """Expected seconds of work left on a task (0 once finished)"""
+        task = self._tasks.get(task_id)
+        if task is None or task.status in (TaskStatus.DONE, TaskStatus.CANCELLED):
+            return 0.0
+        estimate = task.metadata.get("estimated_duration")  # minutes
+        if isinstance(estimate, (int, float)) and estimate > 0:
+            return float(estimate) * 60
+        stats = self._duration_stats.get(task.metadata.get("domain"))
+        if not stats:
+            stats = self._duration_stats.get(None)
+        return stats[1] / stats[0] if stats else DEFAULT_TASK_DURATION_SECONDS
+
+    def _refresh_critical_path(self) -> None:
+        """Recompute the critical path and re-key ready tasks that moved on/off it"""
+        try:
+            remaining = self._dag.remaining_work(self._estimate_duration)
+            length, path = self._dag.critical_path(self._estimate_duration, remaining)
+            self._critical_path = path
+            self._critical_path_seconds = length
+
+            critical = {
+                task_id
+                for task_id in path
+                if task_id in self._tasks and remaining.get(task_id, 0.0) > 0
+            }
+            changed = critical ^ self._critical_tasks
+            self._critical_tasks = critical
+            for task_id in changed:
+                if task_id in self._ready_queue:
+                    self._enqueue_ready(self._tasks[task_id])
+        except Exception as e:
+            logger.error(f"Failed to refresh critical path: {e}")
+
+    async def get_dependency_analytics(self) -> Dict[str, Any]:
+        """Depth, critical path and cycle report for the dependency graph"""
+        self._refresh_critical_path()
+        levels = self._dag.levels()
+        by_level: Dict[int, int] = {}
+        for level in levels.values():
+            by_level[level] = by_level.get(level, 0) + 1
+        return {
+            "nodes": len(self._dag),
+            "edges": self._dag.edge_count,
+            "depth": max(levels.values(), default=-1) + 1,
+            "tasks_per_level": by_level,
+            "critical_path": list(self._critical_path),
+            "critical_path_seconds": round(self._critical_path_seconds, 1),
+            "cycles": dict(self._dependency_cycles),
+        }
+
+    def _failed_dependency_root(self, task: Task) -> Optional[str]:
+        """The failed task this one transitively waits on, if any"""
+        if self._failure_cascade == "none" or task.status not in WAITING_STATUSES:
+            return None
+        for dep_id in task.dependencies:
+            dep_task = self._tasks.get(dep_id)
+            if dep_task is not None and dep_task.status in FAILED_STATUSES:
+                return dep_id
+            if dep_id in self._orphaned:
+                return self._orphaned[dep_id]
+            if dep_task is None and self._remote_status is not None:
+                if self._remote_status.get(dep_id) in FAILED_STATUSES:
+                    return dep_id
+        return None
+
+    def _apply_failure_cascade(self, task: Task, root_id: str) -> bool:
+        """Cancel or orphan a waiting dependent of a failed task"""
+        if task.status not in WAITING_STATUSES or task.id in self._orphaned:
+            return False
+        if self._failure_cascade == "cancel":
+            self._task_index_by_status[task.status].discard(task.id)
+            task.status = TaskStatus.CANCELLED
+            self._task_index_by_status[TaskStatus.CANCELLED].add(task.id)
+            task.touch()
+            task.metadata["cancelled_reason"] = f"dependency {root_id} did not complete"
+            self._record_history(
+                task,
+                {
+                    "action": "cascade_cancelled",
+                    "root_task_id": root_id,
+                    "timestamp": task.updated_at,
+                },
+            )
+            self._record_mutation("status", task.id)
+        else:
+            self._orphaned[task.id] = root_id
+            self._orphans_by_root.setdefault(root_id, set()).add(task.id)
+        self._refresh_ready(task)
+        return True
+
+    def _propagate_failure(self, root_id: str, start: Optional[str] = None) -> List[str]:
+        """
+        Cancel or orphan everything waiting on a failed task in one traversal.
+
+        Only QUEUED/BLOCKED dependents are affected (and traversed through);
+        returns the IDs that were cancelled or orphaned. ``start`` begins the
+        traversal at a task that was just cascaded instead of at the root.
+        """
+        if self._failure_cascade == "none":
+            return []
+        affected: List[str] = []
+        seen = {root_id, start or root_id}
+        frontier = [start or root_id]
+        while frontier:
+            current = frontier.pop()
+            for dependent_id in self._dependency_graph.get(current, ()):
+                if dependent_id in seen:
+                    continue
+                seen.add(dependent_id)
+                dependent = self._tasks.get(dependent_id)
+                if dependent is not None and self._apply_failure_cascade(
+                    dependent, root_id
+                ):
+                    affected.append(dependent_id)
+                    frontier.append(dependent_id)
+        return affected
+
+    def _adopt_orphans(self, root_id: str) -> List[str]:
+        """Return a retried task's orphaned dependents to normal scheduling"""
+        adopted = list(self._orphans_by_root.pop(root_id, ()))
+        for task_id in adopted:
+            self._orphaned.pop(task_id, None)
+            task = self._tasks.get(task_id)
+            if task is not None:
+                self._refresh_ready(task)
+        return adopted
+
+    async def _emit_failure_cascade(self, root_id: str, affected: List[str]) -> None:
+        if not affected:
+            return
+        if self._failure_cascade == "cancel":
+            event = "task.cascade_cancelled"
+        else:
+            event = "task.orphaned"
+        await self.guild_core.communication_hub.emit_event(
+            event,
+            {"root_task_id": root_id, "task_ids": affected, "count": len(affected)},
+            CommunicationChannel.TASK_UPDATES,
+            MessagePriority.NORMAL,
+        )
+        logger.info(f"Task {root_id} failure reached {len(affected)} dependents ({event})")
+
+    def get_orphaned_tasks(self) -> Dict[str, str]:
+        """Orphaned task IDs mapped to the failed task they wait on"""
+        return dict(self._orphaned)
+
+    def _refresh_ready(self, task: Task) -> None:
+        """Keep the task's ready-queue membership in line with its state"""
+        if task.status != TaskStatus.QUEUED:
+            self._parked_approvals.pop(task.id, None)
+            self._ready_queue.discard(task.id)
+        elif task.id in self._parked_approvals or task.id in self._orphaned:
+            self._ready_queue.discard(task.id)
+        elif self._dependencies_satisfied(task):
+            if task.id not in self._ready_queue:
+                self._enqueue_ready(task)
+        else:
+            self._ready_queue.discard(task.id)
+
+    def _enqueue_ready(self, task: Task) -> None:
+        boost = self._critical_path_boost if task.id in self._critical_tasks else 0
+        self._ready_queue.push(
+            task.id, self._scheduler.sort_key(task, boost), task.capabilities_required
+        )
+
+    def set_scheduling_policy(self, policy: Union[str, SchedulingPolicy]) -> None:
+        """Switch claim ordering at runtime, re-keying every ready task"""
+        if isinstance(policy, str):
+            policy = create_scheduling_policy(policy, self.config)
+        self._scheduler = policy
+        ready = [self._tasks[task_id] for task_id in self._ready_queue]
+        self._ready_queue.clear()
+        for task in ready:
+            self._enqueue_ready(task)
+        logger.info(f"Task scheduling policy set to {policy.name}")
+
+    def _count_unmet_dependencies(self, task: Task) -> int:
+        count = 0
+        for dep_id in set(task.dependencies):
+            dep_task = self._tasks.get(dep_id)
+            if dep_task is not None:
+                if dep_task.status != TaskStatus.DONE:
+                    count += 1
+            elif self._remote_status is not None and dep_id not in self._archive:
+                # Owned by another shard: unmet until reported DONE
+                if self._remote_status.get(dep_id) != TaskStatus.DONE:
+                    count += 1
+            elif self._archive.status(dep_id) not in (None, TaskStatus.DONE.value):
+                count += 1
+        return count
+
+    def _update_dependents(self, task_id: str, was_met: bool, is_met: bool) -> None:
+        """Adjust dependents' unmet counters when a dependency flips state"""
+        if was_met == is_met:
+            return
+        delta = -1 if is_met else 1
+        for dependent_id in self._dependency_graph.get(task_id, ()):
+            if dependent_id not in self._unmet_dependencies:
+                continue
+            self._unmet_dependencies[dependent_id] = max(
+                0, self._unmet_dependencies[dependent_id] + delta
+            )
+            dependent = self._tasks[dependent_id]
+            if dependent.status == TaskStatus.QUEUED:
+                self._refresh_ready(dependent)
 
     def _ensure_task_metadata(self, task: Task) -> None:
         if not isinstance(task.metadata, dict):
@@ -259,20 +1084,18 @@ class TaskDirector:
         approvals = task.metadata.get("approvals")
         if not isinstance(approvals, dict):
             task.metadata["approvals"] = {}
+        task.intern_metadata()
 
-    async def create_task(
+    def _build_task(
         self,
+        task_id: str,
         title: str,
         description: str,
         priority: TaskPriority = TaskPriority.MEDIUM,
         dependencies: Optional[List[str]] = None,
         capabilities_required: Optional[List[str]] = None,
         metadata: Optional[Dict[str, Any]] = None,
-    ) -> str:
-        """Create a new task"""
-        import uuid
-
-        priority = normalize_task_priority(priority)
+    ) -> Task:
         metadata = metadata or {}
         metadata["execution_mode"] = normalize_execution_mode(
             metadata.get("execution_mode")
@@ -280,30 +1103,65 @@ class TaskDirector:
         if not isinstance(metadata.get("approvals"), dict):
             metadata["approvals"] = {}
 
-        # Generate unique task ID
-        task_id = f"AAS-{len(self._tasks) + 1:03d}"
-
-        # Ensure unique ID
-        while task_id in self._tasks:
-            task_id = f"AAS-{len(self._tasks) + 1:03d}-{uuid.uuid4().hex[:4]}"
-
-        task = Task(
+        return Task(
             id=task_id,
             title=title,
             description=description,
             status=TaskStatus.QUEUED,
-            priority=priority,
+            priority=normalize_task_priority(priority),
             dependencies=dependencies or [],
             capabilities_required=capabilities_required or [],
             metadata=metadata,
         )
 
+    def _task_id_taken(self, task_id: str) -> bool:
+        return task_id in self._tasks or task_id in self._archive
+
+    def _next_task_id(self) -> str:
+        task_id = self._id_allocator.allocate()
+        while self._task_id_taken(task_id):
+            task_id = self._id_allocator.allocate()
+        return task_id
+
+    async def create_task(
+        self,
+        title: str,
+        description: str,
+        priority: TaskPriority = TaskPriority.MEDIUM,
+        dependencies: Optional[List[str]] = None,
+        capabilities_required: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        task_id: Optional[str] = None,
+    ) -> str:
+        """
+        Create a new task.
+
+        ``task_id`` takes an ID allocated elsewhere (e.g. a shard router's
+        block from ``reserve_task_ids``); by default one is generated.
+        """
+        if task_id is None:
+            # Generate unique task ID
+            task_id = self._next_task_id()
+        elif self._task_id_taken(task_id):
+            raise ValueError(f"Task ID {task_id} already exists")
+
+        task = self._build_task(
+            task_id,
+            title,
+            description,
+            priority=priority,
+            dependencies=dependencies,
+            capabilities_required=capabilities_required,
+            metadata=metadata,
+        )
+
         await self._add_task_internal(task)
+        self._record_mutation("create", task_id)
 
         # Emit event
         await self.guild_core.communication_hub.emit_event(
             "task.created",
-            {"task_id": task_id, "title": title, "priority": priority.value},
+            {"task_id": task_id, "title": title, "priority": task.priority.value},
             CommunicationChannel.TASK_UPDATES,
             MessagePriority.NORMAL,
         )
@@ -311,137 +1169,322 @@ class TaskDirector:
         logger.info(f"Created task {task_id}: {title}")
         return task_id
 
+    async def create_tasks(
+        self, tasks: List[Dict[str, Any]], task_ids: Optional[List[str]] = None
+    ) -> List[str]:
+        """
+        Create many tasks at once.
+
+        Each entry takes the keyword arguments of ``create_task``. IDs are
+        reserved as one block and a single ``task.batch_created`` event is
+        emitted for the whole batch. Every spec is validated before IDs are
+        reserved, so one bad entry rejects the batch with nothing added.
+
+        ``task_ids`` takes one ID per spec allocated elsewhere (as with
+        ``create_task(task_id=...)``); a duplicate or taken ID also rejects
+        the whole batch.
+        """
+        if not tasks:
+            return []
+        for spec in tasks:
+            validate_task_spec(spec)
+
+        if task_ids is not None:
+            if len(task_ids) != len(tasks):
+                raise ValueError(f"Expected {len(tasks)} task IDs, got {len(task_ids)}")
+            if len(set(task_ids)) != len(task_ids):
+                raise ValueError("Duplicate task IDs in batch")
+            for task_id in task_ids:
+                if self._task_id_taken(task_id):
+                    raise ValueError(f"Task ID {task_id} already exists")
+            task_ids = list(task_ids)
+        else:
+            task_ids = [
+                task_id
+                for task_id in self._id_allocator.reserve(len(tasks))
+                if not self._task_id_taken(task_id)
+            ]
+            while len(task_ids) < len(tasks):
+                task_ids.append(self._next_task_id())
+
+        created: List[Task] = []
+        for task_id, spec in zip(task_ids, tasks):
+            task = self._build_task(task_id, **spec)
+            await self._add_task_internal(task)
+            self._record_mutation("create", task_id)
+            created.append(task)
+
+        await self.guild_core.communication_hub.emit_event(
+            "task.batch_created",
+            {
+                "task_ids": task_ids,
+                "count": len(task_ids),
+                "priorities": {task.id: task.priority.value for task in created},
+            },
+            CommunicationChannel.TASK_UPDATES,
+            MessagePriority.NORMAL,
+        )
+
+        logger.info(f"Created {len(task_ids)} tasks in bulk")
+        return task_ids
+
+    def reserve_task_ids(self, count: int) -> List[str]:
+        """Reserve a block of task IDs for bulk imports"""
+        return self._id_allocator.reserve(count)
+
     async def claim_task(
         self, agent_id: str, task_id: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
         """Claim a task for an agent"""
         try:
-            if task_id:
-                # Claim specific task
-                if task_id not in self._tasks:
+            # Fetch capabilities once for this claim cycle
+            agent_capabilities = await self._get_agent_capabilities(agent_id)
+
+            while True:
+                if task_id:
+                    # Claim specific task
+                    if task_id not in self._tasks:
+                        return None
+                    task = self._tasks[task_id]
+                    if not await self._is_task_claimable(
+                        task, agent_id, agent_capabilities
+                    ):
+                        return None
+                else:
+                    # Find next available task
+                    task = await self._find_next_claimable_task(
+                        agent_id, agent_capabilities
+                    )
+                    if not task:
+                        return None
+
+                if task.id in self._claims_in_flight:
                     return None
-                task = self._tasks[task_id]
-            else:
-                # Find next available task
-                task = await self._find_next_claimable_task(agent_id)
-                if not task:
+                action = await self._reserve_and_commit_claim(
+                    task, agent_id, agent_capabilities
+                )
+                if action:
+                    break
+                if task_id:
                     return None
+                # Another claimer won this task while we awaited; try the next
+
+            if action == "execution_pending":
+                await self.guild_core.communication_hub.emit_event(
+                    "task.execution_pending",
+                    {
+                        "task_id": task.id,
+                        "agent_id": agent_id,
+                        "title": task.title,
+                    },
+                    CommunicationChannel.TASK_UPDATES,
+                    MessagePriority.HIGH,
+                )
 
-            # Check if task is claimable
-            if not await self._is_task_claimable(task, agent_id):
-                return None
+                logger.info(f"Task {task.id} pending execution approval for {agent_id}")
+                return task.to_dict(include_history=False)
 
-            execution_mode = normalize_execution_mode(
-                task.metadata.get("execution_mode")
+            # Emit event
+            await self.guild_core.communication_hub.emit_event(
+                "task.claimed",
+                {"task_id": task.id, "agent_id": agent_id, "title": task.title},
+                CommunicationChannel.TASK_UPDATES,
+                MessagePriority.HIGH,
             )
-            requires_execute = self._requires_execute_gate(task)
 
-            if requires_execute:
-                approved = await self._ensure_gate_approval(
-                    task, "execute", execution_mode
-                )
-                if not approved:
-                    old_status = task.status
-                    task.assignee = agent_id
-                    task.status = TaskStatus.BLOCKED
-                    task.updated_at = datetime.now(timezone.utc).isoformat()
-
-                    self._task_index_by_status[old_status].discard(task.id)
-                    self._task_index_by_status[TaskStatus.BLOCKED].add(task.id)
-                    self._task_index_by_assignee.setdefault(agent_id, set()).add(
-                        task.id
-                    )
+            logger.info(f"Task {task.id} claimed by {agent_id}")
+            return task.to_dict(include_history=False)
 
-                    task.execution_history.append(
-                        {
-                            "action": "execution_pending",
-                            "agent_id": agent_id,
-                            "timestamp": task.updated_at,
-                        }
-                    )
+        except Exception as e:
+            logger.error(f"Failed to claim task: {e}")
+            return None
 
-                    await self.guild_core.communication_hub.emit_event(
-                        "task.execution_pending",
-                        {
-                            "task_id": task.id,
-                            "agent_id": agent_id,
-                            "title": task.title,
-                        },
-                        CommunicationChannel.TASK_UPDATES,
-                        MessagePriority.HIGH,
-                    )
+    async def claim_tasks(self, agent_id: str, count: int) -> List[Dict[str, Any]]:
+        """
+        Claim up to ``count`` tasks for an agent in one pass.
 
-                    logger.info(
-                        f"Task {task.id} pending execution approval for {agent_id}"
-                    )
-                    return task.to_dict()
+        Agent capabilities are fetched once and a single ``task.batch_claimed``
+        event covers every task claimed (or parked for execute approval).
+        """
+        claimed: List[Dict[str, Any]] = []
+        claimed_ids: List[str] = []
+        pending_ids: List[str] = []
+        try:
+            agent_capabilities = await self._get_agent_capabilities(agent_id)
+            while len(claimed) < count:
+                task = await self._find_next_claimable_task(
+                    agent_id, agent_capabilities
+                )
+                if not task:
+                    break
+                action = await self._reserve_and_commit_claim(
+                    task, agent_id, agent_capabilities
+                )
+                if not action:
+                    continue
+                if action == "execution_pending":
+                    pending_ids.append(task.id)
+                else:
+                    claimed_ids.append(task.id)
+                claimed.append(task.to_dict(include_history=False))
+        except Exception as e:
+            logger.error(f"Failed to claim tasks: {e}")
 
-            # Claim the task
+        if claimed:
+            await self.guild_core.communication_hub.emit_event(
+                "task.batch_claimed",
+                {
+                    "agent_id": agent_id,
+                    "task_ids": claimed_ids,
+                    "execution_pending_ids": pending_ids,
+                    "titles": {data["id"]: data["title"] for data in claimed},
+                },
+                CommunicationChannel.TASK_UPDATES,
+                MessagePriority.HIGH,
+            )
+            logger.info(f"{len(claimed)} tasks claimed by {agent_id}")
+        return claimed
+
+    async def _reserve_and_commit_claim(
+        self, task: Task, agent_id: str, agent_capabilities: List[str]
+    ) -> Optional[str]:
+        """
+        Resolve the execute gate for a selected task, then commit the claim.
+
+        The task is reserved while the approval request is in flight so
+        concurrent claim scans skip it instead of requesting it again.
+        """
+        if not self._requires_execute_gate(task):
+            return self._commit_claim(task, agent_id, agent_capabilities, True)
+
+        self._claims_in_flight.add(task.id)
+        try:
+            execution_mode = normalize_execution_mode(
+                task.metadata.get("execution_mode")
+            )
+            approved = await self._ensure_gate_approval(task, "execute", execution_mode)
+            return self._commit_claim(task, agent_id, agent_capabilities, approved)
+        finally:
+            self._claims_in_flight.discard(task.id)
+
+    def _commit_claim(
+        self,
+        task: Task,
+        agent_id: str,
+        agent_capabilities: List[str],
+        execute_approved: bool,
+    ) -> Optional[str]:
+        """
+        Atomically re-validate and assign a task to an agent.
+
+        Everything that awaits (capability lookup, approval requests) happens
+        before this call, and nothing here yields to the event loop, so the
+        check and the status change cannot interleave with another claimer.
+        Returns ``"claimed"``, ``"execution_pending"`` when the task is held
+        BLOCKED waiting for execute-gate approval, or None when the task was
+        taken (or became unclaimable) in the meantime. Emits no events.
+        """
+        if not self._claimable_now(task, agent_capabilities):
+            self._claim_conflicts += 1
+            logger.debug(f"Claim of {task.id} by {agent_id} lost the race")
+            return None
+
+        if not execute_approved:
             old_status = task.status
-            task.status = TaskStatus.IN_PROGRESS
             task.assignee = agent_id
-            task.claimed_at = datetime.now(timezone.utc).isoformat()
-            task.updated_at = task.claimed_at
+            task.status = TaskStatus.BLOCKED
+            task.touch()
 
-            # Update indexes
             self._task_index_by_status[old_status].discard(task.id)
-            self._task_index_by_status[TaskStatus.IN_PROGRESS].add(task.id)
-
-            if agent_id not in self._task_index_by_assignee:
-                self._task_index_by_assignee[agent_id] = set()
-            self._task_index_by_assignee[agent_id].add(task.id)
+            self._task_index_by_status[TaskStatus.BLOCKED].add(task.id)
+            self._ready_queue.discard(task.id)
+            self._task_index_by_assignee.setdefault(agent_id, set()).add(task.id)
 
-            # Add to execution history
-            task.execution_history.append(
+            self._record_history(
+                task,
                 {
-                    "action": "claimed",
+                    "action": "execution_pending",
                     "agent_id": agent_id,
-                    "timestamp": task.claimed_at,
+                    "timestamp": task.updated_at,
                 }
             )
+            self._record_mutation("claim", task.id)
+            return "execution_pending"
 
-            # Emit event
-            await self.guild_core.communication_hub.emit_event(
-                "task.claimed",
-                {"task_id": task.id, "agent_id": agent_id, "title": task.title},
-                CommunicationChannel.TASK_UPDATES,
-                MessagePriority.HIGH,
-            )
-
-            logger.info(f"Task {task.id} claimed by {agent_id}")
-            return task.to_dict()
+        # Claim the task
+        old_status = task.status
+        task.status = TaskStatus.IN_PROGRESS
+        task.assignee = agent_id
+        task.claimed_ts = task.touch()
 
-        except Exception as e:
-            logger.error(f"Failed to claim task: {e}")
-            return None
+        # Update indexes
+        self._task_index_by_status[old_status].discard(task.id)
+        self._task_index_by_status[TaskStatus.IN_PROGRESS].add(task.id)
+        self._ready_queue.discard(task.id)
 
-    async def _find_next_claimable_task(self, agent_id: str) -> Optional[Task]:
-        """Find the next claimable task for an agent"""
-        # Get agent capabilities
-        agent_capabilities = await self._get_agent_capabilities(agent_id)
+        if agent_id not in self._task_index_by_assignee:
+            self._task_index_by_assignee[agent_id] = set()
+        self._task_index_by_assignee[agent_id].add(task.id)
 
-        # Get queued tasks sorted by priority
-        queued_tasks = [
-            self._tasks[task_id]
-            for task_id in self._task_index_by_status[TaskStatus.QUEUED]
-        ]
+        # Add to execution history
+        self._record_history(
+            task,
+            {
+                "action": "claimed",
+                "agent_id": agent_id,
+                "timestamp": task.claimed_at,
+            }
+        )
+        self._record_mutation("claim", task.id)
+        return "claimed"
 
-        # Sort by priority (urgent first)
-        priority_order = {
-            TaskPriority.CRITICAL: 0,
-            TaskPriority.URGENT: 1,
-            TaskPriority.HIGH: 2,
-            TaskPriority.MEDIUM: 3,
-            TaskPriority.LOW: 4,
-        }
-        queued_tasks.sort(key=lambda t: priority_order[t.priority])
+    def _claimable_now(self, task: Task, agent_capabilities: List[str]) -> bool:
+        """Synchronous claimability check used inside the claim commit"""
+        if task.status != TaskStatus.QUEUED or self._tasks.get(task.id) is not task:
+            return False
+        if not self._dependencies_satisfied(task):
+            return False
+        if task.id in self._parked_approvals or task.id in self._orphaned:
+            return False
+        execution_mode = normalize_execution_mode(task.metadata.get("execution_mode"))
+        if execution_mode in {ExecutionMode.MANUAL, ExecutionMode.SEMI_AUTOMATIC}:
+            approvals = task.metadata.get("approvals")
+            gate_state = approvals.get("claim") if isinstance(approvals, dict) else None
+            if not (isinstance(gate_state, dict) and gate_state.get("status") == "approved"):
+                return False
+        if task.capabilities_required:
+            if not set(task.capabilities_required).issubset(agent_capabilities):
+                return False
+        return True
 
-        # Find first claimable task
-        for task in queued_tasks:
-            if await self._is_task_claimable(task, agent_id, agent_capabilities):
-                return task
+    async def _find_next_claimable_task(
+        self, agent_id: str, agent_capabilities: Optional[List[str]] = None
+    ) -> Optional[Task]:
+        """Find the next claimable task for an agent"""
+        # Get agent capabilities
+        if agent_capabilities is None:
+            agent_capabilities = await self._get_agent_capabilities(agent_id)
 
-        return None
+        # Walk the ready partitions this agent can serve in priority order.
+        # Popped tasks are restored afterwards so skipped (and the selected)
+        # tasks stay claimable.
+        popped: List[Task] = []
+        try:
+            while True:
+                task_id = self._ready_queue.pop(agent_capabilities)
+                if task_id is None:
+                    return None
+                task = self._tasks.get(task_id)
+                if not task:
+                    continue
+                popped.append(task)
+                if task.id in self._claims_in_flight:
+                    continue
+                if await self._is_task_claimable(task, agent_id, agent_capabilities):
+                    return task
+        finally:
+            for task in popped:
+                self._refresh_ready(task)
 
     async def _is_task_claimable(
         self, task: Task, agent_id: str, agent_capabilities: Optional[List[str]] = None
@@ -455,10 +1498,16 @@ class TaskDirector:
         if not await self._are_dependencies_met(task):
             return False
 
+        if task.id in self._parked_approvals:
+            return False
+
         execution_mode = normalize_execution_mode(task.metadata.get("execution_mode"))
         if execution_mode in {ExecutionMode.MANUAL, ExecutionMode.SEMI_AUTOMATIC}:
             approved = await self._ensure_gate_approval(task, "claim", execution_mode)
             if not approved:
+                # Park until an approval update arrives so claim scans skip it
+                self._parked_approvals[task.id] = "claim"
+                self._ready_queue.discard(task.id)
                 return False
 
         # Check capabilities
@@ -466,7 +1515,7 @@ class TaskDirector:
             agent_capabilities = await self._get_agent_capabilities(agent_id)
 
         if task.capabilities_required:
-            if not all(cap in agent_capabilities for cap in task.capabilities_required):
+            if not set(task.capabilities_required).issubset(agent_capabilities):
                 return False
 
         return True
@@ -485,13 +1534,14 @@ class TaskDirector:
 
         hub = self.guild_core.hub
         if hub and getattr(hub, "approvals", None):
-            existing = hub.approvals.get_for_task(task.id, gate)
+            existing = await self._lookup_approval(task.id, gate)
             if existing:
                 approvals[gate] = {
                     "status": existing.status,
                     "request_id": existing.approval_id,
                     "targets": existing.targets,
                 }
+                self._record_mutation("update", task.id)
                 return existing.status == "approved"
 
             targets = gate_state.get("targets")
@@ -517,8 +1567,51 @@ class TaskDirector:
                 "request_id": approval.approval_id,
                 "targets": approval.targets,
             }
+            self._record_mutation("update", task.id)
         return False
 
+    async def _lookup_approval(self, task_id: str, gate: str):
+        """Current approval for a gate; stores may answer synchronously or not"""
+        existing = self.guild_core.hub.approvals.get_for_task(task_id, gate)
+        if inspect.isawaitable(existing):
+            existing = await existing
+        return existing
+
+    async def update_approval(self, task_id: str, gate: str, status: str) -> bool:
+        """Record an approval decision and release the task if it was parked"""
+        task = self._tasks.get(task_id)
+        if not task:
+            return False
+
+        approvals = task.metadata.setdefault("approvals", {})
+        gate_state = approvals.setdefault(gate, {})
+        gate_state["status"] = status
+        task.touch()
+        self._record_mutation("update", task_id)
+        self._release_if_approved(task)
+        return True
+
+    def _release_if_approved(self, task: Task) -> None:
+        gate = self._parked_approvals.get(task.id)
+        if not gate:
+            return
+        approvals = task.metadata.get("approvals")
+        gate_state = approvals.get(gate) if isinstance(approvals, dict) else None
+        if isinstance(gate_state, dict) and gate_state.get("status") == "approved":
+            del self._parked_approvals[task.id]
+            self._refresh_ready(task)
+            logger.info(f"Task {task.id} released after {gate} approval")
+
+    async def _reconcile_parked_approvals(self) -> None:
+        """Pick up decisions made in the hub approval store without an event"""
+        hub = self.guild_core.hub
+        if not self._parked_approvals or not (hub and getattr(hub, "approvals", None)):
+            return
+        for task_id, gate in list(self._parked_approvals.items()):
+            existing = await self._lookup_approval(task_id, gate)
+            if existing and existing.status == "approved":
+                await self.update_approval(task_id, gate, existing.status)
+
     def _requires_execute_gate(self, task: Task) -> bool:
         if task.metadata.get("execution_gate") is True:
             return True
@@ -552,20 +1645,22 @@ class TaskDirector:
         old_status = task.status
         task.status = TaskStatus.IN_PROGRESS
         task.assignee = agent_id
-        task.claimed_at = datetime.now(timezone.utc).isoformat()
-        task.updated_at = task.claimed_at
+        task.claimed_ts = task.touch()
 
         self._task_index_by_status[old_status].discard(task.id)
         self._task_index_by_status[TaskStatus.IN_PROGRESS].add(task.id)
         self._task_index_by_assignee.setdefault(agent_id, set()).add(task.id)
+        self._ready_queue.discard(task.id)
 
-        task.execution_history.append(
+        self._record_history(
+            task,
             {
                 "action": "execution_started",
                 "agent_id": agent_id,
                 "timestamp": task.claimed_at,
             }
         )
+        self._record_mutation("status", task.id)
 
         await self.guild_core.communication_hub.emit_event(
             "task.execution_started",
@@ -577,15 +1672,13 @@ class TaskDirector:
 
     async def _are_dependencies_met(self, task: Task) -> bool:
         """Check if all task dependencies are completed"""
-        for dep_id in task.dependencies:
-            if dep_id not in self._tasks:
-                continue  # Missing dependency treated as unmet
-
-            dep_task = self._tasks[dep_id]
-            if dep_task.status != TaskStatus.DONE:
-                return False
+        return self._dependencies_satisfied(task)
 
-        return True
+    def _dependencies_satisfied(self, task: Task) -> bool:
+        if self._tasks.get(task.id) is not task:
+            # Untracked task object; fall back to a direct scan
+            return self._count_unmet_dependencies(task) == 0
+        return self._unmet_dependencies.get(task.id, 0) == 0
 
     async def _get_agent_capabilities(self, agent_id: str) -> List[str]:
         """Get capabilities for an agent"""
@@ -598,14 +1691,167 @@ class TaskDirector:
             return []  # Default to no specific capabilities
 
     async def get_task(self, task_id: str) -> Optional[Task]:
-        """Get task by ID"""
-        return self._tasks.get(task_id)
-
-    async def list_tasks(self, status: Optional[TaskStatus] = None) -> List[Task]:
+        """Get task by ID (archived tasks come back as detached copies)"""
+        task = self._tasks.get(task_id)
+        if task is None and task_id in self._archive:
+            data = await asyncio.to_thread(self._archive.get, task_id)
+            return Task.from_dict(data) if data else None
+        return task
+
+    async def list_tasks(
+        self, status: Optional[TaskStatus] = None, include_archived: bool = False
+    ) -> List[Task]:
         """List tasks, optionally filtered by status"""
         if status is None:
-            return list(self._tasks.values())
-        return [self._tasks[task_id] for task_id in self._task_index_by_status[status]]
+            tasks = list(self._tasks.values())
+        else:
+            tasks = [
+                self._tasks[task_id] for task_id in self._task_index_by_status[status]
+            ]
+        if include_archived and len(self._archive):
+            archived = await asyncio.to_thread(
+                self._archive.load_all, status.value if status else None
+            )
+            tasks.extend(Task.from_dict(data) for data in archived)
+        return tasks
+
+    async def query(
+        self,
+        status: Optional[Any] = None,
+        priority: Optional[Any] = None,
+        domain: Optional[str] = None,
+        preferred_role: Optional[str] = None,
+        execution_mode: Optional[Any] = None,
+        assignee: Optional[str] = None,
+    ) -> List[Task]:
+        """List hot tasks matching every given filter (see ``query_ids``)"""
+        task_ids = self.query_ids(
+            status=status,
+            priority=priority,
+            domain=domain,
+            preferred_role=preferred_role,
+            execution_mode=execution_mode,
+            assignee=assignee,
+        )
+        return [self._tasks[task_id] for task_id in sorted(task_ids)]
+
+    def query_ids(
+        self,
+        status: Optional[Any] = None,
+        priority: Optional[Any] = None,
+        domain: Optional[str] = None,
+        preferred_role: Optional[str] = None,
+        execution_mode: Optional[Any] = None,
+        assignee: Optional[str] = None,
+    ) -> Set[str]:
+        """
+        IDs of hot tasks matching every given filter.
+
+        Each filter is an index lookup and the sets are intersected smallest
+        first, so the cost tracks the smallest matching set rather than the
+        total task count.
+        """
+        candidates: List[Set[str]] = []
+        if status is not None:
+            candidates.append(self._task_index_by_status[normalize_task_status(status)])
+        if assignee is not None:
+            candidates.append(self._task_index_by_assignee.get(assignee, set()))
+        filters = {
+            "priority": normalize_task_priority(priority) if priority else None,
+            "domain": domain,
+            "preferred_role": preferred_role,
+            "execution_mode": (
+                normalize_execution_mode(execution_mode).value
+                if execution_mode
+                else None
+            ),
+        }
+        for field_name, value in filters.items():
+            if value is not None:
+                candidates.append(self._task_index_by_field[field_name].get(value, set()))
+
+        if not candidates:
+            return set(self._tasks)
+        candidates.sort(key=len)
+        result = set(candidates[0])
+        for task_ids in candidates[1:]:
+            if not result:
+                break
+            result &= task_ids
+        return result
+
+    async def count_by_status(self) -> Dict[TaskStatus, int]:
+        """Hot task count per status, read off the status index"""
+        return {
+            status: len(task_ids)
+            for status, task_ids in self._task_index_by_status.items()
+        }
+
+    async def _archive_cold_tasks(self) -> None:
+        """Move terminal tasks past the age cutoff into the cold tier"""
+        if self._archive_after <= 0:
+            return
+        try:
+            cutoff = time.time() - self._archive_after
+            candidates: List[Task] = []
+            for status in (TaskStatus.DONE, TaskStatus.CANCELLED):
+                for task_id in self._task_index_by_status[status]:
+                    task = self._tasks[task_id]
+                    if self._is_archivable(task, cutoff):
+                        candidates.append(task)
+
+            if not candidates:
+                return
+
+            stamps = {task.id: task.updated_ts for task in candidates}
+            await asyncio.to_thread(
+                self._archive.archive, [task.to_dict() for task in candidates]
+            )
+
+            # A task reopened, replaced or touched during the write stays hot;
+            # its archived copy is stale and would hide it on the next load
+            archived: List[Task] = []
+            stale: List[str] = []
+            for task in candidates:
+                if self._is_archivable(task, cutoff) and task.updated_ts == stamps[task.id]:
+                    archived.append(task)
+                else:
+                    stale.append(task.id)
+            if stale:
+                await asyncio.to_thread(self._archive.remove, stale)
+            for task in archived:
+                self._evict_task(task)
+            logger.info(f"Archived {len(archived)} terminal tasks to cold storage")
+        except Exception as e:
+            logger.error(f"Failed to archive tasks: {e}")
+
+    def _is_archivable(self, task: Task, cutoff: float) -> bool:
+        """Whether a live task is terminal and finished before the cutoff"""
+        if self._tasks.get(task.id) is not task:
+            return False
+        if task.status not in (TaskStatus.DONE, TaskStatus.CANCELLED):
+            return False
+        finished_at = task.completed_ts or task.updated_ts
+        return finished_at is not None and finished_at < cutoff
+
+    def _evict_task(self, task: Task) -> None:
+        """Drop an archived task from the hot tier and its indexes"""
+        if self._tasks.get(task.id) is not task:
+            return
+        del self._tasks[task.id]
+        self._unindex_task(task)
+        self._unlink_dependencies(task)
+        self._dag.remove_node(task.id)
+        self._orphans_by_root.pop(task.id, None)
+        if task.id in self._orphaned:
+            self._orphans_by_root.get(self._orphaned.pop(task.id), set()).discard(task.id)
+        self._critical_tasks.discard(task.id)
+        self._ready_queue.discard(task.id)
+        self._parked_approvals.pop(task.id, None)
+        self._unmet_dependencies.pop(task.id, None)
+        self._board_order = None
+        # Serializes as a WAL delete record since the task is gone
+        self._record_mutation("archive", task.id)
 
     async def set_task_status(
         self,
@@ -623,7 +1869,9 @@ class TaskDirector:
 
         if old_status == status:
             if metadata:
-                task.metadata.update(metadata)
+                self._update_metadata(task, metadata)
+                self._record_mutation("update", task_id)
+                self._release_if_approved(task)
             return True
 
         self._task_index_by_status[old_status].discard(task_id)
@@ -637,14 +1885,24 @@ class TaskDirector:
                 self._task_index_by_assignee.setdefault(assignee, set()).add(task_id)
 
         task.status = status
-        task.updated_at = datetime.now(timezone.utc).isoformat()
-        if status == TaskStatus.IN_PROGRESS and not task.claimed_at:
-            task.claimed_at = task.updated_at
+        task.touch()
+        if status == TaskStatus.IN_PROGRESS and task.claimed_ts is None:
+            task.claimed_ts = task.updated_ts
         if status == TaskStatus.DONE:
-            task.completed_at = task.updated_at
+            task.completed_ts = task.updated_ts
 
         if metadata:
-            task.metadata.update(metadata)
+            self._update_metadata(task, metadata)
+            self._release_if_approved(task)
+
+        self._refresh_ready(task)
+        self._update_dependents(
+            task_id,
+            was_met=old_status == TaskStatus.DONE,
+            is_met=status == TaskStatus.DONE,
+        )
+        self._record_mutation("status", task_id)
+        await self._apply_failure_transition(task_id, old_status, status)
 
         await self.guild_core.communication_hub.emit_event(
             "task.status_changed",
@@ -658,6 +1916,17 @@ class TaskDirector:
         )
         return True
 
+    async def _apply_failure_transition(
+        self, task_id: str, old_status: TaskStatus, status: TaskStatus
+    ) -> None:
+        """Cascade a new failure, or hand orphans back when a failed task recovers"""
+        if status in FAILED_STATUSES and old_status not in FAILED_STATUSES:
+            await self._emit_failure_cascade(task_id, self._propagate_failure(task_id))
+        elif old_status in FAILED_STATUSES and status not in FAILED_STATUSES:
+            self._adopt_orphans(task_id)
+        if task_id in self._orphaned and status not in WAITING_STATUSES:
+            self._orphans_by_root.get(self._orphaned.pop(task_id), set()).discard(task_id)
+
     async def complete_task(
         self, task_id: str, agent_id: str, result: Dict[str, Any]
     ) -> bool:
@@ -678,23 +1947,33 @@ class TaskDirector:
             # Update task
             old_status = task.status
             task.status = TaskStatus.DONE
-            task.completed_at = datetime.now(timezone.utc).isoformat()
-            task.updated_at = task.completed_at
-            task.metadata.update(result)
+            task.completed_ts = task.touch()
+            self._update_metadata(task, result)
+            self._observe_duration(task)
 
             # Update indexes
             self._task_index_by_status[old_status].discard(task.id)
             self._task_index_by_status[TaskStatus.DONE].add(task.id)
+            self._ready_queue.discard(task.id)
+            self._update_dependents(
+                task_id, was_met=old_status == TaskStatus.DONE, is_met=True
+            )
+            # Completing a failed or cancelled task releases its orphans
+            # before the unblock pass below looks at them
+            await self._apply_failure_transition(task_id, old_status, TaskStatus.DONE)
 
             # Add to execution history
-            task.execution_history.append(
+            self._record_history(
+                task,
                 {
                     "action": "completed",
                     "agent_id": agent_id,
                     "timestamp": task.completed_at,
-                    "result": result,
+                    # Result values live in task.metadata; keep keys only
+                    "result_keys": sorted(result),
                 }
             )
+            self._record_mutation("complete", task_id)
 
             # Check for unblocked tasks
             await self._check_unblocked_tasks(task_id)
@@ -722,22 +2001,25 @@ class TaskDirector:
     async def _check_unblocked_tasks(self, completed_task_id: str) -> None:
         """Check for tasks that may now be unblocked"""
         if completed_task_id in self._dependency_graph:
-            dependent_task_ids = self._dependency_graph[completed_task_id]
+            # Counters were already decremented; only dependents that hit
+            # zero need attention, so this is O(out-degree)
+            dependent_task_ids = list(self._dependency_graph[completed_task_id])
 
             for dep_task_id in dependent_task_ids:
+                if self._unmet_dependencies.get(dep_task_id, 0) != 0:
+                    continue
                 if dep_task_id in self._tasks:
                     dep_task = self._tasks[dep_task_id]
-                    if (
-                        dep_task.status == TaskStatus.BLOCKED
-                        and await self._are_dependencies_met(dep_task)
-                    ):
+                    if dep_task.status == TaskStatus.BLOCKED:
                         # Unblock task
                         self._task_index_by_status[TaskStatus.BLOCKED].discard(
                             dep_task_id
                         )
                         dep_task.status = TaskStatus.QUEUED
                         self._task_index_by_status[TaskStatus.QUEUED].add(dep_task_id)
-                        dep_task.updated_at = datetime.now(timezone.utc).isoformat()
+                        dep_task.touch()
+                        self._refresh_ready(dep_task)
+                        self._record_mutation("status", dep_task_id)
 
                         # Emit event
                         await self.guild_core.communication_hub.emit_event(
@@ -753,6 +2035,59 @@ class TaskDirector:
         """Get count of active (in progress) tasks"""
         return len(self._task_index_by_status[TaskStatus.IN_PROGRESS])
 
+    def get_ready_count(self) -> int:
+        """Number of tasks currently in the ready queue"""
+        return len(self._ready_queue)
+
+    def enable_remote_dependencies(self) -> None:
+        """
+        Run as one shard of a partitioned task set.
+
+        Dependencies that are neither loaded nor archived are then treated
+        as owned by another shard and stay unmet until
+        ``apply_remote_statuses`` reports them DONE.
+        """
+        if self._remote_status is None:
+            self._remote_status = {}
+            for task in self._tasks.values():
+                self._unmet_dependencies[task.id] = self._count_unmet_dependencies(task)
+                self._refresh_ready(task)
+
+    def external_dependencies(self, task_id: str) -> List[str]:
+        """Dependencies of a task that this director does not own"""
+        task = self._tasks.get(task_id)
+        if task is None:
+            return []
+        return [
+            dep_id
+            for dep_id in task.dependencies
+            if dep_id not in self._tasks and dep_id not in self._archive
+        ]
+
+    async def apply_remote_statuses(self, statuses: Dict[str, str]) -> None:
+        """Apply status changes of dependencies owned by other shards"""
+        if self._remote_status is None:
+            return
+        for dep_id, value in statuses.items():
+            if dep_id in self._tasks or dep_id not in self._dependency_graph:
+                continue  # Ours, or nothing here waits on it
+            status = TaskStatus(value)
+            old_status = self._remote_status.get(dep_id)
+            if old_status == status:
+                continue
+            self._remote_status[dep_id] = status
+            self._update_dependents(
+                dep_id,
+                was_met=old_status == TaskStatus.DONE,
+                is_met=status == TaskStatus.DONE,
+            )
+            if status == TaskStatus.DONE:
+                await self._check_unblocked_tasks(dep_id)
+            if status in FAILED_STATUSES and old_status not in FAILED_STATUSES:
+                await self._emit_failure_cascade(dep_id, self._propagate_failure(dep_id))
+            elif old_status in FAILED_STATUSES and status not in FAILED_STATUSES:
+                self._adopt_orphans(dep_id)
+
     async def get_health(self) -> Dict[str, Any]:
         """Get health status of task director"""
         return {
@@ -764,6 +2099,16 @@ class TaskDirector:
             },
             "active_agents": len(self._task_index_by_assignee),
             "dependency_graph_size": len(self._dependency_graph),
+            "dependency_cycles": len(self._dependency_cycles),
+            "critical_path_length": len(self._critical_path),
+            "ready_queue_size": len(self._ready_queue),
+            "ready_partitions": self._ready_queue.partition_sizes(),
+            "scheduling_policy": self._scheduler.describe(),
+            "parked_for_approval": len(self._parked_approvals),
+            "claim_conflicts": self._claim_conflicts,
+            "orphaned_tasks": len(self._orphaned),
+            "journal": self._journal.get_stats(),
+            "archived_tasks": len(self._archive),
         }
 
     async def _handle_task_event(self, message) -> None:
@@ -778,6 +2123,11 @@ class TaskDirector:
                 await self._handle_dependency_change(data)
             elif event_type.startswith("legacy."):
                 await self._handle_task_context(data)
+            elif event_type == "task.approval_updated":
+                if data.get("task_id") and data.get("gate") and data.get("status"):
+                    await self.update_approval(
+                        data["task_id"], data["gate"], data["status"]
+                    )
             # Add more event handlers as needed
 
         except Exception as e:
@@ -792,8 +2142,13 @@ class TaskDirector:
         task = self._tasks.get(task_id)
         if not task:
             return
+        self._unindex_attributes(task)
         task.priority = normalize_task_priority(new_priority)
-        task.updated_at = datetime.now(timezone.utc).isoformat()
+        self._index_attributes(task)
+        task.touch()
+        if task.id in self._ready_queue:
+            self._enqueue_ready(task)
+        self._record_mutation("update", task_id)
 
     async def _handle_dependency_change(self, data: Dict[str, Any]) -> None:
         """Handle dependency updates from external systems."""
@@ -805,9 +2160,30 @@ class TaskDirector:
         if not task:
             return
         if dependency not in task.dependencies:
+            try:
+                self._dag.add_edge(dependency, task_id)
+            except DependencyCycleError as e:
+                logger.error(f"Rejected dependency {dependency} for {task_id}: {e}")
+                await self.guild_core.communication_hub.emit_event(
+                    "task.dependency_cycle",
+                    {"task_id": task_id, "dependency": dependency, "cycle": e.cycle},
+                    CommunicationChannel.TASK_UPDATES,
+                    MessagePriority.HIGH,
+                )
+                return
             task.dependencies.append(dependency)
             self._dependency_graph.setdefault(dependency, set()).add(task_id)
-            task.updated_at = datetime.now(timezone.utc).isoformat()
+            # Counted like a new task, so remote and archived dependencies
+            # are judged the same way
+            self._unmet_dependencies[task_id] = self._count_unmet_dependencies(task)
+            task.touch()
+            self._refresh_ready(task)
+            self._record_mutation("update", task_id)
+
+            root_id = self._failed_dependency_root(task)
+            if root_id is not None and self._apply_failure_cascade(task, root_id):
+                affected = [task_id] + self._propagate_failure(root_id, start=task_id)
+                await self._emit_failure_cascade(root_id, affected)
 
     async def _handle_task_context(self, data: Dict[str, Any]) -> None:
         """Handle task context updates (domain/role hints)."""
@@ -817,18 +2193,23 @@ class TaskDirector:
         task = self._tasks.get(task_id)
         if not task:
             return
-        if data.get("preferred_role"):
-            task.metadata["preferred_role"] = data.get("preferred_role")
-        if data.get("domain"):
-            task.metadata["domain"] = data.get("domain")
-        task.updated_at = datetime.now(timezone.utc).isoformat()
+        context = {
+            key: data[key] for key in ("preferred_role", "domain") if data.get(key)
+        }
+        self._update_metadata(task, context)
+        task.touch()
+        self._record_mutation("update", task_id)
 
     async def _sync_loop(self) -> None:
         """Periodic synchronization with external systems"""
         while self._running:
             try:
-                await self._sync_with_markdown()
                 await self._sync_with_database()
+                await self._archive_cold_tasks()
+                await self._spill_history()
+                self._refresh_critical_path()
+                await self._sync_with_markdown()
+                await self._reconcile_parked_approvals()
                 await asyncio.sleep(self._sync_interval)
             except asyncio.CancelledError:
                 break
@@ -839,85 +2220,85 @@ class TaskDirector:
     async def _sync_with_markdown(self) -> None:
         """Sync tasks with Markdown task board"""
         try:
-            self.task_board_path.parent.mkdir(parents=True, exist_ok=True)
-
-            header = "| ID | Priority | Title | Depends On | Status | Assignee | Created | Updated | Mode | Approvals | Preferred Role | Domain |\n"
-            separator = "| --- | --- | --- | --- | --- | --- | --- | --- | --- | --- | --- | --- |\n"
+            if self._board_synced_version == self._board_version:
+                return  # Nothing changed since the last write
 
-            def safe(value: Any) -> str:
-                text = str(value) if value is not None else "-"
-                return text.replace("|", "/")
+            version = self._board_version
+            for task_id in self._board_dirty:
+                self._board_rows.pop(task_id, None)
+            self._board_dirty.clear()
 
-            def format_approvals(task: Task) -> str:
-                approvals = task.metadata.get("approvals", {})
-                if not isinstance(approvals, dict) or not approvals:
-                    return "-"
-                parts = []
-                for gate, info in approvals.items():
-                    if not isinstance(info, dict):
-                        continue
-                    status = info.get("status", "pending")
-                    parts.append(f"{gate}:{status}")
-                return ", ".join(parts) if parts else "-"
+            if self._board_order is None:
+                self._board_order = sorted(self._tasks)
 
             rows = []
-            tasks = list(self._tasks.values())
-            tasks.sort(key=lambda t: t.id)
-            for task in tasks:
-                mode = task.metadata.get(
-                    "execution_mode", ExecutionMode.AUTOMATIC.value
-                )
-                approvals = format_approvals(task)
-                preferred_role = task.metadata.get("preferred_role", "-")
-                domain = task.metadata.get("domain", "-")
-                row = (
-                    f"| {safe(task.id)} | {safe(task.priority.value)} | {safe(task.title)} | "
-                    f"{safe(', '.join(task.dependencies) if task.dependencies else '-')} | {safe(task.status.value)} | "
-                    f"{safe(task.assignee or '-')} | {safe(task.created_at)} | {safe(task.updated_at)} | {safe(mode)} | "
-                    f"{safe(approvals)} | {safe(preferred_role)} | {safe(domain)} |\n"
-                )
+            for task_id in self._board_order:
+                row = self._board_rows.get(task_id)
+                if row is None:
+                    task = self._tasks.get(task_id)
+                    if not task:
+                        continue
+                    row = self._render_board_row(task)
+                    self._board_rows[task_id] = row
                 rows.append(row)
 
-            with open(self.task_board_path, "w", encoding="utf-8") as handle:
-                handle.write(header)
-                handle.write(separator)
-                handle.writelines(rows)
+            content = BOARD_HEADER + BOARD_SEPARATOR + "".join(rows)
+            # The board is stamped as covered by the journal once written
+            await self._journal.flush()
+            await asyncio.to_thread(self._write_board, content)
+            self._board_synced_version = version
         except Exception as e:
             logger.error(f"Failed to sync Markdown board: {e}")
 
+    def _render_board_row(self, task: Task) -> str:
+        def safe(value: Any) -> str:
+            text = str(value) if value is not None else "-"
+            return text.replace("|", "/")
+
+        def format_approvals(task: Task) -> str:
+            approvals = task.metadata.get("approvals", {})
+            if not isinstance(approvals, dict) or not approvals:
+                return "-"
+            parts = []
+            for gate, info in approvals.items():
+                if not isinstance(info, dict):
+                    continue
+                status = info.get("status", "pending")
+                parts.append(f"{gate}:{status}")
+            return ", ".join(parts) if parts else "-"
+
+        mode = task.metadata.get("execution_mode", ExecutionMode.AUTOMATIC.value)
+        approvals = format_approvals(task)
+        preferred_role = task.metadata.get("preferred_role", "-")
+        domain = task.metadata.get("domain", "-")
+        return (
+            f"| {safe(task.id)} | {safe(task.priority.value)} | {safe(task.title)} | "
+            f"{safe(', '.join(task.dependencies) if task.dependencies else '-')} | {safe(task.status.value)} | "
+            f"{safe(task.assignee or '-')} | {safe(task.created_at)} | {safe(task.updated_at)} | {safe(mode)} | "
+            f"{safe(approvals)} | {safe(preferred_role)} | {safe(domain)} |\n"
+        )
+
+    def _write_board(self, content: str) -> None:
+        """Write the board atomically so readers never see a partial file"""
+        self.task_board_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.task_board_path.with_name(self.task_board_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            handle.write(content)
+        os.replace(tmp_path, self.task_board_path)
+        self._write_board_stamp()
+
     async def _sync_with_database(self) -> None:
         """Sync tasks with database"""
         hub = self.guild_core.hub
         if not hub or not hasattr(hub, "db"):
             return
+        if self.config.task_db_bulk_sync:
+            await self._bulk_sync_with_database(hub)
+            return
         try:
             from core.db_models import Task as DbTask
-            from core.db_models import TaskStatus as DbStatus
-            from core.db_models import TaskPriority as DbPriority
-            from datetime import datetime
-
-            def map_status(status: TaskStatus) -> DbStatus:
-                if status == TaskStatus.BLOCKED:
-                    return DbStatus.BLOCKED
-                if status == TaskStatus.IN_PROGRESS:
-                    return DbStatus.IN_PROGRESS
-                if status == TaskStatus.DONE:
-                    return DbStatus.DONE
-                if status == TaskStatus.FAILED:
-                    return DbStatus.FAILED
-                if status == TaskStatus.QUEUED:
-                    return DbStatus.QUEUED
-                return DbStatus.QUEUED
-
-            def map_priority(priority: TaskPriority) -> DbPriority:
-                if priority == TaskPriority.URGENT or priority == TaskPriority.CRITICAL:
-                    return DbPriority.URGENT
-                if priority == TaskPriority.HIGH:
-                    return DbPriority.HIGH
-                if priority == TaskPriority.LOW:
-                    return DbPriority.LOW
-                return DbPriority.MEDIUM
 
+            self._db_dirty.clear()
             with hub.db.get_session() as session:
                 for task in self._tasks.values():
                     db_task = session.query(DbTask).filter(DbTask.id == task.id).first()
@@ -925,88 +2306,148 @@ class TaskDirector:
                         db_task = DbTask(id=task.id, title=task.title)
                         session.add(db_task)
 
-                    db_task.title = task.title
-                    db_task.description = task.description
-                    db_task.priority = map_priority(task.priority)
-                    db_status = map_status(task.status)
-
-                    mode = task.metadata.get("execution_mode")
-                    approvals = task.metadata.get("approvals", {})
-                    if (
-                        task.status == TaskStatus.QUEUED
-                        and isinstance(approvals, dict)
-                        and mode
-                        in {
-                            ExecutionMode.MANUAL.value,
-                            ExecutionMode.SEMI_AUTOMATIC.value,
-                        }
-                    ):
-                        claim_state = approvals.get("claim", {})
-                        if (
-                            isinstance(claim_state, dict)
-                            and claim_state.get("status") != "approved"
-                        ):
-                            db_status = DbStatus.PENDING_APPROVAL
-
-                    db_task.status = db_status
-                    db_task.assignee = task.assignee
-                    db_task.dependencies = task.dependencies or []
-
-                    if task.created_at:
-                        db_task.created_at = datetime.fromisoformat(
-                            task.created_at.replace("Z", "+00:00")
-                        )
-                    if task.updated_at:
-                        db_task.updated_at = datetime.fromisoformat(
-                            task.updated_at.replace("Z", "+00:00")
-                        )
-                    if task.claimed_at:
-                        db_task.started_at = datetime.fromisoformat(
-                            task.claimed_at.replace("Z", "+00:00")
-                        )
-                    if task.completed_at:
-                        db_task.completed_at = datetime.fromisoformat(
-                            task.completed_at.replace("Z", "+00:00")
-                        )
+                    has_tags = hasattr(db_task, "tags")
+                    existing_tags = list(db_task.tags or []) if has_tags else []
+                    mapping = self._db_task_mapping(task, existing_tags, True)
+                    for column, value in mapping.items():
+                        setattr(db_task, column, value)
+        except Exception as e:
+            logger.error(f"Failed to sync tasks to database: {e}")
 
-                    tags = list(db_task.tags or []) if hasattr(db_task, "tags") else []
-                    tags = [
-                        t
-                        for t in tags
-                        if not t.startswith("mode:") and not t.startswith("approval:")
-                    ]
+    async def _bulk_sync_with_database(self, hub) -> None:
+        """Upsert only tasks changed since the last sync, in bulk"""
+        changed_ids = self._db_dirty
+        if not changed_ids:
+            return
+        self._db_dirty = set()
+        try:
+            from core.db_models import Task as DbTask
 
-                    if mode:
-                        tags.append(f"mode:{mode}")
+            has_tags = hasattr(DbTask, "tags")
+            with hub.db.get_session() as session:
+                # One round trip for every existing row ID (plus tags to merge)
+                if has_tags:
+                    existing = {
+                        row_id: tags
+                        for row_id, tags in session.query(DbTask.id, DbTask.tags)
+                    }
+                else:
+                    existing = {row_id: None for (row_id,) in session.query(DbTask.id)}
+
+                inserts: List[Dict[str, Any]] = []
+                updates: List[Dict[str, Any]] = []
+                for task_id in changed_ids:
+                    task = self._tasks.get(task_id)
+                    if not task:
+                        continue
+                    if task_id in existing:
+                        updates.append(
+                            self._db_task_mapping(
+                                task, list(existing[task_id] or []), has_tags
+                            )
+                        )
+                    else:
+                        inserts.append(self._db_task_mapping(task, [], has_tags))
 
-                    if isinstance(approvals, dict):
-                        for gate, info in approvals.items():
-                            if isinstance(info, dict):
-                                status = info.get("status", "pending")
-                                tags.append(f"approval:{gate}={status}")
+                if inserts:
+                    session.bulk_insert_mappings(DbTask, inserts)
+                if updates:
+                    session.bulk_update_mappings(DbTask, updates)
 
-                    if tags:
-                        db_task.tags = list(dict.fromkeys(tags))
+            logger.debug(
+                f"Database sync: {len(inserts)} inserted, {len(updates)} updated"
+            )
         except Exception as e:
+            # Retry the same tasks on the next cycle
+            self._db_dirty |= changed_ids
             logger.error(f"Failed to sync tasks to database: {e}")
 
-    async def _save_tasks(self) -> None:
-        """Save current task state"""
-        try:
-            # Save to JSON for persistence
-            state_file = Path(self.config.artifact_dir) / "task_director_state.json"
-            state_file.parent.mkdir(parents=True, exist_ok=True)
-
-            state = {
-                "tasks": {
-                    task_id: task.to_dict() for task_id, task in self._tasks.items()
-                },
-                "last_updated": datetime.now(timezone.utc).isoformat(),
+    def _db_task_mapping(
+        self, task: Task, existing_tags: List[str], include_tags: bool
+    ) -> Dict[str, Any]:
+        """Build the database column values for a task"""
+        from core.db_models import TaskStatus as DbStatus
+        from core.db_models import TaskPriority as DbPriority
+
+        status_map = {
+            TaskStatus.BLOCKED: DbStatus.BLOCKED,
+            TaskStatus.IN_PROGRESS: DbStatus.IN_PROGRESS,
+            TaskStatus.DONE: DbStatus.DONE,
+            TaskStatus.FAILED: DbStatus.FAILED,
+            TaskStatus.QUEUED: DbStatus.QUEUED,
+        }
+        priority_map = {
+            TaskPriority.CRITICAL: DbPriority.URGENT,
+            TaskPriority.URGENT: DbPriority.URGENT,
+            TaskPriority.HIGH: DbPriority.HIGH,
+            TaskPriority.LOW: DbPriority.LOW,
+        }
+        db_status = status_map.get(task.status, DbStatus.QUEUED)
+
+        mode = task.metadata.get("execution_mode")
+        approvals = task.metadata.get("approvals", {})
+        if (
+            task.status == TaskStatus.QUEUED
+            and isinstance(approvals, dict)
+            and mode
+            in {
+                ExecutionMode.MANUAL.value,
+                ExecutionMode.SEMI_AUTOMATIC.value,
             }
+        ):
+            claim_state = approvals.get("claim", {})
+            if isinstance(claim_state, dict) and claim_state.get("status") != "approved":
+                db_status = DbStatus.PENDING_APPROVAL
+
+        mapping: Dict[str, Any] = {
+            "id": task.id,
+            "title": task.title,
+            "description": task.description,
+            "priority": priority_map.get(task.priority, DbPriority.MEDIUM),
+            "status": db_status,
+            "assignee": task.assignee,
+            "dependencies": task.dependencies or [],
+        }
+
+        for column, value in (
+            ("created_at", task.created_ts),
+            ("updated_at", task.updated_ts),
+            ("started_at", task.claimed_ts),
+            ("completed_at", task.completed_ts),
+        ):
+            if value is not None:
+                mapping[column] = datetime.fromtimestamp(value, timezone.utc)
+
+        if include_tags:
+            tags = [
+                t
+                for t in existing_tags
+                if not t.startswith("mode:") and not t.startswith("approval:")
+            ]
+            if mode:
+                tags.append(f"mode:{mode}")
+            if isinstance(approvals, dict):
+                for gate, info in approvals.items():
+                    if isinstance(info, dict):
+                        status = info.get("status", "pending")
+                        tags.append(f"approval:{gate}={status}")
+            if tags:
+                mapping["tags"] = list(dict.fromkeys(tags))
 
-            with open(state_file, "w") as f:
-                json.dump(state, f, indent=2)
+        return mapping
 
+    def _serialize_task(self, task_id: str) -> Optional[Dict[str, Any]]:
+        task = self._tasks.get(task_id)
+        return task.to_dict() if task else None
+
+    def _serialize_state(self) -> Dict[str, Dict[str, Any]]:
+        return {task_id: task.to_dict() for task_id, task in self._tasks.items()}
+
+    async def _save_tasks(self) -> None:
+        """Save current task state (compact the WAL into a fresh snapshot)"""
+        try:
+            await self._spill_history()
+            await self._journal.stop()
             logger.debug("Task state saved")
 
         except Exception as e:
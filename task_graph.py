@@ -0,0 +1,168 @@
+"""
+Guild Task Graph - Dependency DAG analytics for the Task Director
+"""
+
+import itertools
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from loguru import logger
+
+
+class DependencyCycleError(ValueError):
+    """Raised when adding a dependency edge would close a cycle"""
+
+    def __init__(self, cycle: List[str]):
+        self.cycle = cycle
+        super().__init__("Dependency cycle: " + " -> ".join(cycle))
+
+
+class DependencyAnalytics:
+    """
+    Incrementally maintained topological order over task dependencies.
+
+    Edges run dependency -> dependent. Every node carries an order index
+    that is kept topologically valid as edges are added (Pearce-Kelly):
+    an edge that already agrees with the order costs O(1), otherwise only
+    the nodes between the two endpoints' positions are searched and
+    reordered, and reaching the dependency from the dependent means the
+    edge would close a cycle, which is rejected. Levels, critical path and
+    remaining-work estimates are derived from the order in O(V + E) and
+    cached until the graph changes.
+    """
+
+    def __init__(self):
+        self._succ: Dict[str, Set[str]] = {}
+        self._pred: Dict[str, Set[str]] = {}
+        self._ord: Dict[str, int] = {}
+        self._counter = itertools.count()
+        self._version = 0
+        self._order_cache: Optional[Tuple[int, List[str]]] = None
+
+    def __len__(self) -> int:
+        return len(self._ord)
+
+    def __contains__(self, node: str) -> bool:
+        return node in self._ord
+
+    @property
+    def edge_count(self) -> int:
+        return sum(len(targets) for targets in self._succ.values())
+
+    def add_node(self, node: str) -> None:
+        if node not in self._ord:
+            self._ord[node] = next(self._counter)
+            self._succ[node] = set()
+            self._pred[node] = set()
+            self._version += 1
+
+    def remove_node(self, node: str) -> None:
+        if node not in self._ord:
+            return
+        for target in self._succ.pop(node):
+            self._pred[target].discard(node)
+        for source in self._pred.pop(node):
+            self._succ[source].discard(node)
+        del self._ord[node]
+        self._version += 1
+
+    def add_edge(self, dependency: str, dependent: str) -> None:
+        """Add ``dependency -> dependent``; raises DependencyCycleError"""
+        self.add_node(dependency)
+        self.add_node(dependent)
+        if dependent in self._succ[dependency]:
+            return
+        if dependency == dependent:
+            raise DependencyCycleError([dependency, dependent])
+
+        lower, upper = self._ord[dependent], self._ord[dependency]
+        if lower < upper:
+            # Discover the affected region and reorder it
+            forward = self._search_forward(dependent, dependency, upper)
+            backward = self._search_backward(dependency, lower)
+            self._reorder(forward, backward)
+
+        self._succ[dependency].add(dependent)
+        self._pred[dependent].add(dependency)
+        self._version += 1
+
+    def remove_edge(self, dependency: str, dependent: str) -> None:
+        if dependency in self._succ and dependent in self._succ[dependency]:
+            self._succ[dependency].discard(dependent)
+            self._pred[dependent].discard(dependency)
+            self._version += 1
+
+    def topological_order(self) -> List[str]:
+        if self._order_cache is None or self._order_cache[0] != self._version:
+            self._order_cache = (self._version, sorted(self._ord, key=self._ord.get))
+        return self._order_cache[1]
+
+    def levels(self) -> Dict[str, int]:
+        """Longest distance (in edges) from any root to each node"""
+        levels: Dict[str, int] = {}
+        for node in self.topological_order():
+            levels[node] = max((levels[p] + 1 for p in self._pred[node]), default=0)
+        return levels
+
+    def remaining_work(self, duration: Callable[[str], float]) -> Dict[str, float]:
+        """Longest weighted path from each node to a sink, itself included"""
+        remaining: Dict[str, float] = {}
+        for node in reversed(self.topological_order()):
+            tail = max((remaining[s] for s in self._succ[node]), default=0.0)
+            remaining[node] = duration(node) + tail
+        return remaining
+
+    def critical_path(
+        self,
+        duration: Callable[[str], float],
+        remaining: Optional[Dict[str, float]] = None,
+    ) -> Tuple[float, List[str]]:
+        """The longest weighted dependency chain and its total duration"""
+        if remaining is None:
+            remaining = self.remaining_work(duration)
+        if not remaining:
+            return 0.0, []
+        # Durations are non-negative, so the chain with the most remaining
+        # work starts at the node with the largest estimate
+        node = max(remaining, key=remaining.get)
+        length = remaining[node]
+        path = [node]
+        while self._succ[node]:
+            node = max(self._succ[node], key=remaining.get)
+            path.append(node)
+        return length, path
+
+    def _search_forward(self, start: str, target: str, upper: int) -> List[str]:
+        visited = {start: None}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for succ in self._succ[node]:
+                if succ == target:
+                    chain = [node]
+                    while visited[chain[-1]] is not None:
+                        chain.append(visited[chain[-1]])
+                    chain.reverse()
+                    raise DependencyCycleError([target] + chain + [target])
+                if succ not in visited and self._ord[succ] < upper:
+                    visited[succ] = node
+                    stack.append(succ)
+        return list(visited)
+
+    def _search_backward(self, start: str, lower: int) -> List[str]:
+        visited = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for pred in self._pred[node]:
+                if pred not in visited and self._ord[pred] > lower:
+                    visited.add(pred)
+                    stack.append(pred)
+        return list(visited)
+
+    def _reorder(self, forward: List[str], backward: List[str]) -> None:
+        backward.sort(key=self._ord.get)
+        forward.sort(key=self._ord.get)
+        slots = sorted(self._ord[node] for node in itertools.chain(backward, forward))
+        for node, slot in zip(itertools.chain(backward, forward), slots):
+            self._ord[node] = slot
+        logger.debug(f"Reordered {len(slots)} nodes in dependency graph")
@@ -0,0 +1,256 @@
+"""
+Guild Task Journal - Append-only write-ahead log for Task Director state
+"""
+
+import asyncio
+import json
+import os
+from typing import Dict, Any, Callable, Optional
+from pathlib import Path
+from loguru import logger
+from datetime import datetime, timezone
+
+
+class TaskJournal:
+    """
+    Write-ahead log of task mutations backed by a periodic snapshot.
+
+    Mutations are buffered by task ID and written as one group commit (a
+    single append + fsync) every ``flush_interval`` seconds, so each commit
+    costs O(changed tasks). Once the log grows past ``compact_threshold``
+    records it is folded into the snapshot file and truncated.
+
+    Records are JSON lines of the form ``{"op": ..., "task": {...}}``; replay
+    applies them in order on top of the snapshot, and a torn final line left
+    by a crash is ignored and cut off the file. The task ID sequence
+    high-water mark is persisted alongside as ``{"op": "sequence", "value": n}``
+    records.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        serialize_task: Callable[[str], Optional[Dict[str, Any]]],
+        serialize_state: Callable[[], Dict[str, Dict[str, Any]]],
+        flush_interval: float = 0.05,
+        compact_threshold: int = 10000,
+    ):
+        self.snapshot_path = Path(directory) / "task_director_state.json"
+        self.wal_path = Path(directory) / "task_director.wal"
+        self.flush_interval = flush_interval
+        self.compact_threshold = compact_threshold
+
+        self._serialize_task = serialize_task
+        self._serialize_state = serialize_state
+        self._pending: Dict[str, str] = {}  # task_id -> last op since flush
+        self.sequence = 0  # task ID allocator high-water mark
+        self._sequence_dirty = False
+        self._wal_records = 0
+        self._handle = None
+        self._lock = asyncio.Lock()
+        self._running = False
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start the group commit loop"""
+        if self._running:
+            return
+        self._running = True
+        self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Stop the commit loop and compact the log into the snapshot"""
+        if not self._running:
+            return
+        self._running = False
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+        await self.compact()
+        self._close()
+
+    def record(self, op: str, task_id: str) -> None:
+        """Mark a task as changed; its latest state is written on next flush"""
+        self._pending.pop(task_id, None)
+        self._pending[task_id] = op
+
+    def record_sequence(self, value: int) -> None:
+        """Persist the task ID sequence high-water mark on next flush"""
+        if value > self.sequence:
+            self.sequence = value
+            self._sequence_dirty = True
+
+    def has_state(self) -> bool:
+        """Whether a snapshot or non-empty WAL exists to load from"""
+        if self.snapshot_path.exists():
+            return True
+        return self.wal_path.exists() and self.wal_path.stat().st_size > 0
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Return task dicts from the snapshot with the WAL replayed on top"""
+        tasks: Dict[str, Dict[str, Any]] = {}
+
+        if self.snapshot_path.exists():
+            try:
+                with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                    state = json.load(f)
+                tasks.update(state.get("tasks", {}))
+                self.sequence = max(self.sequence, state.get("next_task_seq", 0))
+            except Exception as e:
+                logger.error(f"Failed to read task snapshot: {e}")
+
+        replayed = 0
+        valid_bytes = 0
+        torn = False
+        if self.wal_path.exists():
+            with open(self.wal_path, "rb") as f:
+                for line in f:
+                    try:
+                        # A record without its newline was cut off mid-write
+                        if not line.endswith(b"\n"):
+                            raise ValueError("unterminated record")
+                        record = json.loads(line)
+                    except ValueError:
+                        logger.warning("Ignoring torn record at end of task WAL")
+                        torn = True
+                        break
+                    valid_bytes += len(line)
+                    if record.get("op") == "delete":
+                        tasks.pop(record.get("task_id"), None)
+                    elif record.get("op") == "sequence":
+                        self.sequence = max(self.sequence, record.get("value", 0))
+                    else:
+                        data = record.get("task") or {}
+                        if data.get("id"):
+                            tasks[data["id"]] = data
+                    replayed += 1
+
+        # Cut the torn tail off so new records are not appended after it
+        if torn:
+            self._truncate_wal(valid_bytes)
+
+        self._wal_records = replayed
+        logger.debug(f"Task journal replayed {replayed} WAL records")
+        return tasks
+
+    async def flush(self) -> int:
+        """Group-commit all pending mutations; returns records written"""
+        if not self._pending and not self._sequence_dirty:
+            return 0
+
+        async with self._lock:
+            pending, self._pending = self._pending, {}
+            sequence_dirty, self._sequence_dirty = self._sequence_dirty, False
+            lines = []
+            try:
+                if sequence_dirty:
+                    record = {"op": "sequence", "value": self.sequence}
+                    lines.append(json.dumps(record, separators=(",", ":")) + "\n")
+                for task_id, op in pending.items():
+                    data = self._serialize_task(task_id)
+                    if data is None:
+                        record = {"op": "delete", "task_id": task_id}
+                    else:
+                        record = {"op": op, "task": data}
+                    lines.append(json.dumps(record, separators=(",", ":")) + "\n")
+
+                await asyncio.to_thread(self._append, "".join(lines))
+            except BaseException:
+                self._restore(pending, sequence_dirty)
+                raise
+            self._wal_records += len(lines)
+
+        if self._wal_records >= self.compact_threshold:
+            await self.compact()
+        return len(lines)
+
+    async def compact(self) -> None:
+        """Write a full snapshot atomically and truncate the WAL"""
+        async with self._lock:
+            # The snapshot captures every pending change as well. It is
+            # encoded here on the loop so the worker thread never reads live
+            # task objects; changes made during the write land in _pending.
+            pending, self._pending = self._pending, {}
+            sequence_dirty, self._sequence_dirty = self._sequence_dirty, False
+            try:
+                state = {
+                    "tasks": self._serialize_state(),
+                    "next_task_seq": self.sequence,
+                    "last_updated": datetime.now(timezone.utc).isoformat(),
+                }
+                data = json.dumps(state, separators=(",", ":"))
+                await asyncio.to_thread(self._write_snapshot, data)
+            except BaseException:
+                self._restore(pending, sequence_dirty)
+                raise
+            self._wal_records = 0
+        logger.debug("Task journal compacted into snapshot")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "pending": len(self._pending),
+            "wal_records": self._wal_records,
+            "compact_threshold": self.compact_threshold,
+        }
+
+    async def _flush_loop(self) -> None:
+        while self._running:
+            try:
+                await asyncio.sleep(self.flush_interval)
+                await self.flush()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Task journal flush error: {e}")
+
+    def _restore(self, pending: Dict[str, str], sequence_dirty: bool) -> None:
+        """Put back mutations from a failed write; newer records win"""
+        pending.update(self._pending)
+        self._pending = pending
+        self._sequence_dirty = self._sequence_dirty or sequence_dirty
+
+    def _append(self, data: str) -> None:
+        if self._handle is None:
+            self.wal_path.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = open(self.wal_path, "a", encoding="utf-8")
+        offset = self._handle.tell()
+        try:
+            self._handle.write(data)
+            self._handle.flush()
+            os.fsync(self._handle.fileno())
+        except Exception:
+            # Drop any partial group so the retry does not follow a torn line
+            try:
+                self._truncate_wal(offset)
+            except Exception as e:
+                logger.error(f"Failed to truncate task WAL after failed append: {e}")
+            raise
+
+    def _truncate_wal(self, size: int) -> None:
+        self._close()
+        with open(self.wal_path, "r+b") as f:
+            f.truncate(size)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _write_snapshot(self, data: str) -> None:
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.snapshot_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+
+        # Everything in the WAL is now covered by the snapshot
+        self._close()
+        with open(self.wal_path, "w", encoding="utf-8"):
+            pass
+
+    def _close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
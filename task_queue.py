@@ -0,0 +1,161 @@
+"""
+Guild Task Queue - Priority-ordered ready queue for claimable tasks
+"""
+
+import heapq
+import itertools
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+
+class ReadyQueue:
+    """
+    Heap of ready task IDs ordered by a scheduling-policy sort key.
+
+    Keys are opaque comparable tuples computed once at push time (see
+    ``task_scheduling``); ties fall back to insertion order.
+
+    Entries are removed lazily: each task has at most one live entry tracked
+    in ``_entries`` and stale heap entries are skipped when popping, so push,
+    pop and discard are all O(log n).
+    """
+
+    def __init__(self):
+        self._heap: List[list] = []
+        self._entries: Dict[str, list] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._entries
+
+    def push(self, task_id: str, key: Tuple) -> None:
+        """Add a task, replacing any existing entry for the same ID"""
+        self.discard(task_id)
+        entry = [key, next(self._counter), task_id, True]
+        self._entries[task_id] = entry
+        heapq.heappush(self._heap, entry)
+
+    def discard(self, task_id: str) -> None:
+        """Remove a task if present"""
+        entry = self._entries.pop(task_id, None)
+        if entry is None:
+            return
+        entry[-1] = False
+
+        # Rebuild once stale entries dominate the heap
+        if len(self._heap) > 64 and len(self._heap) > 2 * len(self._entries):
+            self._heap = [item for item in self._heap if item[-1]]
+            heapq.heapify(self._heap)
+
+    def peek(self) -> Optional[str]:
+        """Return the highest-priority task ID without removing it"""
+        while self._heap and not self._heap[0][-1]:
+            heapq.heappop(self._heap)
+        return self._heap[0][2] if self._heap else None
+
+    def peek_key(self) -> Optional[list]:
+        """Return the ordering key of the head entry, if any"""
+        while self._heap and not self._heap[0][-1]:
+            heapq.heappop(self._heap)
+        return self._heap[0][:2] if self._heap else None
+
+    def pop(self) -> Optional[str]:
+        """Remove and return the highest-priority task ID"""
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            if entry[-1]:
+                del self._entries[entry[2]]
+                return entry[2]
+        return None
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._entries.clear()
+
+
+class PartitionedReadyQueue:
+    """
+    Ready tasks partitioned by their required-capability set.
+
+    Each distinct ``capabilities_required`` set gets its own ``ReadyQueue``.
+    A claim only looks at partitions whose key is a subset of the agent's
+    capabilities and merges their heads, so the cost is O(P + log n) for P
+    eligible partitions instead of a scan of every ready task. Eligible
+    partition lists are cached per agent capability set.
+    """
+
+    def __init__(self):
+        self._partitions: Dict[FrozenSet[str], ReadyQueue] = {}
+        self._task_partition: Dict[str, FrozenSet[str]] = {}
+        self._eligible_cache: Dict[FrozenSet[str], List[FrozenSet[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._task_partition)
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._task_partition
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._task_partition))
+
+    def push(self, task_id: str, key: Tuple, capabilities: Iterable[str] = ()) -> None:
+        partition = frozenset(capabilities)
+        current = self._task_partition.get(task_id)
+        if current is not None and current != partition:
+            self._partitions[current].discard(task_id)
+
+        queue = self._partitions.get(partition)
+        if queue is None:
+            queue = self._partitions[partition] = ReadyQueue()
+            self._eligible_cache.clear()
+
+        queue.push(task_id, key)
+        self._task_partition[task_id] = partition
+
+    def discard(self, task_id: str) -> None:
+        key = self._task_partition.pop(task_id, None)
+        if key is not None:
+            self._partitions[key].discard(task_id)
+
+    def pop(self, capabilities: Optional[Iterable[str]] = None) -> Optional[str]:
+        """
+        Remove and return the best task the capabilities can satisfy.
+
+        ``None`` means no capability filter (every partition is eligible).
+        """
+        best_key = None
+        best_partition = None
+        for partition in self._eligible(capabilities):
+            head = self._partitions[partition].peek_key()
+            if head is not None and (best_key is None or head < best_key):
+                best_key, best_partition = head, partition
+
+        if best_partition is None:
+            return None
+        task_id = self._partitions[best_partition].pop()
+        del self._task_partition[task_id]
+        return task_id
+
+    def partition_sizes(self) -> Dict[str, int]:
+        return {
+            ",".join(sorted(key)) or "*": len(queue)
+            for key, queue in self._partitions.items()
+            if len(queue)
+        }
+
+    def clear(self) -> None:
+        self._partitions.clear()
+        self._task_partition.clear()
+        self._eligible_cache.clear()
+
+    def _eligible(self, capabilities: Optional[Iterable[str]]) -> List[FrozenSet[str]]:
+        if capabilities is None:
+            return list(self._partitions)
+        agent_key = frozenset(capabilities)
+        eligible = self._eligible_cache.get(agent_key)
+        if eligible is None:
+            eligible = [key for key in self._partitions if key <= agent_key]
+            self._eligible_cache[agent_key] = eligible
+        return eligible
@@ -0,0 +1,839 @@
+"""
+Guild Task Sharding - TaskDirector shards in worker processes
+"""
+
+import asyncio
+import bisect
+import dataclasses
+import hashlib
+import inspect
+import itertools
+import multiprocessing
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+
+from .communication_hub import CommunicationChannel
+from .schema import TaskPriority, TaskStatus
+from .task_director import Task, TaskDirector, validate_task_spec
+
+_NOTIFIED_STATUSES = {status.value for status in TaskStatus}
+_TERMINAL_STATUSES = {
+    TaskStatus.DONE.value,
+    TaskStatus.FAILED.value,
+    TaskStatus.CANCELLED.value,
+}
+# Inbound hub events about one task, handed to the shard that owns it
+_FORWARDED_EVENTS = {
+    "task.approval_updated",
+    "task.priority_changed",
+    "task.dependency_added",
+}
+
+
+class ShardRing:
+    """
+    Consistent hash ring mapping keys to shard indexes.
+
+    Each shard owns ``replicas`` points on the ring so keys spread evenly,
+    and changing the shard count only moves the keys between neighbouring
+    points instead of reshuffling everything.
+    """
+
+    def __init__(self, shards: int, replicas: int = 64):
+        points = []
+        for shard in range(shards):
+            for replica in range(replicas):
+                points.append((self._hash(f"shard-{shard}-{replica}"), shard))
+        points.sort()
+        self._hashes = [point for point, _ in points]
+        self._shards = [shard for _, shard in points]
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+    def shard_for(self, key: str) -> int:
+        index = bisect.bisect(self._hashes, self._hash(key)) % len(self._hashes)
+        return self._shards[index]
+
+
+def shard_config(config, index: int):
+    """Per-shard copy of the Guild config with its own board and state"""
+    shard_dir = Path(config.artifact_dir) / "shards" / f"shard-{index:02d}"
+    return dataclasses.replace(
+        config,
+        task_board_path=str(shard_dir / "ACTIVE_TASKS.md"),
+        artifact_dir=str(shard_dir),
+        task_shards=1,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Worker process side
+# ---------------------------------------------------------------------------
+
+
+class _ShardEventLink:
+    """Stands in for the CommunicationHub inside a shard; events go to the router"""
+
+    def __init__(self, worker: "_ShardWorker"):
+        self._worker = worker
+
+    async def emit_event(self, event_type, data, channel=None, priority=None, target=None):
+        self._worker.send(("event", event_type, data, channel, priority))
+
+    def subscribe(self, channel, handler) -> None:
+        pass
+
+
+class _ShardAgentDirectory:
+    """Capabilities as forwarded by the router with each claim"""
+
+    def __init__(self):
+        self.capabilities: Dict[str, List[str]] = {}
+
+    async def get_agent_capabilities(self, agent_id: str) -> List[str]:
+        return self.capabilities.get(agent_id, [])
+
+
+class _ShardApprovals:
+    """The router's approval store, reached over the pipe"""
+
+    def __init__(self, worker: "_ShardWorker"):
+        self._worker = worker
+
+    async def get_for_task(self, task_id: str, gate: str):
+        approval = await self._worker.call("approval_get", task_id, gate)
+        return SimpleNamespace(**approval) if approval else None
+
+    async def request(self, task_id, gate, requested_by, targets, metadata):
+        approval = await self._worker.call(
+            "approval_request", task_id, gate, requested_by, targets, metadata
+        )
+        return SimpleNamespace(**approval)
+
+
+class _ShardCore:
+    def __init__(self, config, worker: "_ShardWorker", approvals: bool):
+        self.config = config
+        # Approval gates are resolved by the router's hub; no DB access here
+        self.hub = SimpleNamespace(approvals=_ShardApprovals(worker)) if approvals else None
+        self.communication_hub = _ShardEventLink(worker)
+        self.agent_coordinator = _ShardAgentDirectory()
+
+
+class _ShardWorker:
+    """
+    Runs one TaskDirector and serves router requests over a pipe.
+
+    Requests are ``(request_id, op, args)``; a request_id of None marks a
+    notification that gets no reply. Calls the other way (approval lookups)
+    go out as ``("call", call_id, op, args)`` and come back as
+    ``call_result`` notifications. Every outgoing message carries the
+    shard's ready-queue size so the router can skip empty shards.
+    """
+
+    READY_REPORT_INTERVAL = 1.0  # seconds
+
+    def __init__(self, index: int, config, conn, approvals: bool = False):
+        self.index = index
+        self.conn = conn
+        self.core = _ShardCore(config, self, approvals)
+        self.director = TaskDirector(config, self.core)
+        self._last_ready = -1
+        self._call_ids = itertools.count()
+        self._calls: Dict[int, asyncio.Future] = {}
+
+    def send(self, message: Tuple) -> None:
+        ready = self.director.get_ready_count()
+        self._last_ready = ready
+        self.conn.send(message + (ready,))
+
+    async def call(self, op: str, *args) -> Any:
+        """Ask the router to run ``op`` and wait for its answer"""
+        call_id = next(self._call_ids)
+        future = asyncio.get_running_loop().create_future()
+        self._calls[call_id] = future
+        try:
+            self.send(("call", call_id, op, args))
+            return await future
+        finally:
+            self._calls.pop(call_id, None)
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        inbox: asyncio.Queue = asyncio.Queue()
+
+        def read() -> None:
+            while True:
+                try:
+                    message = self.conn.recv()
+                except (EOFError, OSError):
+                    message = (None, "stop", ())
+                loop.call_soon_threadsafe(inbox.put_nowait, message)
+                if message[1] == "stop":
+                    return
+
+        await self.director.start()
+        self.director.enable_remote_dependencies()
+        threading.Thread(target=read, name=f"shard-{self.index}-reader", daemon=True).start()
+        reporter = asyncio.create_task(self._report_ready())
+        self.send(("started", self.index))
+
+        pending = set()
+        while True:
+            request_id, op, args = await inbox.get()
+            if op == "stop":
+                break
+            handler = asyncio.create_task(self._handle(request_id, op, args))
+            pending.add(handler)
+            handler.add_done_callback(pending.discard)
+
+        reporter.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        await self.director.stop()
+        if request_id is not None:
+            self.send(("reply", request_id, True, None))
+
+    async def _report_ready(self) -> None:
+        """Publish ready-queue changes that happened without a request"""
+        while True:
+            await asyncio.sleep(self.READY_REPORT_INTERVAL)
+            if self.director.get_ready_count() != self._last_ready:
+                self.send(("ready",))
+
+    async def _handle(self, request_id, op: str, args: Tuple) -> None:
+        try:
+            value = await getattr(self, f"_op_{op}")(*args)
+            ok = True
+        except Exception as e:
+            logger.error(f"Task shard {self.index} failed {op}: {e}")
+            value, ok = str(e), False
+        if request_id is None:
+            if op == "remote_statuses":
+                self.send(("ready",))
+        else:
+            self.send(("reply", request_id, ok, value))
+
+    async def _op_call_result(self, call_id: int, ok: bool, value: Any) -> None:
+        future = self._calls.get(call_id)
+        if future is None or future.done():
+            return
+        if ok:
+            future.set_result(value)
+        else:
+            future.set_exception(RuntimeError(f"router: {value}"))
+
+    async def _op_ping(self) -> int:
+        return self.index
+
+    async def _op_create(self, specs: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, List[str]]:
+        """Create pre-allocated tasks; returns dependencies owned elsewhere"""
+        external: Dict[str, List[str]] = {}
+        task_ids = [task_id for task_id, _ in specs]
+        await self.director.create_tasks([spec for _, spec in specs], task_ids=task_ids)
+        for task_id in task_ids:
+            deps = self.director.external_dependencies(task_id)
+            if deps:
+                external[task_id] = deps
+        return external
+
+    async def _op_claim(
+        self, agent_id: str, task_id: Optional[str], capabilities: List[str]
+    ) -> Optional[Dict[str, Any]]:
+        self.core.agent_coordinator.capabilities[agent_id] = capabilities
+        return await self.director.claim_task(agent_id, task_id)
+
+    async def _op_claim_many(
+        self, agent_id: str, count: int, capabilities: List[str]
+    ) -> List[Dict[str, Any]]:
+        self.core.agent_coordinator.capabilities[agent_id] = capabilities
+        return await self.director.claim_tasks(agent_id, count)
+
+    async def _op_complete(self, task_id: str, agent_id: str, result: Dict[str, Any]) -> bool:
+        return await self.director.complete_task(task_id, agent_id, result)
+
+    async def _op_get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        task = await self.director.get_task(task_id)
+        return task.to_dict() if task else None
+
+    async def _op_list(
+        self, status: Optional[TaskStatus], include_archived: bool
+    ) -> List[Dict[str, Any]]:
+        tasks = await self.director.list_tasks(status, include_archived)
+        return [task.to_dict() for task in tasks]
+
+    async def _op_query(self, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return [task.to_dict() for task in await self.director.query(**filters)]
+
+    async def _op_set_status(
+        self,
+        task_id: str,
+        status: TaskStatus,
+        metadata: Optional[Dict[str, Any]],
+        assignee: Optional[str],
+    ) -> bool:
+        return await self.director.set_task_status(task_id, status, metadata, assignee)
+
+    async def _op_start_execution(self, task_id: str, agent_id: str) -> bool:
+        return await self.director.start_execution(task_id, agent_id)
+
+    async def _op_count_by_status(self) -> Dict[TaskStatus, int]:
+        return await self.director.count_by_status()
+
+    async def _op_has(self, task_id: str) -> bool:
+        return await self.director.get_task(task_id) is not None
+
+    async def _op_statuses(self, task_ids: List[str]) -> Dict[str, str]:
+        statuses = {}
+        for task_id in task_ids:
+            task = await self.director.get_task(task_id)
+            if task is not None:
+                statuses[task_id] = task.status.value
+        return statuses
+
+    async def _op_task_event(self, event_type: str, data: Dict[str, Any]) -> None:
+        await self.director._handle_task_event(
+            SimpleNamespace(event_type=event_type, payload=data)
+        )
+
+    async def _op_remote_statuses(self, statuses: Dict[str, str]) -> None:
+        await self.director.apply_remote_statuses(statuses)
+
+    async def _op_reserve_ids(self, count: int) -> List[str]:
+        return self.director.reserve_task_ids(count)
+
+    async def _op_active_count(self) -> int:
+        return await self.director.get_active_count()
+
+    async def _op_health(self) -> Dict[str, Any]:
+        return await self.director.get_health()
+
+
+def _shard_main(index: int, config, conn, approvals: bool = False) -> None:
+    """Worker process entry point"""
+    try:
+        asyncio.run(_ShardWorker(index, config, conn, approvals).run())
+    except KeyboardInterrupt:
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Router side
+# ---------------------------------------------------------------------------
+
+
+class _ShardHandle:
+    """Parent-side endpoint for one shard process"""
+
+    def __init__(self, index: int, process, conn, router: "ShardedTaskRouter"):
+        self.index = index
+        self.process = process
+        self.conn = conn
+        self.ready = 0
+        self._router = router
+        self._ids = itertools.count()
+        self._futures: Dict[int, asyncio.Future] = {}
+        self._started: Optional[asyncio.Future] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def start_reader(self, loop: asyncio.AbstractEventLoop) -> asyncio.Future:
+        self._loop = loop
+        self._started = loop.create_future()
+        threading.Thread(
+            target=self._read, name=f"shard-{self.index}-router", daemon=True
+        ).start()
+        return self._started
+
+    def _read(self) -> None:
+        while True:
+            try:
+                message = self.conn.recv()
+            except (EOFError, OSError):
+                message = None
+            try:
+                if message is None:
+                    self._loop.call_soon_threadsafe(self._closed)
+                    return
+                self._loop.call_soon_threadsafe(self._dispatch, message)
+            except RuntimeError:
+                return  # Event loop already closed
+
+    def _dispatch(self, message: Tuple) -> None:
+        kind = message[0]
+        self.ready = message[-1]
+        if kind == "reply":
+            _, request_id, ok, value, _ready = message
+            future = self._futures.pop(request_id, None)
+            if future is not None and not future.done():
+                if ok:
+                    future.set_result(value)
+                else:
+                    future.set_exception(RuntimeError(f"shard {self.index}: {value}"))
+        elif kind == "event":
+            _, event_type, data, channel, priority, _ready = message
+            self._router._on_shard_event(self.index, event_type, data, channel, priority)
+        elif kind == "call":
+            _, call_id, op, args, _ready = message
+            asyncio.ensure_future(self._router._serve_call(self, call_id, op, args))
+        elif kind == "started" and not self._started.done():
+            self._started.set_result(self.index)
+
+    def _closed(self) -> None:
+        error = ConnectionError(f"Task shard {self.index} exited")
+        for future in self._futures.values():
+            if not future.done():
+                future.set_exception(error)
+        self._futures.clear()
+        if self._started is not None and not self._started.done():
+            self._started.set_exception(error)
+
+    def request(self, op: str, *args) -> asyncio.Future:
+        request_id = next(self._ids)
+        future = self._loop.create_future()
+        self._futures[request_id] = future
+        self.conn.send((request_id, op, args))
+        return future
+
+    def notify(self, op: str, *args) -> None:
+        self.conn.send((None, op, args))
+
+
+class ShardedTaskRouter:
+    """
+    Routes task operations to TaskDirector shards in worker processes.
+
+    Tasks are partitioned by a consistent hash of their ID (or of
+    ``metadata["domain"]`` when ``task_shard_key`` is "domain"), and every
+    shard owns its own board, journal and archive under
+    ``<artifact_dir>/shards``. IDs are handed out in blocks by shard 0 so
+    they stay unique across shards. When a task changes status the router
+    pushes the new status to the other shards, which is how dependents on a
+    different shard unblock; tasks created against an existing remote
+    dependency get its current status on creation. Approval gates are
+    answered by the hub's approval store through the router, and approval,
+    priority and dependency events on the hub are forwarded to the owning
+    shard.
+
+    Claims without a task ID try the agent's home shard first and then the
+    others, skipping shards that last reported an empty ready queue.
+    """
+
+    ID_BLOCK = 256
+
+    def __init__(self, config, guild_core):
+        self.config = config
+        self.guild_core = guild_core
+        self.shard_count = max(1, config.task_shards)
+        self.shard_key = config.task_shard_key
+        self._ring = ShardRing(self.shard_count)
+        self._shards: List[_ShardHandle] = []
+        self._running = False
+
+        # Domain-keyed shards cannot be derived from the ID alone
+        self._locations: Dict[str, int] = {}
+        self._id_pool: List[str] = []
+
+        # Status changes batched per target shard until the next loop turn
+        self._outbox: Dict[int, Dict[str, str]] = {}
+        self._flush_scheduled = False
+
+    async def start(self) -> None:
+        if self._running:
+            return
+        loop = asyncio.get_running_loop()
+        context = multiprocessing.get_context("spawn")
+        hub = self.guild_core.hub
+        approvals = bool(hub and getattr(hub, "approvals", None))
+        started = []
+        for index in range(self.shard_count):
+            parent_conn, child_conn = context.Pipe()
+            process = context.Process(
+                target=_shard_main,
+                args=(index, shard_config(self.config, index), child_conn, approvals),
+                name=f"guild-task-shard-{index}",
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            handle = _ShardHandle(index, process, parent_conn, self)
+            started.append(handle.start_reader(loop))
+            self._shards.append(handle)
+        await asyncio.gather(*started)
+        self._running = True
+        self.guild_core.communication_hub.subscribe(
+            CommunicationChannel.TASK_UPDATES, self._forward_task_event
+        )
+        logger.info(f"Task router started {self.shard_count} shards (key: {self.shard_key})")
+
+    async def stop(self) -> None:
+        if not self._running:
+            return
+        self._running = False
+        unsubscribe = getattr(self.guild_core.communication_hub, "unsubscribe", None)
+        if unsubscribe:
+            unsubscribe(CommunicationChannel.TASK_UPDATES, self._forward_task_event)
+        self._flush_notifications()
+        results = await asyncio.gather(
+            *(shard.request("stop") for shard in self._shards), return_exceptions=True
+        )
+        for shard, result in zip(self._shards, results):
+            if isinstance(result, Exception):
+                logger.error(f"Task shard {shard.index} did not stop cleanly: {result}")
+        loop = asyncio.get_running_loop()
+        for shard in self._shards:
+            await loop.run_in_executor(None, shard.process.join, 10)
+            if shard.process.is_alive():
+                shard.process.terminate()
+            shard.conn.close()
+        self._shards = []
+        logger.info("Task router stopped")
+
+    # Routing
+
+    def _shard_for(self, task_id: str, metadata: Optional[Dict[str, Any]] = None) -> int:
+        if self.shard_key == "domain":
+            domain = (metadata or {}).get("domain")
+            index = self._ring.shard_for(str(domain) if domain else task_id)
+            self._locations[task_id] = index
+            return index
+        return self._ring.shard_for(task_id)
+
+    async def _locate(self, task_id: str) -> Optional[_ShardHandle]:
+        if self.shard_key != "domain":
+            return self._shards[self._ring.shard_for(task_id)]
+        if task_id not in self._locations:
+            # Unknown here (e.g. created before a restart); ask every shard
+            found = await asyncio.gather(*(s.request("has", task_id) for s in self._shards))
+            for shard, has in zip(self._shards, found):
+                if has:
+                    self._locations[task_id] = shard.index
+                    break
+            else:
+                return None
+        return self._shards[self._locations[task_id]]
+
+    def _claim_order(self, agent_id: str) -> Iterable[_ShardHandle]:
+        home = self._ring.shard_for(agent_id)
+        for offset in range(self.shard_count):
+            shard = self._shards[(home + offset) % self.shard_count]
+            if shard.ready > 0:
+                yield shard
+
+    async def _allocate_ids(self, count: int) -> List[str]:
+        while len(self._id_pool) < count:
+            self._id_pool.extend(
+                await self._shards[0].request("reserve_ids", max(count, self.ID_BLOCK))
+            )
+        task_ids, self._id_pool = self._id_pool[:count], self._id_pool[count:]
+        return task_ids
+
+    async def _agent_capabilities(self, agent_id: str) -> List[str]:
+        try:
+            return await self.guild_core.agent_coordinator.get_agent_capabilities(agent_id)
+        except Exception:
+            return []
+
+    async def _serve_call(self, shard: _ShardHandle, call_id: int, op: str, args: Tuple) -> None:
+        """Answer a shard's approval lookup or request from the hub's store"""
+        try:
+            approvals = self.guild_core.hub.approvals
+            if op == "approval_get":
+                approval = approvals.get_for_task(*args)
+                if inspect.isawaitable(approval):
+                    approval = await approval
+            elif op == "approval_request":
+                task_id, gate, requested_by, targets, metadata = args
+                approval = await approvals.request(
+                    task_id=task_id,
+                    gate=gate,
+                    requested_by=requested_by,
+                    targets=targets,
+                    metadata=metadata,
+                )
+            else:
+                raise ValueError(f"unknown call {op}")
+            value = None
+            if approval is not None:
+                value = {
+                    "status": approval.status,
+                    "approval_id": approval.approval_id,
+                    "targets": list(approval.targets or []),
+                }
+            ok = True
+        except Exception as e:
+            logger.error(f"Failed to serve {op} for task shard {shard.index}: {e}")
+            value, ok = str(e), False
+        try:
+            shard.notify("call_result", call_id, ok, value)
+        except OSError:
+            pass  # shard already gone
+
+    async def _forward_task_event(self, message) -> None:
+        """Deliver approval decisions and other task events to the owning shard"""
+        if message.event_type not in _FORWARDED_EVENTS or not self._running:
+            return
+        data = message.payload if isinstance(message.payload, dict) else {}
+        task_id = data.get("task_id")
+        if not task_id:
+            return
+        try:
+            shard = await self._locate(task_id)
+            if shard is not None:
+                shard.notify("task_event", message.event_type, data)
+                dependency = data.get("dependency")
+                if message.event_type == "task.dependency_added" and dependency:
+                    # Sent after the edge, so the shard already waits on it
+                    await self._resolve_external(shard.index, {task_id: [dependency]})
+        except Exception as e:
+            logger.error(f"Failed to forward {message.event_type} for {task_id}: {e}")
+
+    # Cross-shard status propagation
+
+    def _on_shard_event(self, index: int, event_type: str, data, channel, priority) -> None:
+        if isinstance(data, dict) and self.shard_count > 1:
+            statuses: Dict[str, Any] = {}
+            task_id = data.get("task_id")
+            if event_type == "task.completed" and task_id:
+                statuses[task_id] = TaskStatus.DONE.value
+            elif event_type == "task.status_changed" and task_id:
+                statuses[task_id] = data.get("new_status")
+            elif event_type == "task.cascade_cancelled":
+                # One event for the whole cascade; each ID was cancelled
+                for cancelled_id in data.get("task_ids") or ():
+                    statuses[cancelled_id] = TaskStatus.CANCELLED.value
+            statuses = {
+                key: status for key, status in statuses.items() if status in _NOTIFIED_STATUSES
+            }
+            if statuses:
+                for shard in self._shards:
+                    if shard.index != index:
+                        self._outbox.setdefault(shard.index, {}).update(statuses)
+                self._schedule_flush()
+        asyncio.ensure_future(
+            self.guild_core.communication_hub.emit_event(event_type, data, channel, priority)
+        )
+
+    def _schedule_flush(self) -> None:
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush_notifications)
+
+    def _flush_notifications(self) -> None:
+        self._flush_scheduled = False
+        outbox, self._outbox = self._outbox, {}
+        for index, statuses in outbox.items():
+            if index < len(self._shards):
+                self._shards[index].notify("remote_statuses", statuses)
+
+    async def _resolve_external(self, index: int, external: Dict[str, List[str]]) -> None:
+        """Seed a shard with the current status of remote dependencies"""
+        owners: Dict[int, List[str]] = {}
+        for dep_ids in external.values():
+            for dep_id in dep_ids:
+                owner = await self._locate(dep_id)
+                if owner is not None and owner.index != index:
+                    owners.setdefault(owner.index, []).append(dep_id)
+        if not owners:
+            return
+        replies = await asyncio.gather(
+            *(self._shards[owner].request("statuses", ids) for owner, ids in owners.items())
+        )
+        # Only settled states: a live status could be older than a change
+        # notification already queued for this shard
+        statuses = {
+            dep_id: status
+            for reply in replies
+            for dep_id, status in reply.items()
+            if status in _TERMINAL_STATUSES
+        }
+        if statuses:
+            self._shards[index].notify("remote_statuses", statuses)
+
+    # Task operations
+
+    async def create_task(
+        self,
+        title: str,
+        description: str,
+        priority: TaskPriority = TaskPriority.MEDIUM,
+        dependencies: Optional[List[str]] = None,
+        capabilities_required: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Create a task on the shard that owns it"""
+        task_ids = await self.create_tasks(
+            [
+                {
+                    "title": title,
+                    "description": description,
+                    "priority": priority,
+                    "dependencies": dependencies,
+                    "capabilities_required": capabilities_required,
+                    "metadata": metadata,
+                }
+            ]
+        )
+        return task_ids[0]
+
+    async def create_tasks(self, tasks: List[Dict[str, Any]]) -> List[str]:
+        """Create tasks in bulk; one request per shard"""
+        if not tasks:
+            return []
+        for spec in tasks:
+            validate_task_spec(spec)
+        task_ids = await self._allocate_ids(len(tasks))
+        by_shard: Dict[int, List[Tuple[str, Dict[str, Any]]]] = {}
+        for task_id, spec in zip(task_ids, tasks):
+            index = self._shard_for(task_id, spec.get("metadata"))
+            by_shard.setdefault(index, []).append((task_id, spec))
+
+        indexes = list(by_shard)
+        replies = await asyncio.gather(
+            *(self._shards[index].request("create", by_shard[index]) for index in indexes)
+        )
+        await asyncio.gather(
+            *(
+                self._resolve_external(index, external)
+                for index, external in zip(indexes, replies)
+                if external
+            )
+        )
+        return task_ids
+
+    async def claim_task(
+        self, agent_id: str, task_id: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Claim a specific task, or the next one from any shard"""
+        try:
+            capabilities = await self._agent_capabilities(agent_id)
+            if task_id:
+                shard = await self._locate(task_id)
+                if shard is None:
+                    return None
+                return await shard.request("claim", agent_id, task_id, capabilities)
+            for shard in self._claim_order(agent_id):
+                task = await shard.request("claim", agent_id, None, capabilities)
+                if task:
+                    return task
+            return None
+        except Exception as e:
+            logger.error(f"Failed to route claim for {agent_id}: {e}")
+            return None
+
+    async def claim_tasks(self, agent_id: str, count: int) -> List[Dict[str, Any]]:
+        claimed: List[Dict[str, Any]] = []
+        try:
+            capabilities = await self._agent_capabilities(agent_id)
+            for shard in self._claim_order(agent_id):
+                claimed.extend(
+                    await shard.request(
+                        "claim_many", agent_id, count - len(claimed), capabilities
+                    )
+                )
+                if len(claimed) >= count:
+                    break
+        except Exception as e:
+            logger.error(f"Failed to route claims for {agent_id}: {e}")
+        return claimed
+
+    async def complete_task(
+        self, task_id: str, agent_id: str, result: Dict[str, Any]
+    ) -> bool:
+        try:
+            shard = await self._locate(task_id)
+            if shard is None:
+                return False
+            return await shard.request("complete", task_id, agent_id, result)
+        except Exception as e:
+            logger.error(f"Failed to route completion of {task_id}: {e}")
+            return False
+
+    async def get_task(self, task_id: str) -> Optional[Task]:
+        """Get a task from its shard; always a detached copy"""
+        shard = await self._locate(task_id)
+        if shard is None:
+            return None
+        data = await shard.request("get", task_id)
+        return Task.from_dict(data) if data else None
+
+    async def list_tasks(
+        self, status: Optional[TaskStatus] = None, include_archived: bool = False
+    ) -> List[Task]:
+        replies = await asyncio.gather(
+            *(s.request("list", status, include_archived) for s in self._shards)
+        )
+        return [Task.from_dict(data) for reply in replies for data in reply]
+
+    async def query(self, **filters: Any) -> List[Task]:
+        """Run ``TaskDirector.query`` on every shard and merge by task ID"""
+        replies = await asyncio.gather(*(s.request("query", filters) for s in self._shards))
+        tasks = [Task.from_dict(data) for reply in replies for data in reply]
+        tasks.sort(key=lambda task: task.id)
+        return tasks
+
+    async def set_task_status(
+        self,
+        task_id: str,
+        status: TaskStatus,
+        metadata: Optional[Dict[str, Any]] = None,
+        assignee: Optional[str] = None,
+    ) -> bool:
+        try:
+            shard = await self._locate(task_id)
+            if shard is None:
+                return False
+            return await shard.request("set_status", task_id, status, metadata, assignee)
+        except Exception as e:
+            logger.error(f"Failed to route status update of {task_id}: {e}")
+            return False
+
+    async def start_execution(self, task_id: str, agent_id: str) -> bool:
+        try:
+            shard = await self._locate(task_id)
+            if shard is None:
+                return False
+            return await shard.request("start_execution", task_id, agent_id)
+        except Exception as e:
+            logger.error(f"Failed to route execution start of {task_id}: {e}")
+            return False
+
+    async def count_by_status(self) -> Dict[TaskStatus, int]:
+        replies = await asyncio.gather(*(s.request("count_by_status") for s in self._shards))
+        totals = {status: 0 for status in TaskStatus}
+        for counts in replies:
+            for status, count in counts.items():
+                totals[status] += count
+        return totals
+
+    async def get_active_count(self) -> int:
+        counts = await asyncio.gather(*(s.request("active_count") for s in self._shards))
+        return sum(counts)
+
+    async def get_health(self) -> Dict[str, Any]:
+        shards = await asyncio.gather(
+            *(s.request("health") for s in self._shards), return_exceptions=True
+        )
+        by_status: Dict[str, int] = {}
+        for health in shards:
+            if isinstance(health, dict):
+                for status, count in health.get("by_status", {}).items():
+                    by_status[status] = by_status.get(status, 0) + count
+        return {
+            "status": "healthy" if self._running else "stopped",
+            "sharded": True,
+            "shard_count": self.shard_count,
+            "shard_key": self.shard_key,
+            "total_tasks": sum(h.get("total_tasks", 0) for h in shards if isinstance(h, dict)),
+            "by_status": by_status,
+            "ready_hints": [shard.ready for shard in self._shards],
+            "shards": [
+                h if isinstance(h, dict) else {"status": "unreachable", "error": str(h)}
+                for h in shards
+            ],
+        }